@@ -1,15 +1,21 @@
 # -*- coding: utf-8 -*-
 import argparse
-import base64
-import itertools
 import json
+import functools
+import mimetypes
 import os
-import random
+import queue
+import re
+import stat
 import sys
 import threading
 import time
 import platform
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
 
 try:
     import webview
@@ -17,6 +23,13 @@ except Exception as _e:
     webview = None
     _WEBVIEW_IMPORT_ERROR = _e
 
+# 拖放事件处理器随 webview 一并在冷启动时导入，避免 on_start 回调
+# （用户可见的启动窗口期）再付一次冷导入成本
+try:
+    from webview.dom import DOMEventHandler as _DOMEventHandler
+except Exception:
+    _DOMEventHandler = None
+
 from pathlib import Path
 from services.config_manager import ConfigManager
 from services.core_logic import CoreService
@@ -38,6 +51,87 @@ WEB_DIR = BASE_DIR / "web"
 
 log = get_logger(__name__)
 
+# evaluate_js 载荷序列化：优先走 orjson 的 C 实现（大字符串/列表编码快 3-10 倍），
+# 未安装时退回标准库 json
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
+
+# 编码探测：charset-normalizer 可用时单次探测+单次解码，免去逐编码试错
+try:
+    from charset_normalizer import from_bytes as _detect_charset
+except ImportError:
+    _detect_charset = None
+
+
+# 日志消息开头的自定义级别标签（[SUCCESS] / [WARN] 等），预编译一次，
+# 热日志路径上不再走 re 内部缓存查找
+_LEVEL_TAG_RE = re.compile(r"^\s*\[(SUCCESS|WARN|ERROR|INFO|SYS)]")
+
+# 封面扩展名 → MIME 子类型映射，省去每个条目一次 splitext+lower+replace
+_IMG_MIME = {".jpg": "jpeg", ".jpeg": "jpeg", ".png": "png", ".webp": "webp", ".gif": "gif"}
+
+
+# 高频 JS 片段模板：常量部分只构造一次，调用时仅做 % 插值，
+# 免去每次调用重新拼 f-string 的常量部分
+_JS_LOADING_UPDATE = "if(window.MinimalistLoading) MinimalistLoading.update(%d, %s)"
+_JS_APPEND_LOG_BATCH = "if(window.app && app.appendLogBatch) app.appendLogBatch(%s)"
+_JS_TOAST_BATCH = "if(window.app && app.notifyToastBatch) app.notifyToastBatch(%s)"
+_JS_PASSWORD_MODAL = "app.openArchivePasswordModal(%s, %s)"
+
+# 拖放路径用到的常量 JS 片段，模组载入时定义一次
+_JS_HIDE_DROP_OVERLAY = "if(window.app && app.hideDropOverlay) app.hideDropOverlay()"
+_JS_ACTIVE_PAGE = "(document.querySelector('.page.active')||{}).id || ''"
+_JS_CAMO_RES_VIEW = (
+    "(document.querySelector('#page-camo .resource-nav-item.active')||{})"
+    ".dataset.target || 'skins'"
+)
+
+# 固定结语的加载条 JS 片段：消息在模组载入时一次性 JSON 编码，
+# 进度回调热路径上免去每次的编码与格式化
+_JS_LOADING_DONE = {
+    msg: _JS_LOADING_UPDATE % (100, _dumps(msg))
+    for msg in (
+        "导入完成", "导入失败",
+        "涂装导入完成", "涂装导入失败",
+        "炮镜导入完成", "炮镜导入失败",
+        "安装完成", "安装失败",
+    )
+}
+
+
+def _fast_rmtree(path):
+    # 基于 os.scandir 的递归删除：DirEntry 自带类型信息，免去
+    # shutil.rmtree 对每个条目的额外 stat；只读文件去掉只读位后重试
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except PermissionError:
+                    os.chmod(entry.path, stat.S_IWRITE)
+                    os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _safe_stat(path):
+    # 一次 os.stat 同时回答"存在吗"和"多大"，失败返回 None（网络盘上每次 stat 都是系统调用）
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
 def _show_fatal_error(title: str, message: str) -> None:
     """显示致命错误（尽量用系统对话框，失败则退回 stderr）。"""
@@ -162,12 +256,15 @@ class AppApi:
 
     def __init__(self, *, perf_enabled: bool = False):
         # 初始化桥接层的状态、各业务管理器与日志系统。
-        self._lock = threading.Lock()
-
         self._logger = setup_logger()
 
         self._perf_enabled = bool(perf_enabled)
 
+        # 自由线程构建（PEP 703）下记录 GIL 状态，便于排查并发行为差异
+        gil_probe = getattr(sys, "_is_gil_enabled", None)
+        if gil_probe is not None and not gil_probe():
+            log.debug("检测到自由线程解释器（GIL 已停用）")
+
         # 保存 PyWebview Window 引用（用于调用 evaluate_js 与打开系统对话框）
 
         # 连接 logger -> 前端 UI（窗口未创建时会自动忽略）
@@ -177,6 +274,29 @@ class AppApi:
         # 加下划线表示私有变量，pywebview 就不会尝试去扫描和序列化整个窗口对象，
         # 从而避免了 "window.native... maximum recursion depth" 错误。
         self._window = None
+        self._core_ready_getter = None
+        self._js_push = None
+
+        # UI 日志批量队列：日志回调只入列，由唯一的刷写线程凑批推送，
+        # 避免每条日志各付一次 evaluate_js 桥接往返
+        self._ui_log_queue = queue.Queue()
+        self._start_ui_log_flusher()
+
+        # 前端日志限速状态（最近一秒的推送时间戳 + 被抑制的行数）
+        self._log_budget = deque()
+        self._log_suppressed = 0
+
+        # 进度回调节流状态（上次推送时刻与百分比）
+        self._last_ui_ts = 0.0
+        self._last_ui_pct = -1
+
+        # 长寿命任务通道：窗口轻操作与重 I/O 各一条单线程队列，免去每次
+        # 任务的线程创建开销（Windows 上尤其贵），同通道任务天然串行
+        self._ui_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-task")
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="io-task")
+        # 文件对话框专用通道：create_file_dialog 会阻塞到用户关闭对话框，
+        # 放到独立线程让 JS 调用立即返回，避免冻结前端事件循环
+        self._dialog_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dialog")
 
         # 管理器实例：配置、语音包库、涂装、炮镜、游戏目录操作
         # 注意：所有管理器现在统一使用 logger.py 的日誌系统
@@ -194,6 +314,29 @@ class AppApi:
         self._sights_mgr = SightsManager()
         self._logic = CoreService()
 
+        # 本地封面服务：前端以 <img src="http://127.0.0.1:PORT/cover/..."> 懒加载，
+        # 列表接口不再内联 base64 封面
+        self._cover_server = None
+        self._cover_port = self._start_cover_server()
+
+        # 语音包列表缓存：以库目录及一级子目录的 mtime 为签名，未变化时直接复用
+        self._lib_cache = {"sig": None, "data": None}
+
+        # 主题元信息缓存：文件名 -> (mtime_ns, 大小, 下拉框条目)
+        self._theme_cache = {}
+
+        # 前端回报的当前活动页（拖放路由直接用，免去 DOM 反查）
+        self._active_page = "page-home"
+
+        # 游戏路径校验缓存：(路径, 时刻, 结果)。同一路径 2 秒内的重复
+        # 校验直接复用结果——前端页面打开时会连发多个都要先验路径的 API
+        self._gp_cache = (None, 0.0, None)
+
+        # 预先解析的受信根目录（带尾分隔符）：路径边界校验用 startswith
+        # 前缀比对取代 os.path.commonpath 的逐级拆分比较。
+        # 语音包库根目录可经 save_library_dir 在运行时变更，须每次现算
+        self._themes_root = str((WEB_DIR / "themes").resolve()) + os.sep
+
         # 初始化遥测系统
         if self._cfg_mgr.get_telemetry_enabled():
             tm = init_telemetry(APP_VERSION)
@@ -201,12 +344,14 @@ class AppApi:
             tm.set_user_command_callback(self.on_user_command)
             tm.set_log_callback(self._logger)
 
-        self._search_running = False
-        self._is_busy = False
-        self._password_event = threading.Event()
-        self._password_lock = threading.Lock()
-        self._password_value = None
-        self._password_cancelled = False
+        # 搜索互斥：与 _busy_lock 同款的非阻塞 acquire 原子占用，
+        # 自由线程构建（PEP 703）下同样成立
+        self._search_lock = threading.Lock()
+        # 忙碌互斥：非阻塞 acquire 把"检查并占用"合成一步原子操作，
+        # locked() 供只读探测；取代旧的 _is_busy 先查后设竞态
+        self._busy_lock = threading.Lock()
+        # 密码握手：单槽队列，一次原子 put/get 取代 Event+Lock+双重检查
+        self._password_q = queue.Queue(maxsize=1)
 
         # 遥测消息去重
         self._last_alert_content = None  # 紧急通知 (弹窗)
@@ -222,7 +367,7 @@ class AppApi:
 
         def safe_js_call(func_name, *args):
             # 将参数序列化为 JSON 字符串，确保特殊字符（引号、换行）被正确转义
-            js_args = ", ".join([json.dumps(arg, ensure_ascii=False) for arg in args])
+            js_args = ", ".join([_dumps(arg) for arg in args])
             return f"if(window.app && app.{func_name}) app.{func_name}({js_args})"
 
         try:
@@ -233,7 +378,7 @@ class AppApi:
 
             if is_maint and (self._last_maintenance_status != maint_key):
                 self._logger.warning(f"[SYS] ⚠️ 维护模式已开启: {maint_msg}")
-                self._window.evaluate_js(safe_js_call("showWarnToast", "维护模式已开启", maint_msg, 8000))
+                self._push_js(safe_js_call("showWarnToast", "维护模式已开启", maint_msg, 8000))
 
             self._last_maintenance_status = maint_key
 
@@ -245,14 +390,14 @@ class AppApi:
 
                 if content and (self._last_alert_content != full_alert_key):
                     self._logger.info(f"[通知] {title}")
-                    self._window.evaluate_js(safe_js_call("showAlert", title, content, "info"))
+                    self._push_js(safe_js_call("showAlert", title, content, "info"))
                     self._last_alert_content = full_alert_key
 
             # 3. 公告栏常驻内容 (Notice - 发现有效内容则覆盖首页公告)
             if config.get("notice_active"):
                 notice_content = config.get("notice_content", "")
                 if notice_content and (self._last_notice_content != notice_content):
-                    self._window.evaluate_js(safe_js_call("updateNoticeBar", notice_content))
+                    self._push_js(safe_js_call("updateNoticeBar", notice_content))
                     self._last_notice_content = notice_content
 
             # 4. 更新提示 (内容变化时才提示)
@@ -263,7 +408,7 @@ class AppApi:
                 update_key = f"{content}|{update_url}"
                 if content and (self._last_update_content != update_key):
                     self._logger.info(f"[更新] {content}")
-                    self._window.evaluate_js(safe_js_call("showAlert", "发现新版本", content, "success", update_url))
+                    self._push_js(safe_js_call("showAlert", "发现新版本", content, "success", update_url))
                     self._last_update_content = update_key
 
         except Exception as e:
@@ -282,15 +427,15 @@ class AppApi:
 
             # 序列化辅助
             def safe_js_call(func_name, *args):
-                js_args = ", ".join([json.dumps(arg, ensure_ascii=False) for arg in args])
+                js_args = ", ".join([_dumps(arg) for arg in args])
                 return f"if(window.app && app.{func_name}) app.{func_name}({js_args})"
 
             if cmd_type == "popup":
                 self._logger.info("[CMD] 收到系统通知")
-                self._window.evaluate_js(safe_js_call("showAlert", "系统通知", msg, "info"))
+                self._push_js(safe_js_call("showAlert", "系统通知", msg, "info"))
             elif cmd_type == "toast":
                 self._logger.info(f"[CMD] 收到管理员信息: {msg}")
-                self._window.evaluate_js(safe_js_call("showWarnToast", "管理员消息", msg, 5000))
+                self._push_js(safe_js_call("showWarnToast", "管理员消息", msg, 5000))
 
         except Exception as e:
             print(f"专用指令解析异常: {e}")
@@ -299,51 +444,97 @@ class AppApi:
         # 绑定 PyWebview Window 实例到桥接层，供后续 API 调用使用。
         self._window = window
 
+        # 单向推送通道：run_js（pywebview 5+）只执行脚本、不等待返回值的
+        # 序列化往返；老版本退回 evaluate_js
+        self._js_push = getattr(window, "run_js", None) or window.evaluate_js
+
+        # 预解析 WebView2 内核就绪探针：三层 getattr 只在绑定时走一次，
+        # close_window 每次只调用缓存好的探针
+        self._core_ready_getter = None
+        try:
+            inner = getattr(window, "_window", None)
+            webview_ctrl = getattr(inner, "webview", None)
+            if webview_ctrl is not None and hasattr(webview_ctrl, "CoreWebView2"):
+                self._core_ready_getter = (
+                    lambda: getattr(webview_ctrl, "CoreWebView2", None) is not None
+                )
+        except Exception:
+            self._core_ready_getter = lambda: False
+
     def _load_json_with_fallback(self, file_path):
-        # 按编码回退策略读取 JSON 文件并解析为 Python 对象。
-        encodings = ["utf-8-sig", "utf-8", "cp950", "big5", "gbk"]
-        for enc in encodings:
+        # 读取 JSON 文件并解析为 Python 对象：只读盘一次，UTF-8 直通为
+        # 快路径（本项目写出的文件恒为 UTF-8），解码失败才做编码探测
+        # 或轮询遗留编码，JSON 本身只解析一次。
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None
+
+        if raw.startswith(b"\xef\xbb\xbf"):
+            raw = raw[3:]
+
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+
+        if text is None and _detect_charset is not None:
             try:
-                with open(file_path, "r", encoding=enc) as f:
-                    return json.load(f)
+                best = _detect_charset(raw[:4096]).best()
+                if best and best.encoding:
+                    text = raw.decode(best.encoding, errors="replace")
             except Exception:
-                continue
-        return None
+                text = None
+
+        if text is None:
+            for enc in ("cp950", "big5", "gbk"):
+                try:
+                    text = raw.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                return None
+
+        try:
+            return _loads(text)
+        except ValueError:
+            return None
 
     def _append_log_to_ui(self, formatted_message: str, record):
         """
-        将 logger 的输出追加到前端日志面板。
+        将 logger 的输出排入批量队列（纯入列，不做 JS 桥接调用）。
         record: logging.LogRecord (从 logger.py 传入)
         """
         if not self._window:
             return
 
-        # 1. 追加日志到面板
-        try:
-            safe_msg = formatted_message.replace("\r", "").replace("\n", "<br>")
-            msg_js = json.dumps(safe_msg, ensure_ascii=True)
-            self._window.evaluate_js(f"if(window.app && app.appendLog) app.appendLog({msg_js})")
-        except Exception:
-            # 避免在日志回调中抛异常导致业务中断
-            log.exception("日志推送失败")
+        safe_msg = formatted_message.replace("\r", "").replace("\n", "<br>")
 
-        # 2. 处理 Toast 通知
+        # 处理 Toast 通知
         # 我们可以根据 record.message 或 record.levelname 判断是否弹窗。
         # 以前的逻辑是：如果 levelKey in (WARN, ERROR, SUCCESS) 则弹窗。
         # 这里我们需要从 message 探测 [SUCCESS] 这种自定义标签，因为 standard logging 只有 INFO/WARN/ERROR。
-
+        toast_level = None
+        msg_plain = ""
         try:
             level_key = record.levelname  # INFO, WARNING, ERROR, DEBUG
             msg_content = record.getMessage()
+            if not isinstance(msg_content, str):
+                msg_content = str(msg_content)
 
             # 兼容：从消息内容解析 [SUCCESS] / [WARN] / [ERROR] 等标签
-            # 如果消息里显式写了 [SUCCESS]，我们认为它是 SUCCESS 级别
-            import re
-            match = re.search(r"^\s*\[(SUCCESS|WARN|ERROR|INFO|SYS)]", msg_content)
-            custom_tag = match.group(1) if match else None
-
-            # 映射到前端 Toast 类型
-            toast_level = None
+            # 如果消息里显式写了 [SUCCESS]，我们认为它是 SUCCESS 级别。
+            # 多数日志不带标签，先用 '[' in 短路掉正则匹配
+            custom_tag = None
+            if "[" in msg_content:
+                match = _LEVEL_TAG_RE.search(msg_content)
+                custom_tag = match.group(1) if match else None
+
+            # SYS 级诊断只在性能模式下推送前端，文件日志不受影响
+            if custom_tag == "SYS" and not self._perf_enabled:
+                return
 
             if custom_tag == "SUCCESS":
                 toast_level = "SUCCESS"
@@ -356,20 +547,145 @@ class AppApi:
             elif level_key == "ERROR":
                 toast_level = "ERROR"
 
-            # 如果有对应的 Toast 级别，则推送
             if toast_level:
                 # 去除换行
                 msg_plain = msg_content.replace("\r", " ").replace("\n", " ")
-                # 去除可能的标签前缀 (可选，保留也无妨，前端只是显示文本)
-                # msg_plain = re.sub(r"^\s*\[(SUCCESS|WARN|ERROR|INFO|SYS)\]\s*", "", msg_plain)
+        except Exception:
+            pass
 
-                msg_plain_js = json.dumps(msg_plain, ensure_ascii=True)
-                level_js = json.dumps(toast_level, ensure_ascii=True)
-                self._window.evaluate_js(
-                    f"if(window.app && app.notifyToast) app.notifyToast({level_js}, {msg_plain_js})")
+        # 令牌桶限速：前端面板每秒最多收 200 行，超出的只计数，
+        # 恢复后补一条汇总。日志文件侧不限速（由 logger 管线独立写入）
+        now = time.monotonic()
+        budget = self._log_budget
+        while budget and now - budget[0] > 1.0:
+            budget.popleft()
+        if len(budget) >= 200:
+            self._log_suppressed += 1
+            return
+        if self._log_suppressed:
+            self._ui_log_queue.put(
+                (f"[SYS] 日志过密，已抑制 {self._log_suppressed} 行", None, "")
+            )
+            self._log_suppressed = 0
+        budget.append(now)
+
+        self._ui_log_queue.put((safe_msg, toast_level, msg_plain))
+
+    def _start_ui_log_flusher(self):
+        # 唯一的 UI 日志刷写线程：取到首条后等一个凑批窗口，把期间积压的
+        # 记录合併成一次 appendLogBatch/notifyToastBatch 调用
+        def _flush_loop():
+            while True:
+                batch = [self._ui_log_queue.get()]
+                time.sleep(0.03)
+                while True:
+                    try:
+                        batch.append(self._ui_log_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                self._flush_ui_log_batch(batch)
+
+        t = threading.Thread(target=_flush_loop, name="ui-log-flush", daemon=True)
+        t.start()
 
+    def _flush_ui_log_batch(self, batch):
+        # 把一批日志合併为最多两次 evaluate_js：一次面板追加、一次 Toast
+        if not self._window:
+            return
+        try:
+            logs = [html for html, _, _ in batch]
+            toasts = [[lvl, plain] for _, lvl, plain in batch if lvl]
+            logs_js = json.dumps(logs, ensure_ascii=True)
+            self._push_js(
+                _JS_APPEND_LOG_BATCH % logs_js
+            )
+            if toasts:
+                toasts_js = json.dumps(toasts, ensure_ascii=True)
+                self._push_js(
+                    _JS_TOAST_BATCH % toasts_js
+                )
         except Exception:
-            pass
+            # 避免在日志回调中抛异常导致业务中断
+            log.exception("日志推送失败")
+
+    def _push_js(self, script):
+        # 发射即忘的 JS 调用统一走这里：不需要返回值的推送不付 eval 往返的钱
+        push = self._js_push
+        if push is not None:
+            push(script)
+
+    def _resolve_cover_path(self, mod_name):
+        # 封面路径选择：优先使用语音包提供的封面，否则使用默认封面。
+        # 名称来自本地 HTTP 请求，拒绝路径穿越（与 /skincover/ 同一守卫），
+        # 否则 get_mod_details 会在库外目录上触发读取甚至重命名副作用
+        mod_name = str(mod_name or "")
+        cover_path = None
+        if mod_name and "/" not in mod_name and "\\" not in mod_name and ".." not in mod_name:
+            try:
+                details = self._lib_mgr.get_mod_details(mod_name)
+                cover_path = details.get("cover_path")
+            except Exception:
+                pass
+        if not cover_path or _safe_stat(cover_path) is None:
+            cover_path = str(WEB_DIR / "assets" / "card_image.png")
+        return cover_path
+
+    def _resolve_skin_cover_path(self, skin_name):
+        # 涂装封面路径选择：优先涂装目录内的预览图，否则使用默认封面
+        skin_name = str(skin_name or "")
+        if skin_name and "/" not in skin_name and "\\" not in skin_name and ".." not in skin_name:
+            try:
+                game_path = self._cfg_mgr.get_game_path()
+                skin_dir = self._skins_mgr.get_userskins_dir(game_path) / skin_name
+                preview = self._skins_mgr._find_preview_image(skin_dir)
+                if preview is not None:
+                    return str(preview)
+            except Exception:
+                pass
+        return str(WEB_DIR / "assets" / "card_image_small.png")
+
+    def _start_cover_server(self):
+        # 在 127.0.0.1 的随机端口上起一个只读封面服务，失败时返回 None
+        api = self
+
+        class _CoverHandler(BaseHTTPRequestHandler):
+            def log_message(self, fmt, *args):
+                # 不向 stderr 刷访问日志
+                pass
+
+            def do_GET(self):
+                if self.path.startswith("/cover/"):
+                    mod = unquote(self.path[len("/cover/"):])
+                    file_path = api._resolve_cover_path(mod)
+                elif self.path.startswith("/skincover/"):
+                    skin = unquote(self.path[len("/skincover/"):])
+                    file_path = api._resolve_skin_cover_path(skin)
+                else:
+                    self.send_error(404)
+                    return
+                try:
+                    with open(file_path, "rb") as f:
+                        data = f.read()
+                except OSError:
+                    self.send_error(404)
+                    return
+                ctype = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+                self.send_response(200)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                # 封面可能被用户替换，短缓存即可避免重复请求
+                self.send_header("Cache-Control", "max-age=60")
+                self.end_headers()
+                self.wfile.write(data)
+
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", 0), _CoverHandler)
+        except OSError as e:
+            log.warning(f"封面服务启动失败，回退为内联封面: {e}")
+            return None
+        threading.Thread(target=server.serve_forever, name="cover-http", daemon=True).start()
+        self._cover_server = server
+        return server.server_address[1]
 
     # --- 窗口控制 ---
     def toggle_topmost(self, is_top):
@@ -380,9 +696,7 @@ class AppApi:
                 except Exception as e:
                     log.error(f"置顶设置失败: {e}")
 
-        t = threading.Thread(target=_update_topmost)
-        t.daemon = True
-        t.start()
+        self._ui_pool.submit(_update_topmost)
         return True
 
     def drag_window(self):
@@ -400,17 +714,8 @@ class AppApi:
         if not self._window:
             return
 
-        core_ready = True
-        try:
-            inner = getattr(self._window, "_window", None)
-            webview_ctrl = getattr(inner, "webview", None)
-            if webview_ctrl is not None and hasattr(webview_ctrl, "CoreWebView2"):
-                if getattr(webview_ctrl, "CoreWebView2", None) is None:
-                    core_ready = False
-        except Exception:
-            core_ready = False
-
-        if not core_ready:
+        # 内核未就绪时 destroy() 会卡死，直接硬退出
+        if self._core_ready_getter is not None and not self._core_ready_getter():
             os._exit(0)
 
         self._window.destroy()
@@ -425,7 +730,7 @@ class AppApi:
         # 验证路径
         is_valid = False
         if path:
-            is_valid, _ = self._logic.validate_game_path(path)
+            is_valid, _ = self._validate_game_path(path)
             if is_valid:
                 log.info(f"[INIT] 已加载配置路径: {path}")
             else:
@@ -494,8 +799,8 @@ class AppApi:
         # 打开目录选择对话框，获取用户选择的游戏根目录并进行校验与保存。
         folder = self._window.create_file_dialog(webview.FileDialog.FOLDER)
         if folder and len(folder) > 0:
-            path = folder[0].replace(os.sep, "/")
-            valid, msg = self._logic.validate_game_path(path)
+            path = Path(folder[0]).as_posix()
+            valid, msg = self._validate_game_path(path)
             if valid:
                 self._cfg_mgr.set_game_path(path)
                 log.info(f"[SUCCESS] 手动加载路径: {path}")
@@ -523,102 +828,103 @@ class AppApi:
 
     def start_auto_search(self):
         # 在后台线程执行游戏目录自动搜索，并将结果写入配置后通知前端更新显示。
-        if self._search_running:
+        # 非阻塞 acquire 原子判定“是否已在搜索”：在自由线程构建
+        # （PEP 703）下依然是单次原子操作，没有检查与置位之间的窗口
+        if not self._search_lock.acquire(blocking=False):
             return
-        self._search_running = True
 
         def _run():
-            log.debug("检索引擎初始化...")
-            time.sleep(0.3)
-
-            # 执行路径搜索
-            found_path = self._logic.auto_detect_game_path()
-
-            # 通过节流减少前端更新频率
-            spinner = itertools.cycle(["|", "/", "—", "\\"])
-            progress = 0
-            update_interval = 0.15  # 每150ms更新一次UI
-            last_update = time.time()
-
-            while progress < 100:
-                step = random.randint(3, 8)
-                if 30 < progress < 50:
-                    time.sleep(random.uniform(0.15, 0.25))
-                    step = random.randint(8, 15)
-                elif 80 < progress < 90:
-                    time.sleep(random.uniform(0.25, 0.45))
-                    step = 2
+            try:
+                log.debug("检索引擎初始化...")
+
+                # 转圈动画完全由前端 setInterval 驱动，搜索期间 Python 侧
+                # 不再做任何进度相关的桥接调用
+                self._push_js("app.startSearchSpinner()")
+
+                # 执行路径搜索
+                found_path = self._logic.auto_detect_game_path()
+
+                self._push_js(f"app.stopSearchSpinner({json.dumps(bool(found_path))})")
+                if found_path:
+                    self._cfg_mgr.set_game_path(found_path)
+                    self._validate_game_path(found_path)
+                    log.info("[SUCCESS] 自动搜索成功，路径已保存。")
+
+                    # 通知前端更新 UI
+                    path_js = _dumps(Path(found_path).as_posix())
+                    self._push_js(f"app.onSearchSuccess({path_js})")
                 else:
-                    time.sleep(0.08)
-
-                progress += step
-                if progress > 100:
-                    progress = 100
-
-                # 只在达到更新间隔或完成时推送一次进度文本
-                current_time = time.time()
-                if current_time - last_update >= update_interval or progress >= 100:
-                    char = next(spinner)
-                    msg_js = json.dumps(
-                        f"[扫描] 正在检索存储设备... [{char}] {progress}%",
-                        ensure_ascii=False,
-                    )
-                    self._window.evaluate_js(f"app.updateSearchLog({msg_js})")
-                    last_update = current_time
-
-            time.sleep(0.3)
-            if found_path:
-                self._cfg_mgr.set_game_path(found_path)
-                self._logic.validate_game_path(found_path)
-                log.info("[SUCCESS] 自动搜索成功，路径已保存。")
-
-                # 通知前端更新 UI
-                path_js = json.dumps(found_path.replace(os.sep, "/"), ensure_ascii=False)
-                self._window.evaluate_js(f"app.onSearchSuccess({path_js})")
-            else:
-                log.error("深度扫描未发现游戏客户端。")
-                self._window.evaluate_js("app.onSearchFail()")
-            self._search_running = False
+                    log.error("深度扫描未发现游戏客户端。")
+                    self._push_js("app.onSearchFail()")
+            finally:
+                self._search_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._io_pool.submit(_run)
 
-    def get_library_list(self, opts=None):
-        # 扫描语音包库并返回每个语音包的详情列表，包含封面 data URL 以便前端直接渲染。
-        t0 = time.perf_counter() if self._perf_enabled else None
-        mods = self._lib_mgr.scan_library()
-        result = []
+    def _inline_cover_data_url(self, cover_path):
+        # 封面服务不可用时的回退：读取文件并转为 data URL
+        # （冷路径才需要 base64，延迟到这里导入以缩短启动）
+        import base64
 
-        # 默认封面路径（当语音包未提供封面或封面文件不存在时使用）
-        default_cover_path = WEB_DIR / "assets" / "card_image.png"
+        try:
+            ext = _IMG_MIME.get(Path(cover_path).suffix.lower(), "png")
+            raw = Path(cover_path).read_bytes()
+            # base64 输出必为 ASCII：在字节层拼好前缀后做一次 ascii 解码，
+            # 免去 UTF-8 解码器和一次中间拷贝
+            b64 = base64.b64encode(raw)
+            return (b"data:image/" + ext.encode("ascii") + b";base64," + b64).decode("ascii")
+        except Exception as e:
+            log.error(f"图片转码失败: {e}")
+            return ""
 
-        for mod in mods:
+    def _build_mod_entry(self, mod, details=None):
+        # 组装单个语音包的列表条目（详情 + 封面 URL + ID）
+        if details is None:
             details = self._lib_mgr.get_mod_details(mod)
 
-            # 1. 获取作者提供的封面路径
-            cover_path = details.get("cover_path")
-            details["cover_url"] = ""
+        # 封面：返回本地服务 URL，列表接口不再读盘/编码图片
+        if self._cover_port:
+            details["cover_url"] = f"http://127.0.0.1:{self._cover_port}/cover/{quote(mod)}"
+        else:
+            details["cover_url"] = self._inline_cover_data_url(self._resolve_cover_path(mod))
 
-            # 封面路径选择：优先使用语音包提供的封面，否则使用默认封面
-            if not cover_path or not os.path.exists(cover_path):
-                cover_path = str(default_cover_path)
+        # 补充 ID
+        details["id"] = mod
+        return details
 
-            # 封面图片读取并转为 data URL
-            if cover_path and os.path.exists(cover_path):
-                try:
-                    ext = os.path.splitext(cover_path)[1].lower().replace(".", "")
-                    if ext == "jpg":
-                        ext = "jpeg"
-                    with open(cover_path, "rb") as f:
-                        b64_data = base64.b64encode(f.read()).decode("utf-8")
-                        details["cover_url"] = f"data:image/{ext};base64,{b64_data}"
-                except Exception as e:
-                    log.error(f"图片转码失败: {e}")
+    def _library_signature(self):
+        # 库目录签名：目录自身或一级子目录的 mtime 变化即视为库有更新
+        try:
+            lib_dir = Path(self._lib_mgr.library_dir)
+            return (
+                lib_dir.stat().st_mtime_ns,
+                tuple(sorted((p.name, p.stat().st_mtime_ns) for p in lib_dir.iterdir())),
+            )
+        except OSError:
+            return None
 
-            # 补充 ID
-            details["id"] = mod
-            result.append(details)
+    def invalidate_library_cache(self):
+        # 导入/删除等写操作后调用，强制下次 get_library_list 重新扫描
+        self._lib_cache["sig"] = None
+        self._lib_cache["data"] = None
+
+    def get_library_list(self, opts=None):
+        # 扫描语音包库并返回每个语音包的详情列表；封面以本地 HTTP URL 交由前端懒加载。
+        t0 = time.perf_counter() if self._perf_enabled else None
+
+        # 前端可能反复刷新列表：签名未变化时直接返回缓存，避免整库重扫
+        sig = self._library_signature()
+        if sig is not None and sig == self._lib_cache["sig"]:
+            return self._lib_cache["data"]
+
+        # 批量装配：一次 scandir 顺序读完全部详情（缓存命中零额外系统
+        # 调用），这里只负责附上 ID 与封面 URL
+        result = [
+            self._build_mod_entry(mod, details)
+            for mod, details in self._lib_mgr.scan_library_details()
+        ]
+        self._lib_cache["sig"] = sig
+        self._lib_cache["data"] = result
         if self._perf_enabled and t0 is not None:
             dt_ms = (time.perf_counter() - t0) * 1000.0
             log.debug(f"[PERF] get_library_list {dt_ms:.1f}ms mods={len(result)}")
@@ -646,7 +952,7 @@ class AppApi:
                 log.warning("游戏路径无效或未设置")
         elif folder_type == "userskins":
             path = self._cfg_mgr.get_game_path()
-            valid, _ = self._logic.validate_game_path(path)
+            valid, _ = self._validate_game_path(path)
             if not valid:
                 log.warning("未设置有效游戏路径，无法打开 UserSkins")
                 return
@@ -696,56 +1002,80 @@ class AppApi:
                 safe_msg = str(message).replace("\r", " ").replace("\n", " ")
                 safe_progress = max(0, min(100, int(progress)))
                 msg_js = json.dumps(safe_msg, ensure_ascii=True)
-                self._window.evaluate_js(
-                    f"if(window.MinimalistLoading) MinimalistLoading.update({safe_progress}, {msg_js})"
+                self._push_js(
+                    _JS_LOADING_UPDATE % (safe_progress, msg_js)
                 )
             except Exception as e:
                 log.error(f"Loading UI 更新失败: {e}")
 
+    def _throttled_loading_ui(self, progress, message):
+        # 凑批进度回调：50ms 内且百分比变化不足 1 的更新直接丢弃，
+        # 100% 必推，保证收尾状态可见。传给逐文件解压/複製的回调统一用它
+        now = time.monotonic()
+        pct = int(progress)
+        if (
+            pct < 100
+            and (now - self._last_ui_ts) < 0.05
+            and abs(pct - self._last_ui_pct) < 1
+        ):
+            return
+        self._last_ui_ts = now
+        self._last_ui_pct = pct
+        self.update_loading_ui(progress, message)
+
+    def _validate_game_path(self, path):
+        # validate_game_path 每次要 stat 多个游戏文件；短 TTL 缓存把
+        # 前端连发调用的重复校验折叠成一次元组读取
+        now = time.monotonic()
+        cached_path, ts, result = self._gp_cache
+        if cached_path == path and result is not None and (now - ts) < 2.0:
+            return result
+        result = self._logic.validate_game_path(path)
+        self._gp_cache = (path, now, result)
+        return result
+
     def submit_archive_password(self, password):
         # 接收前端输入的压缩包密码，并唤醒等待中的解压线程。
-        with self._password_lock:
-            self._password_value = "" if password is None else str(password)
-            self._password_cancelled = False
-            self._password_event.set()
+        try:
+            self._password_q.put_nowait(("ok", "" if password is None else str(password)))
+        except queue.Full:
+            pass
         return True
 
     def cancel_archive_password(self):
         # 处理前端取消输入密码的动作，并唤醒等待中的解压线程。
-        with self._password_lock:
-            self._password_value = None
-            self._password_cancelled = True
-            self._password_event.set()
+        try:
+            self._password_q.put_nowait(("cancel", None))
+        except queue.Full:
+            pass
         return True
 
     def _request_archive_password(self, archive_name, error_hint=""):
         # 向前端弹出密码输入框，并阻塞等待用户输入或取消。
         if not self._window:
             return None
-        with self._password_lock:
-            self._password_event.clear()
-            self._password_value = None
-            self._password_cancelled = False
-        name_js = json.dumps(str(archive_name or ""), ensure_ascii=False)
-        err_js = json.dumps(str(error_hint or ""), ensure_ascii=False)
-        self._window.evaluate_js(f"app.openArchivePasswordModal({name_js}, {err_js})")
-        self._password_event.wait()
-        with self._password_lock:
-            if self._password_cancelled:
-                return None
-            return self._password_value
+        # 清掉上一轮残留的回应，确保 get 等到的是本轮输入
+        while True:
+            try:
+                self._password_q.get_nowait()
+            except queue.Empty:
+                break
+        name_js = _dumps(str(archive_name or ""))
+        err_js = _dumps(str(error_hint or ""))
+        self._push_js(_JS_PASSWORD_MODAL % (name_js, err_js))
+        kind, value = self._password_q.get()
+        return None if kind == "cancel" else value
 
     def import_zips(self):
         # 将待解压区中的压缩包批量导入到语音包库，并将进度同步到前端加载组件。
-        if self._is_busy:
+        if not self._busy_lock.acquire(blocking=False):
             log.warning("另一个任务正在进行中，请稍候...")
             return
-        self._is_busy = True
 
         # 显示加载组件（关闭自动模拟，由后端推送真实进度）
         if self._window:
-            msg_js = json.dumps("正在准备导入...", ensure_ascii=False)
-            self._window.evaluate_js(
+            msg_js = _dumps("正在准备导入...")
+            self._push_js(
                 f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
             )
             self.update_loading_ui(1, "开始扫描待解压区...")
@@ -757,40 +1087,32 @@ class AppApi:
                     return self._request_archive_password(Path(archive_path).name, hint)
 
                 self._lib_mgr.unzip_zips_to_library(
-                    progress_callback=self.update_loading_ui,
+                    progress_callback=self._throttled_loading_ui,
                     password_provider=password_provider,
                 )
 
-                # 完成后通知前端刷新列表
+                # 完成后失效列表缓存并通知前端刷新
+                self.invalidate_library_cache()
                 if self._window:
-                    self._window.evaluate_js("app.refreshLibrary()")
-                    msg_js = json.dumps("导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js("app.refreshLibrary();" + _JS_LOADING_DONE["导入完成"])
             except ArchivePasswordCanceled:
                 log.warning("已取消输入密码，导入已终止")
                 if self._window:
-                    self._window.evaluate_js(
+                    self._push_js(
                         "if(window.MinimalistLoading) MinimalistLoading.hide()"
                     )
             except Exception as e:
                 log.error(f"导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js(_JS_LOADING_DONE["导入失败"])
             finally:
-                self._is_busy = False
+                self._busy_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._io_pool.submit(_run)
 
     def import_selected_zip(self):
         # 打开文件选择对话框导入单个 ZIP/RAR 到语音包库，并将进度同步到前端加载组件。
-        if self._is_busy:
+        if self._busy_lock.locked():
             log.warning("另一个任务正在进行中，请稍候...")
             return
 
@@ -803,22 +1125,26 @@ class AppApi:
             "All files (*.*)"
         )
 
-        # 使用 OPEN 对话框模式进行单文件选择
-        result = self._window.create_file_dialog(
-            webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
-        )
+        # 对话框放到专用线程，JS 调用立即返回，不阻塞事件循环
+        def _ask_and_import():
+            # 使用 OPEN 对话框模式进行单文件选择
+            result = self._window.create_file_dialog(
+                webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
+            )
+
+            if not result or len(result) == 0:
+                return
 
-        if result and len(result) > 0:
             zip_path = result[0]
             # log.info(f"准备导入: {zip_path}")
-            self._is_busy = True
+            if not self._busy_lock.acquire(blocking=False):
+                log.warning("另一个任务正在进行中，请稍候...")
+                return
 
             # 显示加载条
             if self._window:
-                msg_js = json.dumps(
-                    f"准备导入: {Path(zip_path).name}", ensure_ascii=False
-                )
-                self._window.evaluate_js(
+                msg_js = _dumps(f"准备导入: {Path(zip_path).name}")
+                self._push_js(
                     f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
                 )
 
@@ -832,51 +1158,42 @@ class AppApi:
 
                     self._lib_mgr.unzip_single_zip(
                         Path(zip_path),
-                        progress_callback=self.update_loading_ui,
+                        progress_callback=self._throttled_loading_ui,
                         password_provider=password_provider,
                     )
 
-                    # 完成后通知前端刷新列表
+                    # 完成后失效列表缓存并通知前端刷新
+                    self.invalidate_library_cache()
                     if self._window:
-                        self._window.evaluate_js("app.refreshLibrary()")
-                        msg_js = json.dumps("导入完成", ensure_ascii=False)
-                        self._window.evaluate_js(
-                            f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                        )
+                        self._push_js("app.refreshLibrary();" + _JS_LOADING_DONE["导入完成"])
                 except ArchivePasswordCanceled:
                     log.warning("已取消输入密码，导入已终止")
                     if self._window:
-                        self._window.evaluate_js(
+                        self._push_js(
                             "if(window.MinimalistLoading) MinimalistLoading.hide()"
                         )
                 except Exception as e:
                     log.error(f"导入失败: {e}")
                     if self._window:
-                        msg_js = json.dumps("导入失败", ensure_ascii=False)
-                        self._window.evaluate_js(
-                            f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                        )
+                        self._push_js(_JS_LOADING_DONE["导入失败"])
                 finally:
-                    self._is_busy = False
+                    self._busy_lock.release()
 
-            t = threading.Thread(target=_run)
-            t.daemon = True
-            t.start()
-        else:
-            pass
+            self._io_pool.submit(_run)
+
+        self._dialog_pool.submit(_ask_and_import)
 
     def import_voice_zip_from_path(self, zip_path):
         """导入指定路径的压缩包"""
-        if self._is_busy:
+        if not self._busy_lock.acquire(blocking=False):
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
         zip_path = str(zip_path)
-        self._is_busy = True
 
         if self._window:
-            msg_js = json.dumps(f"准备导入: {Path(zip_path).name}", ensure_ascii=False)
-            self._window.evaluate_js(
+            msg_js = _dumps(f"准备导入: {Path(zip_path).name}")
+            self._push_js(
                 f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
             )
 
@@ -890,33 +1207,25 @@ class AppApi:
 
                 self._lib_mgr.unzip_single_zip(
                     Path(zip_path),
-                    progress_callback=self.update_loading_ui,
+                    progress_callback=self._throttled_loading_ui,
                     password_provider=password_provider,
                 )
 
+                self.invalidate_library_cache()
                 if self._window:
-                    self._window.evaluate_js("app.refreshLibrary()")
-                    msg_js = json.dumps("导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js("app.refreshLibrary();" + _JS_LOADING_DONE["导入完成"])
             except ArchivePasswordCanceled:
                 log.warning("已取消输入密码，导入已终止")
                 if self._window:
-                    self._window.evaluate_js("if(window.MinimalistLoading) MinimalistLoading.hide()")
+                    self._push_js("if(window.MinimalistLoading) MinimalistLoading.hide()")
             except Exception as e:
                 log.error(f"导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js(_JS_LOADING_DONE["导入失败"])
             finally:
-                self._is_busy = False
+                self._busy_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._io_pool.submit(_run)
         return True
 
     def refresh_skins_async(self, opts=None):
@@ -924,7 +1233,7 @@ class AppApi:
         先传回基本信息，再异步推送封面数据。
         """
         game_path = self._cfg_mgr.get_game_path()
-        valid, _ = self._logic.validate_game_path(game_path)
+        valid, _ = self._validate_game_path(game_path)
         if not valid:
             return False
 
@@ -940,34 +1249,38 @@ class AppApi:
                     force_refresh=force_refresh, skip_covers=True
                 )
                 data["valid"] = True
+                items = data.get("items", [])
+
+                # 封面走本地 HTTP 服务：列表推送自带 URL，浏览器按需懒加载，
+                # 后端不再为每张封面读文件 + base64 编码
+                if self._cover_port:
+                    for it in items:
+                        it["cover_url"] = (
+                            f"http://127.0.0.1:{self._cover_port}"
+                            f"/skincover/{quote(it.get('name', ''))}"
+                        )
+                        it["cover_is_default"] = not it.get("preview_path")
 
                 # 推送基本列表到前端，让界面先渲染出来
                 if self._window:
-                    js_data = json.dumps(data, ensure_ascii=False)
-                    self._window.evaluate_js(f"if(app.onSkinsListReady) app.onSkinsListReady({js_data})")
+                    js_data = _dumps(data)
+                    self._push_js(f"if(app.onSkinsListReady) app.onSkinsListReady({js_data})")
 
-                items = data.get("items", [])
-                for it in items:
-                    name = it.get("name")
-                    preview_path = it.get("preview_path")
-                    cover_url = ""
-
-                    if preview_path and Path(preview_path).exists():
-                        cover_url = self._skins_mgr._to_data_url(Path(preview_path))
-                    elif default_cover_path.exists():
-                        cover_url = self._skins_mgr._to_data_url(default_cover_path)
-
-                    if self._window and cover_url:
-                        # 单条推送，避免大数据包造成的卡顿
-                        name_js = json.dumps(name, ensure_ascii=False)
-                        url_js = json.dumps(cover_url, ensure_ascii=True)
-                        self._window.evaluate_js(f"if(app.onSkinCoverReady) app.onSkinCoverReady({name_js}, {url_js})")
+                # 回退路径（封面服务启动失败）不再整批推送 data URL：
+                # 前端对无 cover_url 的卡片在滚入视口时调用
+                # get_skin_cover 懒加载，未展示的涂装不做编码
             except Exception as e:
                 log.error(f"后台刷新涂装库失败: {e}")
 
-        threading.Thread(target=_worker, daemon=True).start()
+        self._io_pool.submit(_worker)
         return True
 
+    def get_skin_cover(self, skin_name):
+        """封面服务不可用时的回退：前端按可见行懒加载单张封面。"""
+        game_path = self._cfg_mgr.get_game_path()
+        default_cover_path = WEB_DIR / "assets" / "card_image_small.png"
+        return self._skins_mgr.get_cover(game_path, skin_name, default_cover_path)
+
     def get_skins_list(self, opts=None):
         # 保留原接口供兼容，但实际上前端将改用 refresh_skins_async
         path = self._cfg_mgr.get_game_path()
@@ -978,78 +1291,73 @@ class AppApi:
         return data
 
     def import_skin_zip_dialog(self):
-        if self._is_busy:
+        if self._busy_lock.locked():
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
         path = self._cfg_mgr.get_game_path()
-        valid, msg = self._logic.validate_game_path(path)
+        valid, msg = self._validate_game_path(path)
         if not valid:
             log.error(f"未设置有效游戏路径: {msg}")
             return False
 
         file_types = ("Zip Files (*.zip)", "All files (*.*)")
-        result = self._window.create_file_dialog(
-            webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
-        )
-        if not result or len(result) == 0:
-            return False
 
-        zip_path = result[0]
-        self.import_skin_zip_from_path(zip_path)
+        # 对话框放到专用线程，JS 调用立即返回，不阻塞事件循环
+        def _ask_and_import():
+            result = self._window.create_file_dialog(
+                webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
+            )
+            if result and len(result) > 0:
+                self.import_skin_zip_from_path(result[0])
+
+        self._dialog_pool.submit(_ask_and_import)
         return True
 
     def import_skin_zip_from_path(self, zip_path):
-        if self._is_busy:
+        if self._busy_lock.locked():
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
         path = self._cfg_mgr.get_game_path()
-        valid, msg = self._logic.validate_game_path(path)
+        valid, msg = self._validate_game_path(path)
         if not valid:
             log.error(f"未设置有效游戏路径: {msg}")
             return False
 
         zip_path = str(zip_path)
-        self._is_busy = True
+        if not self._busy_lock.acquire(blocking=False):
+            log.warning("另一个任务正在进行中，请稍候...")
+            return False
 
         if self._window:
-            msg_js = json.dumps(f"涂装解压: {Path(zip_path).name}", ensure_ascii=False)
-            self._window.evaluate_js(
+            msg_js = _dumps(f"涂装解压: {Path(zip_path).name}")
+            self._push_js(
                 f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
             )
 
         def _run():
             try:
                 self._skins_mgr.import_skin_zip(
-                    zip_path, path, progress_callback=self.update_loading_ui
+                    zip_path, path, progress_callback=self._throttled_loading_ui
                 )
                 if self._window:
-                    self._window.evaluate_js("if(app.refreshSkins) app.refreshSkins()")
-                    msg_js = json.dumps("涂装导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js("if(app.refreshSkins) app.refreshSkins();" + _JS_LOADING_DONE["涂装导入完成"])
             except FileExistsError as e:
                 log.warning(f"{e}")
                 if self._window:
-                    msg_js = json.dumps(str(e), ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                    msg_js = _dumps(str(e))
+                    self._push_js(
+                        _JS_LOADING_UPDATE % (100, msg_js)
                     )
             except Exception as e:
                 log.error(f"涂装导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("涂装导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js(_JS_LOADING_DONE["涂装导入失败"])
             finally:
-                self._is_busy = False
+                self._busy_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._io_pool.submit(_run)
         return True
 
     def rename_skin(self, old_name, new_name):
@@ -1063,7 +1371,7 @@ class AppApi:
 
     def update_skin_cover(self, skin_name):
         # 打开图片选择对话框并将所选图片设置为涂装封面（preview.png）。
-        if self._is_busy:
+        if self._busy_lock.locked():
             return {"success": False, "msg": "系统繁忙"}
 
         file_types = ("Image Files (*.jpg;*.jpeg;*.png;*.webp)", "All files (*.*)")
@@ -1083,7 +1391,7 @@ class AppApi:
 
     def update_skin_cover_data(self, skin_name, data_url):
         # 将前端传入的 base64 图片数据写入为涂装封面 preview.png。
-        if self._is_busy:
+        if self._busy_lock.locked():
             return {"success": False, "msg": "系统繁忙"}
 
         path = self._cfg_mgr.get_game_path()
@@ -1098,73 +1406,57 @@ class AppApi:
         # install_list 可能以 JSON 字符串形式传入
         if isinstance(install_list, str):
             try:
-                install_list = json.loads(install_list)
-            except json.JSONDecodeError:
+                # orjson 可用时走 C 解析器（见模组顶部的 _loads 回退）
+                install_list = _loads(install_list)
+            except ValueError:
                 log.error(f"解析安装列表失败: {install_list}")
                 return False
 
-        # 使用线程锁与状态位限制并发任务
-        with self._lock:
-            if self._is_busy:
-                log.warning("另一个任务正在进行中，请稍候...")
-                return False
-            self._is_busy = True
+        # 非阻塞 acquire 原子限制并发任务
+        if not self._busy_lock.acquire(blocking=False):
+            log.warning("另一个任务正在进行中，请稍候...")
+            return False
 
         path = self._cfg_mgr.get_game_path()
-        valid, _ = self._logic.validate_game_path(path)
+        valid, _ = self._validate_game_path(path)
         if not valid:
             log.error("安装失败：未设置有效游戏路径")
-            with self._lock:
-                self._is_busy = False
+            self._busy_lock.release()
             return False
 
-        # 记录当前语音包标识，供前端在列表中标记已生效项
-        self._cfg_mgr.set_current_mod(mod_name)
-
         def _run():
             try:
                 mod_path = self._lib_mgr.library_dir / mod_name
                 self._logic.install_from_library(
-                    mod_path, install_list, progress_callback=self.update_loading_ui
+                    mod_path, install_list, progress_callback=self._throttled_loading_ui
                 )
 
+                # 安装成功后再记录当前语音包标识（batch 合併本流程的配置
+                # 变更，只落盘一次），失败时不会留下错误的已生效状态
+                with self._cfg_mgr.batch():
+                    self._cfg_mgr.set_current_mod(mod_name)
+
                 # 安装完成，通知前端
                 if self._window:
-                    self._window.evaluate_js(
-                        f"if(app.onInstallSuccess) app.onInstallSuccess('{mod_name}')"
-                    )
-                    msg_js = json.dumps("安装完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                    self._push_js(
+                        f"if(app.onInstallSuccess) app.onInstallSuccess('{mod_name}');"
+                        + _JS_LOADING_DONE["安装完成"]
                     )
             except Exception as e:
                 log.error(f"安装失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("安装失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js(_JS_LOADING_DONE["安装失败"])
             finally:
-                with self._lock:
-                    self._is_busy = False
+                self._busy_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._io_pool.submit(_run)
         return True
 
     def check_install_conflicts(self, mod_name, install_list):
         # 基于安装清单对本次安装可能写入的文件名进行冲突检查，并返回冲突明细列表。
-        try:
-            # install_list 可能以 JSON 字符串形式传入
-            if isinstance(install_list, str):
-                try:
-                    install_list = json.loads(install_list)
-                except json.JSONDecodeError:
-                    return []
-
+        def _gather():
             path = self._cfg_mgr.get_game_path()
-            valid, _ = self._logic.validate_game_path(path)
+            valid, _ = self._validate_game_path(path)
             if not valid:
                 return []
 
@@ -1173,50 +1465,69 @@ class AppApi:
             if not mod_path.exists():
                 return []
 
-            # install_list 现在是文件路径列表，直接提取文件名
-            files_to_install = []
-            for file_rel_path in install_list:
-                # 只提取文件名
-                file_name = Path(file_rel_path).name
-                files_to_install.append(file_name)
-
-            # 调用 manifest_mgr 进行冲突检测
+            # install_list 是文件路径列表，惰性提取文件名直接喂给冲突检测，
+            # 不再为全量文件名建一份中间列表
             if self._logic.manifest_mgr:
-                return self._logic.manifest_mgr.check_conflicts(mod_name, files_to_install)
+                files_iter = (Path(p).name for p in install_list)
+                return self._logic.manifest_mgr.check_conflicts(mod_name, files_iter)
             return []
+
+        try:
+            # install_list 可能以 JSON 字符串形式传入
+            if isinstance(install_list, str):
+                try:
+                    install_list = _loads(install_list)
+                except ValueError:
+                    return []
+
+            # 直接内联执行：这里只有一次 stat 加清单集合求交，毫秒级；
+            # 丢进单工人 _io_pool 会排在安装/导入等长任务后面，
+            # 反而把 JS 桥接线程卡住整个任务时长
+            return _gather()
         except Exception as e:
             log.warning(f"冲突检测失败: {e}")
             return []
 
     def delete_mod(self, mod_name):
         # 从语音包库目录中删除指定语音包文件夹。
-        if self._is_busy:
+        # 非阻塞 acquire 原子限制并发任务
+        if not self._busy_lock.acquire(blocking=False):
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
-        import shutil
-
-        try:
-            library_dir = Path(self._lib_mgr.library_dir).resolve()
-            target = (library_dir / str(mod_name)).resolve()
-            if os.path.commonpath([str(target), str(library_dir)]) != str(
-                    library_dir
-            ) or str(target) == str(library_dir):
-                raise Exception("非法路径")
-            shutil.rmtree(target)
-            log.info(f"已删除语音包: {mod_name}")
-            return True
-        except Exception as e:
-            log.error(f"删除失败: {e}")
+        # 库根目录可在运行时被 save_library_dir 变更，前缀须按当前值现算；
+        # 尾分隔符前缀比对同时排除了 target 等于库根目录本身的情况
+        library_root = str(Path(self._lib_mgr.library_dir).resolve()) + os.sep
+        target = (Path(self._lib_mgr.library_dir) / str(mod_name)).resolve()
+        if not str(target).startswith(library_root):
+            log.error("删除失败: 非法路径")
+            self._busy_lock.release()
             return False
 
+        def _run():
+            # 大语音包含上千个小文件，递归删除放到后台线程执行，
+            # 完成后再通知前端刷新列表
+            try:
+                _fast_rmtree(target)
+                self.invalidate_library_cache()
+                log.info(f"已删除语音包: {mod_name}")
+                if self._window:
+                    self._push_js("app.refreshLibrary()")
+            except Exception as e:
+                log.error(f"删除失败: {e}")
+            finally:
+                self._busy_lock.release()
+
+        self._io_pool.submit(_run)
+        return True
+
     def copy_country_files(self, mod_name, country_code, include_ground=True, include_radio=True):
         # 触发“复制国籍文件”流程：从语音包库中查找匹配文件并复制到游戏 sound/mod。
         try:
             if not mod_name:
                 return {"success": False, "msg": "语音包名称为空"}
             path = self._cfg_mgr.get_game_path()
-            valid, msg = self._logic.validate_game_path(path)
+            valid, msg = self._validate_game_path(path)
             if not valid:
                 return {"success": False, "msg": msg or "未设置有效游戏路径"}
             result = self._lib_mgr.copy_country_files(
@@ -1247,38 +1558,43 @@ class AppApi:
 
     def restore_game(self):
         # 触发游戏目录还原流程：清空 sound/mod 子项并关闭 enable_mod，同时清理当前语音包状态。
-        if self._is_busy:
+        if self._busy_lock.locked():
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
         path = self._cfg_mgr.get_game_path()
-        valid, msg = self._logic.validate_game_path(path)
+        valid, msg = self._validate_game_path(path)
         if not valid:
             log.error(f"还原失败: {msg}")
             return False
 
-        self._is_busy = True
+        if not self._busy_lock.acquire(blocking=False):
+            log.warning("另一个任务正在进行中，请稍候...")
+            return False
 
         def _run():
             try:
                 self._logic.restore_game()
 
-                # 还原成功，清除状态
-                self._cfg_mgr.set_current_mod("")
+                # 还原成功，清除状态（batch 合併本流程的配置变更，只落盘一次）
+                with self._cfg_mgr.batch():
+                    self._cfg_mgr.set_current_mod("")
                 if self._window:
-                    self._window.evaluate_js("app.onRestoreSuccess()")
+                    self._push_js("app.onRestoreSuccess()")
             finally:
-                self._is_busy = False
+                self._busy_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._io_pool.submit(_run)
         return True
 
     def clear_logs(self):
         # 接收前端“清空日志”动作，并输出一条日志用于记录该行为。
         log.info("日志已清空")
 
+    def notify_active_page(self, page_id):
+        # 前端切页时回报活动页 ID，供拖放等后端路径直接读取。
+        self._active_page = str(page_id or "")
+
     # --- 首次运行状态 API ---
     def check_first_run(self):
         # 判断前端是否需要展示首次运行协议弹窗。
@@ -1288,9 +1604,10 @@ class AppApi:
         return {"status": needs_agreement, "version": AGREEMENT_VERSION}
 
     def agree_to_terms(self, version):
-        # 记录用户已同意协议，并保存其同意的协议版本号。
-        self._cfg_mgr.set_is_first_run(False)
-        self._cfg_mgr.set_agreement_version(version)
+        # 记录用户已同意协议，并保存其同意的协议版本号（批量更新，只落盘一次）。
+        with self._cfg_mgr.batch():
+            self._cfg_mgr.set_is_first_run(False)
+            self._cfg_mgr.set_agreement_version(version)
         return True
 
     # --- 主题管理 API ---
@@ -1301,19 +1618,33 @@ class AppApi:
             return []
 
         theme_list = []
-        for file in themes_dir.glob("*.json"):
+        # os.scandir 一次列目录并带回 stat 信息，省掉 glob 的逐项 fnmatch
+        # 与 Path 包装开销
+        with os.scandir(themes_dir) as it:
+            files = [
+                e for e in it
+                if e.name.lower().endswith(".json") and e.is_file(follow_symlinks=False)
+            ]
+        for file in files:
             try:
-                data = self._load_json_with_fallback(file)
+                # mtime+大小未变的主题直接复用缓存条目，跳过读盘与 JSON 解析
+                st = file.stat()
+                cached = self._theme_cache.get(file.name)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    theme_list.append(cached[2])
+                    continue
+
+                data = self._load_json_with_fallback(file.path)
                 if isinstance(data, dict):
                     meta = data.get("meta", {})
-                    theme_list.append(
-                        {
-                            "filename": file.name,
-                            "name": meta.get("name", file.stem),
-                            "author": meta.get("author", "Unknown"),
-                            "version": meta.get("version", "1.0"),
-                        }
-                    )
+                    entry = {
+                        "filename": file.name,
+                        "name": meta.get("name", file.name[:-5]),
+                        "author": meta.get("author", "Unknown"),
+                        "version": meta.get("version", "1.0"),
+                    }
+                    self._theme_cache[file.name] = (st.st_mtime_ns, st.st_size, entry)
+                    theme_list.append(entry)
             except Exception as e:
                 log.error(f"读取主题 {file.name} 失败: {e}")
 
@@ -1321,9 +1652,8 @@ class AppApi:
 
     def load_theme_content(self, filename):
         # 读取指定主题文件的完整 JSON 内容并返回给前端应用。
-        themes_dir = (WEB_DIR / "themes").resolve()
-        theme_path = (themes_dir / str(filename)).resolve()
-        if os.path.commonpath([str(theme_path), str(themes_dir)]) != str(themes_dir):
+        theme_path = (WEB_DIR / "themes" / str(filename)).resolve()
+        if not str(theme_path).startswith(self._themes_root):
             return None
         if theme_path.suffix.lower() != ".json":
             return None
@@ -1403,7 +1733,7 @@ class AppApi:
 
     def update_sight_cover_data(self, sight_name, data_url):
         # 将前端传入的 base64 图片数据写入为炮镜封面 preview.png。
-        if self._is_busy:
+        if self._busy_lock.locked():
             return {"success": False, "msg": "系统繁忙"}
 
         try:
@@ -1414,7 +1744,7 @@ class AppApi:
 
     def import_sights_zip_dialog(self):
         # 打开文件选择对话框选择炮镜 ZIP 并触发导入流程。
-        if self._is_busy:
+        if self._busy_lock.locked():
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
@@ -1423,19 +1753,21 @@ class AppApi:
             return False
 
         file_types = ("Zip Files (*.zip)", "All files (*.*)")
-        result = self._window.create_file_dialog(
-            webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
-        )
-        if not result or len(result) == 0:
-            return False
 
-        zip_path = result[0]
-        self.import_sights_zip_from_path(zip_path)
+        # 对话框放到专用线程，JS 调用立即返回，不阻塞事件循环
+        def _ask_and_import():
+            result = self._window.create_file_dialog(
+                webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
+            )
+            if result and len(result) > 0:
+                self.import_sights_zip_from_path(result[0])
+
+        self._dialog_pool.submit(_ask_and_import)
         return True
 
     def import_sights_zip_from_path(self, zip_path):
         # 导入指定路径的炮镜 ZIP 到 UserSights，并将进度同步到前端加载组件。
-        if self._is_busy:
+        if self._busy_lock.locked():
             log.warning("另一个任务正在进行中，请稍候...")
             return False
 
@@ -1444,45 +1776,38 @@ class AppApi:
             return False
 
         zip_path = str(zip_path)
-        self._is_busy = True
+        if not self._busy_lock.acquire(blocking=False):
+            log.warning("另一个任务正在进行中，请稍候...")
+            return False
 
         if self._window:
-            msg_js = json.dumps(f"炮镜解压: {Path(zip_path).name}", ensure_ascii=False)
-            self._window.evaluate_js(
+            msg_js = _dumps(f"炮镜解压: {Path(zip_path).name}")
+            self._push_js(
                 f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
             )
 
         def _run():
             try:
                 self._sights_mgr.import_sights_zip(
-                    zip_path, progress_callback=self.update_loading_ui
+                    zip_path, progress_callback=self._throttled_loading_ui
                 )
                 if self._window:
-                    self._window.evaluate_js("if(app.refreshSights) app.refreshSights()")
-                    msg_js = json.dumps("炮镜导入完成", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js("if(app.refreshSights) app.refreshSights();" + _JS_LOADING_DONE["炮镜导入完成"])
             except FileExistsError as e:
                 log.warning(f"{e}")
                 if self._window:
-                    msg_js = json.dumps(str(e), ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                    msg_js = _dumps(str(e))
+                    self._push_js(
+                        _JS_LOADING_UPDATE % (100, msg_js)
                     )
             except Exception as e:
                 log.error(f"炮镜导入失败: {e}")
                 if self._window:
-                    msg_js = json.dumps("炮镜导入失败", ensure_ascii=False)
-                    self._window.evaluate_js(
-                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
-                    )
+                    self._push_js(_JS_LOADING_DONE["炮镜导入失败"])
             finally:
-                self._is_busy = False
+                self._busy_lock.release()
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._io_pool.submit(_run)
         return True
 
     def open_sights_folder(self):
@@ -1511,7 +1836,7 @@ class AppApi:
         """打开目录选择对话框，选择待解压区目录。"""
         folder = self._window.create_file_dialog(webview.FileDialog.FOLDER)
         if folder and len(folder) > 0:
-            path = folder[0].replace(os.sep, "/")
+            path = Path(folder[0]).as_posix()
             return {"success": True, "path": path}
         return {"success": False}
 
@@ -1519,7 +1844,7 @@ class AppApi:
         """打开目录选择对话框，选择语音包库目录。"""
         folder = self._window.create_file_dialog(webview.FileDialog.FOLDER)
         if folder and len(folder) > 0:
-            path = folder[0].replace(os.sep, "/")
+            path = Path(folder[0]).as_posix()
             return {"success": True, "path": path}
         return {"success": False}
 
@@ -1594,10 +1919,15 @@ class AppApi:
         self._lib_mgr.open_library_folder()
 
 
+# DOM 就绪信号：由 window.events.loaded 置位，on_app_started 靠它
+# 精确等待页面可交互，而不是固定睡 0.5 秒
+_DOM_READY = threading.Event()
+
+
 def on_app_started():
     # 在窗口创建完成后执行启动后处理，包括关闭 PyInstaller 启动图并让前端进入可交互状态。
-    # 延时以预留页面加载与渲染时间
-    time.sleep(0.5)
+    # loaded 事件触发即刻继续；错过事件也最多等 2 秒兜底
+    _DOM_READY.wait(timeout=2.0)
 
     if getattr(sys, "frozen", False):
         try:
@@ -1612,11 +1942,13 @@ def on_app_started():
         try:
             if webview.windows:
                 win = webview.windows[0]
-                win.evaluate_js(
-                    "if (window.app && app.recoverToSafeState) app.recoverToSafeState('backend_start');"
-                )
+                # 恢复与状态采集合併为一次 evaluate_js，省一趟同步 IPC 往返
                 state = win.evaluate_js(
-                    "JSON.stringify({activePage: (document.querySelector('.page.active')||{}).id || null, openModals: Array.from(document.querySelectorAll('.modal-overlay.show')).map(x=>x.id)})"
+                    "(function(){"
+                    "if (window.app && app.recoverToSafeState) app.recoverToSafeState('backend_start');"
+                    "return JSON.stringify({activePage: (document.querySelector('.page.active')||{}).id || null,"
+                    " openModals: Array.from(document.querySelectorAll('.modal-overlay.show')).map(x=>x.id)});"
+                    "})()"
                 )
                 log.info(f"[UI_STATE] {state}")
                 break
@@ -1627,6 +1959,89 @@ def on_app_started():
             time.sleep(0.2)
 
 
+def _get_windows_work_area():
+    if sys.platform != "win32":
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class POINT(ctypes.Structure):
+            _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG)]
+
+        class RECT(ctypes.Structure):
+            _fields_ = [
+                ("left", wintypes.LONG),
+                ("top", wintypes.LONG),
+                ("right", wintypes.LONG),
+                ("bottom", wintypes.LONG),
+            ]
+
+        class MONITORINFO(ctypes.Structure):
+            _fields_ = [
+                ("cbSize", wintypes.DWORD),
+                ("rcMonitor", RECT),
+                ("rcWork", RECT),
+                ("dwFlags", wintypes.DWORD),
+            ]
+
+        user32 = ctypes.windll.user32
+        point = POINT()
+        if not user32.GetCursorPos(ctypes.byref(point)):
+            return None
+
+        # MONITOR_DEFAULTTONEAREST = 2
+        hmonitor = user32.MonitorFromPoint(point, 2)
+        if not hmonitor:
+            return None
+
+        mi = MONITORINFO()
+        mi.cbSize = ctypes.sizeof(MONITORINFO)
+        if not user32.GetMonitorInfoW(hmonitor, ctypes.byref(mi)):
+            return None
+
+        r = mi.rcWork
+        return int(r.left), int(r.top), int(r.right), int(r.bottom)
+    except Exception:
+        log.debug("取得 Windows 工作区失败", exc_info=True)
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _centered_window_origin(window_width, window_height):
+    """
+    计算窗口置中坐标，进程内只探测一次显示子系统。
+
+    置中策略：优先用 Windows 工作区（避开工作列/多萤幕，只需两次
+    Win32 调用）；不行再退回 webview.screens 的全螢幕枚举。
+
+    Returns:
+        (start_x, start_y)，无法计算时为 (None, None)
+    """
+    try:
+        work = _get_windows_work_area()
+        if work:
+            left, top, right, bottom = work
+            work_w = max(0, right - left)
+            work_h = max(0, bottom - top)
+            if work_w and work_h:
+                return (
+                    left + (work_w - window_width) // 2,
+                    top + (work_h - window_height) // 2,
+                )
+        else:
+            screens = getattr(webview, "screens", None)
+            if screens:
+                primary = screens[0]
+                return (
+                    (primary.width - window_width) // 2,
+                    (primary.height - window_height) // 2,
+                )
+    except Exception:
+        log.warning("计算窗口居中坐标失败，改用默认窗口位置", exc_info=True)
+    return None, None
+
+
 def main() -> int:
     _install_global_exception_handlers()
 
@@ -1665,74 +2080,7 @@ def main() -> int:
     window_width = 1200
     window_height = 740
 
-    start_x = None
-    start_y = None
-
-    def _get_windows_work_area():
-        if sys.platform != "win32":
-            return None
-        try:
-            import ctypes
-            from ctypes import wintypes
-
-            class POINT(ctypes.Structure):
-                _fields_ = [("x", wintypes.LONG), ("y", wintypes.LONG)]
-
-            class RECT(ctypes.Structure):
-                _fields_ = [
-                    ("left", wintypes.LONG),
-                    ("top", wintypes.LONG),
-                    ("right", wintypes.LONG),
-                    ("bottom", wintypes.LONG),
-                ]
-
-            class MONITORINFO(ctypes.Structure):
-                _fields_ = [
-                    ("cbSize", wintypes.DWORD),
-                    ("rcMonitor", RECT),
-                    ("rcWork", RECT),
-                    ("dwFlags", wintypes.DWORD),
-                ]
-
-            user32 = ctypes.windll.user32
-            point = POINT()
-            if not user32.GetCursorPos(ctypes.byref(point)):
-                return None
-
-            # MONITOR_DEFAULTTONEAREST = 2
-            hmonitor = user32.MonitorFromPoint(point, 2)
-            if not hmonitor:
-                return None
-
-            mi = MONITORINFO()
-            mi.cbSize = ctypes.sizeof(MONITORINFO)
-            if not user32.GetMonitorInfoW(hmonitor, ctypes.byref(mi)):
-                return None
-
-            r = mi.rcWork
-            return int(r.left), int(r.top), int(r.right), int(r.bottom)
-        except Exception:
-            log.debug("取得 Windows 工作区失败", exc_info=True)
-            return None
-
-    # 置中策略：优先用 Windows 工作区（避开工作列/多萤幕）；不行再退回 webview.screens
-    try:
-        work = _get_windows_work_area()
-        if work:
-            left, top, right, bottom = work
-            work_w = max(0, right - left)
-            work_h = max(0, bottom - top)
-            if work_w and work_h:
-                start_x = left + (work_w - window_width) // 2
-                start_y = top + (work_h - window_height) // 2
-        else:
-            screens = getattr(webview, "screens", None)
-            if screens:
-                primary = screens[0]
-                start_x = (primary.width - window_width) // 2
-                start_y = (primary.height - window_height) // 2
-    except Exception:
-        log.warning("计算窗口居中坐标失败，改用默认窗口位置", exc_info=True)
+    start_x, start_y = _centered_window_origin(window_width, window_height)
 
     # 创建窗口实例（x/y 指定启动位置）
     try:
@@ -1759,24 +2107,32 @@ def main() -> int:
     # 绑定窗口对象到桥接层
     api.set_window(window)
 
+    # DOM 加载完成后唤醒 on_app_started，免去固定启动延时
+    try:
+        window.events.loaded += lambda: _DOM_READY.set()
+    except Exception:
+        log.debug("绑定 loaded 事件失败", exc_info=True)
+
     # TODO 需要优化，拖放压缩包时大概率卡死
     def _bind_drag_drop(win):
         # 绑定拖拽投放事件，用于在特定页面接收文件拖入并触发导入流程。
-        try:
-            from webview.dom import DOMEventHandler
-        except Exception:
+        if _DOMEventHandler is None:
             log.debug("DOMEventHandler 不可用，略过拖放绑定")
             return
 
         def on_drop(e):
             def _async_processor():
                 try:
-                    win.evaluate_js("if(window.app && app.hideDropOverlay) app.hideDropOverlay()")
+                    win.evaluate_js(_JS_HIDE_DROP_OVERLAY)
 
-                    try:
-                        active_page = win.evaluate_js("(document.querySelector('.page.active')||{}).id || ''")
-                    except Exception:
-                        active_page = ""
+                    # 前端每次切页都会回报活动页，这里直接读缓存值；
+                    # 尚未收到回报时才退回 DOM 反查的 IPC 往返
+                    active_page = api._active_page
+                    if not active_page:
+                        try:
+                            active_page = win.evaluate_js(_JS_ACTIVE_PAGE)
+                        except Exception:
+                            active_page = ""
 
                     allowed_pages = ["page-home", "page-lib", "page-camo", "page-sight"]
                     if not active_page or active_page not in allowed_pages:
@@ -1802,20 +2158,22 @@ def main() -> int:
                     if not full_paths:
                         return
 
+                    # 单遍短路取第一个压缩包：后面只用第一个，无需物化完整
+                    # 过滤列表；且只小写尾部 5 字符（最长后缀 .tbz2），
+                    # 不对可达 MAX_PATH 的完整路径做 lower
                     archive_exts = (".zip", ".rar", ".7z", ".tar", ".gz", ".bz2", ".xz", ".tgz", ".tbz2")
-                    zip_files = [p for p in full_paths if p.lower().endswith(archive_exts)]
-                    if not zip_files:
+                    zp = next(
+                        (p for p in full_paths if p[-5:].lower().endswith(archive_exts)),
+                        None,
+                    )
+                    if zp is None:
                         return
 
-                    zp = zip_files[0]
-
                     if active_page == "page-lib":
                         api.import_voice_zip_from_path(zp)
                     elif active_page == "page-camo":
                         try:
-                            res_view = win.evaluate_js(
-                                "(document.querySelector('#page-camo .resource-nav-item.active')||{}).dataset.target || 'skins'"
-                            )
+                            res_view = win.evaluate_js(_JS_CAMO_RES_VIEW)
                         except Exception:
                             res_view = "skins"
 
@@ -1829,10 +2187,10 @@ def main() -> int:
                 except Exception as ex:
                     log.error(f"拖拽处理发生异常: {ex}", exc_info=True)
 
-            threading.Thread(target=_async_processor, daemon=True).start()
+            api._io_pool.submit(_async_processor)
 
         try:
-            win.dom.document.events.drop += DOMEventHandler(on_drop, True, False)
+            win.dom.document.events.drop += _DOMEventHandler(on_drop, True, False)
         except Exception:
             log.debug("绑定拖放事件失败", exc_info=True)
             return
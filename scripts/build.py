@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 import os
-import shutil
+import json
 import hashlib
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -12,27 +14,109 @@ from utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# 构建缓存文件：记录上次构建的源码指纹与 exe 校验和，用于跳过无变更的重复打包
+BUILD_CACHE_FILE = Path("../dist/.build_cache.json")
+
+
+# 校验和缓存：同一文件（路径+mtime+大小）在一次构建流程内只需哈希一次
+_CHECKSUM_CACHE = {}
+
 
 def calculate_checksum(file_path, algorithm='sha256'):
-    """计算文件的校验和"""
-    hash_func = getattr(hashlib, algorithm)()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_func.update(chunk)
-    return hash_func.hexdigest()
+    """计算文件的校验和（按路径+mtime+大小缓存，避免重复读盘）"""
+    st = os.stat(file_path)
+    key = (os.fspath(file_path), st.st_mtime_ns, st.st_size, algorithm)
+    cached = _CHECKSUM_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    if hasattr(hashlib, "file_digest"):
+        # Python 3.11+: C 实现的读取+哈希循环，无缓冲裸读并释放 GIL
+        with open(file_path, 'rb', buffering=0) as f:
+            digest = hashlib.file_digest(f, algorithm).hexdigest()
+    else:
+        hash_func = getattr(hashlib, algorithm)()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hash_func.update(chunk)
+        digest = hash_func.hexdigest()
+    _CHECKSUM_CACHE[key] = digest
+    return digest
+
+
+def compute_source_fingerprint(salt, url, prev_manifest=None):
+    """
+    计算源码树的组合指纹（main.py + web/** + salt + url + PyInstaller 版本）。
+
+    prev_manifest 为上次构建持久化的 {路径: {mtime_ns, size, sha256}} 清单；
+    mtime 与大小均未变化的文件直接复用上次的摘要，免去重新读盘哈希。
+    返回 (指纹, 本次清单)。
+    """
+    # 指纹只需抗碰撞、不需标准互操作：BLAKE2b 比 SHA-256 更快（软件实现）
+    outer = hashlib.blake2b(digest_size=32)
+    prev_manifest = prev_manifest if isinstance(prev_manifest, dict) else {}
+    manifest = {}
 
+    try:
+        import PyInstaller
+        outer.update(str(PyInstaller.__version__).encode("utf-8"))
+    except Exception:
+        pass
 
-def clean_build_artifacts():
-    """清理构建临时文件"""
-    log.info("🧹 正在清理临时文件...")
+    outer.update(repr(salt).encode("utf-8"))
+    outer.update(repr(url).encode("utf-8"))
+
+    sources = [Path("main.py")]
+    web_dir = Path("web")
+    if web_dir.exists():
+        sources.extend(p for p in web_dir.rglob("*") if p.is_file())
 
-    # 删除 build 文件夹
-    if os.path.exists('build'):
+    for p in sorted(sources, key=lambda x: str(x)):
         try:
-            shutil.rmtree('build')
-            log.info("   - 已删除 build 文件夹")
-        except Exception as e:
-            log.warning(f"   ! 删除 build 文件夹失败: {e}")
+            st = p.stat()
+            key = str(p)
+            prev = prev_manifest.get(key)
+            if (prev and prev.get("mtime_ns") == st.st_mtime_ns
+                    and prev.get("size") == st.st_size):
+                digest = prev["blake2b"]
+            else:
+                digest = calculate_checksum(p, 'blake2b')
+            manifest[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "blake2b": digest}
+            outer.update(f"{key}|{st.st_size}|{digest}".encode("utf-8"))
+        except OSError:
+            continue
+
+    return outer.hexdigest(), manifest
+
+
+def _load_build_cache():
+    """读取上次构建的缓存记录，失败则返回 None。"""
+    try:
+        with open(BUILD_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, json.JSONDecodeError):
+        pass
+    return None
+
+
+def _save_build_cache(fingerprint, exe_sha256, manifest=None):
+    """构建成功后写入缓存记录（含源文件摘要清单，供下次增量指纹复用）。"""
+    try:
+        BUILD_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        record = {"fingerprint": fingerprint, "exe_sha256": exe_sha256}
+        if manifest:
+            record["files"] = manifest
+        with open(BUILD_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=2)
+    except OSError as e:
+        log.warning(f"   ! 写入构建缓存失败: {e}")
+
+
+def clean_build_artifacts():
+    """清理构建临时文件（保留 build 工作目录供 PyInstaller 增量复用）"""
+    log.info("🧹 正在清理临时文件...")
 
     # 删除 spec 文件
     if os.path.exists('WT_Aimer_Voice.spec'):
@@ -43,18 +127,28 @@ def clean_build_artifacts():
             log.warning(f"   ! 删除 spec 文件失败: {e}")
 
 
+# .env 解析缓存：按 (路径, mtime) 缓存解析结果，重复调用时免去重新解析
+_DOTENV_CACHE = {}
+
+# KEY=VALUE 行的预编译正则：一次 finditer 扫完整个文件，逐行字符串操作全部下沉到 C 层
+_ENV_LINE_RE = re.compile(r'(?m)^\s*(?!#)([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$')
+
+
 def load_dotenv(path=".env"):
-    if os.path.exists(path):
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#") or "=" not in line:
-                        continue
-                    k, v = line.split("=", 1)
-                    os.environ.setdefault(k.strip(), v.strip())
-        except Exception as e:
-            print(f"   ! 加载 .env 失败: {e}")
+    if not os.path.exists(path):
+        return
+    try:
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns)
+        parsed = _DOTENV_CACHE.get(key)
+        if parsed is None:
+            text = Path(path).read_text(encoding="utf-8", errors="replace")
+            parsed = {m.group(1): m.group(2) for m in _ENV_LINE_RE.finditer(text)}
+            _DOTENV_CACHE[key] = parsed
+        for k, v in parsed.items():
+            os.environ.setdefault(k, v)
+    except Exception as e:
+        print(f"   ! 加载 .env 失败: {e}")
 
 
 def build_exe():
@@ -71,6 +165,20 @@ def build_exe():
     salt = os.environ.get("TELEMETRY_SALT", "DEVELOPMENT_SALT")
     url = os.environ.get("REPORT_URL", "https://api.example.com/telemetry")
 
+    # 源码指纹比对：源码与配置均未变化且 exe 完好时，直接复用上次构建产物
+    exe_name = "WT_Aimer_Voice.exe" if os.name == 'nt' else "WT_Aimer_Voice"
+    exe_path = Path("../dist") / exe_name
+    cache = _load_build_cache()
+    fingerprint, manifest = compute_source_fingerprint(
+        salt, url, prev_manifest=cache.get("files") if cache else None
+    )
+    if cache and exe_path.exists():
+        if (cache.get("fingerprint") == fingerprint
+                and calculate_checksum(exe_path, 'sha256') == cache.get("exe_sha256")):
+            log.info("[OK] 源码未变更，复用缓存的构建产物 (reusing cached build)")
+            log.info(f"输出文件: {exe_path}")
+            return True
+
     # 生成临时的 app_secrets.py 供编译使用
     # 注意：该文件已被加入 .gitignore，不会被上传到 GitHub
     secrets_file = Path("../app_secrets.py")
@@ -88,7 +196,7 @@ def build_exe():
         "--onefile",
         "--add-data", f"web{sep}web",  # 将 web 文件夹打包到 exe 内部的 web 目录
         "--name", "WT_Aimer_Voice",
-        "--clean",  # 清理 PyInstaller 缓存
+        "--workpath", "build",  # 固定工作目录，跨构建复用分析缓存（不再 --clean）
         "main.py"
     ]
 
@@ -103,28 +211,30 @@ def build_exe():
 
     try:
         # shell=False ensures arguments are passed correctly on Linux without manual escaping
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        if result.stdout:
-            log.debug(result.stdout)
-        if result.stderr:
-            log.debug(result.stderr)
+        # 逐行转发 PyInstaller 输出：内存佔用恒定，并能实时看到打包进度
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        for line in proc.stdout:
+            log.debug(line.rstrip())
+        returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
     except subprocess.CalledProcessError as e:
         log.error(f"[X] 打包失败！错误: {e}", exc_info=True)
-        log.error("--- PyInstaller stdout ---")
-        if e.stdout:
-            log.error(e.stdout)
-        log.error("--- PyInstaller stderr ---")
-        if e.stderr:
-            log.error(e.stderr)
         sys.exit(1)
     except Exception as e:
         log.exception(f"[X] 打包失败！错误: {e}")
         sys.exit(1)
     else:
-        exe_name = "WT_Aimer_Voice.exe" if os.name == 'nt' else "WT_Aimer_Voice"
-        exe_path = Path("../dist") / exe_name
         log.info("[OK] 打包成功！")
         log.info(f"输出文件: {exe_path}")
+        if exe_path.exists():
+            _save_build_cache(fingerprint, calculate_checksum(exe_path, 'sha256'), manifest)
         return True
 
 
@@ -144,7 +254,12 @@ def main():
         return
 
     log.info("🔐 正在生成校验文件...")
-    checksum = calculate_checksum(exe_path, 'sha256')
+    # 校验和计算与临时文件清理相互独立且都是 I/O 密集操作，并行执行以缩短总耗时
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        checksum_future = pool.submit(calculate_checksum, exe_path, 'sha256')
+        pool.submit(clean_build_artifacts)
+        checksum = checksum_future.result()
+
     checksum_file = dist_dir / Path("checksum.txt")
 
     with open(checksum_file, 'w', encoding='utf-8') as f:
@@ -155,9 +270,6 @@ def main():
     log.info(f"✅ 校验文件已生成: {checksum_file}")
     log.info(f"   SHA256: {checksum}")
 
-    # 3. 清理临时文件
-    clean_build_artifacts()
-
     log.info("\n🎉 所有任务完成！可执行文件位于 dist 目录。")
 
 
@@ -7,13 +7,24 @@
 - 自动编码回退策略读取 JSON
 - 配置项的安全读写与验证
 """
+import atexit
 import json
 import os
+import pickle
 import platform
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 import sys
 from utils.logger import get_logger
-from utils.utils import get_docs_data_dir
+from utils.utils import atomic_write_bytes, get_docs_data_dir
+
+# orjson（Rust 实现）可用时接管 settings.json 的序列化与解析；
+# 未安装时退回 stdlib json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 log = get_logger(__name__)
 
@@ -67,41 +78,94 @@ class ConfigManager:
         """初始化配置管理器，加载或创建配置文件。"""
         self.config_dir = DOCS_DIR
         self.config_file = CONFIG_FILE
+        # 批量更新时挂起落盘，由 batch() 在结束时统一写入一次
+        self._suspend_save = False
+        # 去抖落盘：连续 setter 调用合併为一次写入
+        self._save_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
+        self._dirty = False
+        # 上次写入的序列化内容，用于跳过无变化的重复写盘
+        self._last_bytes: bytes | None = None
         # 初始化默认配置并尝试从 settings.json 加载复盖
         self.config = self.DEFAULT_CONFIG.copy()
         self.load_config()
+        # 进程退出前把未落盘的修改写入磁盘
+        atexit.register(self.flush_now)
 
     def _load_json_with_fallback(self, file_path: Path) -> dict | None:
         """
-        按编码回退策略读取 JSON 文件并解析为 Python 对象。
-        
+        读取 JSON 文件并解析为 Python 对象（单次读取 + BOM 嗅探 + 编码回退）。
+
         Args:
             file_path: JSON 文件路径
-            
+
         Returns:
             解析后的字典，失败则返回 None
         """
-        encodings = ["utf-8-sig", "utf-8", "cp950", "big5", "gbk"]
-        last_error = None
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            log.error(f"无法读取配置文件 {file_path}: {e}")
+            return None
 
-        for enc in encodings:
+        # 只读一次字节，先嗅探 BOM，再按编码回退解码，避免重复打开与解析
+        if raw.startswith(b'\xef\xbb\xbf'):
             try:
-                with open(file_path, 'r', encoding=enc) as f:
-                    return json.load(f)
-            except UnicodeDecodeError:
-                continue
-            except json.JSONDecodeError as e:
-                last_error = e
-                log.warning(f"JSON 解析错误 (编码: {enc}): {e}")
-                continue
-            except Exception as e:
-                last_error = e
-                continue
-
-        if last_error:
-            log.error(f"无法读取配置文件 {file_path}: {last_error}")
+                text = raw[3:].decode('utf-8')
+            except UnicodeDecodeError as e:
+                log.error(f"无法解码配置文件 {file_path}: {e}")
+                return None
+        else:
+            for enc in ('utf-8', 'cp950', 'big5', 'gbk'):
+                try:
+                    text = raw.decode(enc)
+                    break
+                except UnicodeDecodeError:
+                    continue
+            else:
+                log.error(f"无法解码配置文件 {file_path}")
+                return None
+
+        try:
+            if _orjson is not None:
+                return _orjson.loads(text)
+            return json.loads(text)
+        except ValueError as e:
+            log.error(f"JSON 解析错误: {e}")
+            return None
+
+    def _cache_file(self) -> Path:
+        """settings.json 对应的解析缓存文件路径。"""
+        return self.config_file.with_name(self.config_file.name + ".cache")
+
+    def _load_parse_cache(self, st: os.stat_result) -> dict | None:
+        """
+        读取 settings.json 的解析缓存（pickle，按 mtime_ns+大小校验）。
+
+        Args:
+            st: settings.json 当前的 stat 结果
+
+        Returns:
+            缓存命中时返回解析后的字典，否则返回 None
+        """
+        try:
+            with open(self._cache_file(), 'rb') as f:
+                mtime_ns, size, data = pickle.load(f)
+            if mtime_ns == st.st_mtime_ns and size == st.st_size and isinstance(data, dict):
+                return data
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            pass
         return None
 
+    def _save_parse_cache(self, st: os.stat_result, data: dict) -> None:
+        """写入解析缓存，失败时静默忽略（缓存只是加速，不影响正确性）。"""
+        try:
+            with open(self._cache_file(), 'wb') as f:
+                pickle.dump((st.st_mtime_ns, st.st_size, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
     def load_config(self) -> bool:
         """
         从 settings.json 加载配置并合併到当前配置字典。
@@ -109,48 +173,146 @@ class ConfigManager:
         Returns:
             bool: 是否成功加载
         """
-        if not self.config_file.exists():
+        try:
+            st = self.config_file.stat()
+        except OSError:
             log.info("配置文件不存在，使用默认配置")
             return False
 
-        try:
+        # 优先读取解析缓存：mtime+大小均未变化时直接反序列化，跳过编码回退与 JSON 解析
+        data = self._load_parse_cache(st)
+        if data is None:
+            # _load_json_with_fallback 内部已捕获读取/解码/解析错误并返回 None，
+            # 这里不再用宽泛的 except 包裹，避免吞掉 MemoryError/KeyboardInterrupt 之类的严重异常
             data = self._load_json_with_fallback(self.config_file)
             if isinstance(data, dict):
-                # 只更新已知的配置项，忽略未知项
-                for key in self.DEFAULT_CONFIG:
-                    if key in data:
-                        self.config[key] = data[key]
-                log.debug(f"已加载配置文件: {self.config_file}")
-                return True
-            else:
-                log.warning("配置文件格式无效，使用默认配置")
-                return False
-        except Exception as e:
-            log.error(f"加载配置文件失败: {type(e).__name__}: {e}")
+                self._save_parse_cache(st, data)
+
+        if isinstance(data, dict):
+            # 只更新已知的配置项，忽略未知项
+            for key in self.DEFAULT_CONFIG:
+                if key in data:
+                    self.config[key] = data[key]
+            log.debug(f"已加载配置文件: {self.config_file}")
+            return True
+        else:
+            log.warning("配置文件格式无效，使用默认配置")
             return False
 
+    @contextmanager
+    def batch(self):
+        """
+        批量更新上下文：在代码块内的 set_* 调用不会各自落盘，
+        退出时统一调用一次 save_config。
+
+        使用示例:
+            with cfg.batch():
+                cfg.set_theme_mode("Dark")
+                cfg.set_active_theme("dark.json")
+        """
+        self._suspend_save = True
+        try:
+            yield self
+        finally:
+            self._suspend_save = False
+            self.flush_now()
+
+    def update(self, **kv) -> bool:
+        """
+        批量合併多个配置项并只落盘一次。
+
+        Args:
+            **kv: 要更新的配置键值对
+
+        Returns:
+            bool: 是否成功保存
+        """
+        self.config.update(kv)
+        return self._schedule_save()
+
+    def _schedule_save(self) -> bool:
+        """
+        标记配置已修改，并（重新）启动 0.1 秒去抖计时器。
+
+        连续多次 setter 调用只会在最后一次之后真正写一次盘；
+        batch() 挂起期间仅标脏，由 batch 退出时统一写入。
+
+        Returns:
+            bool: 恒为 True（实际写盘结果由 _flush 记录日志）
+        """
+        with self._save_lock:
+            self._dirty = True
+            if self._suspend_save:
+                return True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            timer = threading.Timer(0.1, self._flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+        return True
+
+    def _flush(self) -> None:
+        """去抖计时器到期后的实际落盘动作。"""
+        with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._flush_timer = None
+        self.save_config()
+
+    def flush_now(self) -> bool:
+        """
+        取消挂起的计时器并立即写入未落盘的修改（退出前调用）。
+
+        Returns:
+            bool: 是否成功保存（无待写修改时视为成功）
+        """
+        with self._save_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            dirty = self._dirty
+            self._dirty = False
+        if dirty:
+            return self.save_config()
+        return True
+
     def save_config(self) -> bool:
         """
         将当前配置字典写入 settings.json。
-        
+
         Returns:
             bool: 是否成功保存
-            
+
         Raises:
             ConfigSaveError: 保存失败时（仅在严重错误时）
         """
+        if self._suspend_save:
+            return True
+
         try:
+            # 内容未变化则直接跳过写盘（UI 重复下发同值 setter 的常见路径）
+            if _orjson is not None:
+                blob = _orjson.dumps(self.config, option=_orjson.OPT_INDENT_2)
+            else:
+                blob = json.dumps(self.config, indent=4, ensure_ascii=False).encode('utf-8')
+            if blob == self._last_bytes:
+                log.debug("配置无变化，跳过写盘")
+                return True
+
             # 确保目录存在
             if not self.config_dir.exists():
                 self.config_dir.mkdir(parents=True, exist_ok=True)
 
-            # 先写入临时文件，成功后再重命名（原子操作）
-            temp_file = self.config_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-
-            # 重命名为正式文件
-            temp_file.replace(self.config_file)
+            # 原子写入（Linux 走 O_TMPFILE，其余平台临时文件 + 重命名）
+            atomic_write_bytes(self.config_file, blob)
+            self._last_bytes = blob
+            # 同步刷新解析缓存，让下次启动直接命中
+            try:
+                self._save_parse_cache(self.config_file.stat(), dict(self.config))
+            except OSError:
+                pass
             log.debug(f"配置已保存: {self.config_file}")
             return True
 
@@ -179,7 +341,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["game_path"] = str(path) if path else ""
-        return self.save_config()
+        return self._schedule_save()
 
     def get_sights_path(self) -> str:
         """读取当前配置中的 UserSights 目录路径。"""
@@ -196,7 +358,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["sights_path"] = str(path) if path else ""
-        return self.save_config()
+        return self._schedule_save()
 
     def get_theme_mode(self) -> str:
         """读取当前主题模式（Light/Dark）。"""
@@ -216,7 +378,7 @@ class ConfigManager:
             log.warning(f"无效的主题模式: {mode}，使用 Light")
             mode = "Light"
         self.config["theme_mode"] = mode
-        return self.save_config()
+        return self._schedule_save()
 
     def get_active_theme(self) -> str:
         """读取当前选择的主题文件名（自定义主题的配置项）。"""
@@ -233,7 +395,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["active_theme"] = str(filename) if filename else "default.json"
-        return self.save_config()
+        return self._schedule_save()
 
     def get_current_mod(self) -> str:
         """读取当前记录的已安装/已生效语音包标识。"""
@@ -250,7 +412,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["current_mod"] = str(mod_id) if mod_id else ""
-        return self.save_config()
+        return self._schedule_save()
 
     def get_is_first_run(self) -> bool:
         """读取是否为首次运行的标誌位。"""
@@ -267,7 +429,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["is_first_run"] = bool(is_first_run)
-        return self.save_config()
+        return self._schedule_save()
 
     def get_agreement_version(self) -> str:
         """读取用户已确认的协议版本号。"""
@@ -284,7 +446,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["agreement_version"] = str(version) if version else ""
-        return self.save_config()
+        return self._schedule_save()
 
     def get_config_dir(self) -> str:
         """读取当前配置文件所在目录路径。"""
@@ -309,7 +471,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["pending_dir"] = str(path) if path else ""
-        return self.save_config()
+        return self._schedule_save()
 
     def get_library_dir(self) -> str:
         """读取自定义的语音包库目录路径。"""
@@ -326,7 +488,7 @@ class ConfigManager:
             bool: 是否成功保存
         """
         self.config["library_dir"] = str(path) if path else ""
-        return self.save_config()
+        return self._schedule_save()
 
     def get_telemetry_enabled(self):
         """
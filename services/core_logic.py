@@ -340,11 +340,8 @@ class CoreService:
         try:
             mod_dir = (self.game_root / "sound" / "mod").resolve()
             tp = Path(target_path).resolve()
-            common = os.path.commonpath([str(tp), str(mod_dir)])
-            return common == str(mod_dir) and str(tp) != str(mod_dir)
-        except ValueError:
-            # commonpath 在路径不在同一驱动器时会抛出 ValueError
-            return False
+            # 前缀比对天然排除 mod_dir 自身，且不同驱动器时前缀必不匹配
+            return str(tp).startswith(str(mod_dir) + os.sep)
         except Exception as e:
             log.debug(f"路径安全检查异常: {e}")
             return False
@@ -22,6 +22,7 @@ import time
 import zipfile
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from utils.logger import get_logger
@@ -303,6 +304,37 @@ class LibraryManager:
             log.error(f"扫描语音包库失败: {e}")
             return []
 
+    def scan_library_details(self) -> list[tuple[str, dict[str, Any]]]:
+        """
+        一次 scandir 批量读取全库语音包详情。
+
+        目录名与 mtime 取自同一批 DirEntry（DirEntry.stat 复用 readdir
+        的结果），缓存命中的条目不再付任何额外系统调用；未命中的按
+        目录顺序依序读取，磁盘寻道集中在一次顺序遍历里。
+
+        Returns:
+            [(语音包目录名, 详情字典), ...]
+        """
+        try:
+            with os.scandir(self.library_dir) as it:
+                entries = [e for e in it if e.is_dir()]
+        except OSError as e:
+            log.error(f"扫描语音包库失败: {e}")
+            return []
+
+        results = []
+        for entry in entries:
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                mtime = 0
+            cached = self._details_cache.get(entry.name)
+            if cached and cached.get("_mtime") == mtime:
+                results.append((entry.name, cached))
+            else:
+                results.append((entry.name, self.get_mod_details(entry.name)))
+        return results
+
     def scan_pending(self) -> list[Path]:
         """
         扫描待解压区中的 ZIP/RAR 文件列表。
@@ -812,13 +844,12 @@ class LibraryManager:
                 detected_country = country
                 break
 
-        for v_type in VoiceType:
-            if not v_type.tag:
-                continue
-
-            # 全等匹配或带下划线的前缀匹配
-            if base_name == v_type.code or base_name == "_" + v_type.code:
-                return v_type, detected_country, base_name
+        # 全等匹配（或带一个前导下划线）走 O(1) 查表，
+        # tag 为空的类型（如 event）不参与匹配，与原逻辑一致
+        exact = base_name[1:] if base_name.startswith("_") else base_name
+        v_type = VoiceType.from_code(exact)
+        if v_type is not None and v_type.tag:
+            return v_type, detected_country, base_name
 
         # 兜底：模糊匹配
         for v_type in VoiceType:
@@ -964,6 +995,13 @@ class LibraryManager:
         while True:
             try:
                 if archive_path.suffix.lower() == ".zip":
+                    # 加密 ZIP 优先交给 7z 子进程：zipfile 的 _ZipDecrypter
+                    # 是纯 Python 按字节解密且全程持有 GIL，会饿死 JS 主线程；
+                    # 7z 在进程外解密，完全不佔用解释器
+                    if password and self._find_7z():
+                        self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress,
+                                              share_progress, password=password)
+                        return
                     try:
                         self._extract_zip_safely(archive_path, target_dir, progress_callback, base_progress,
                                                  share_progress, password=password)
@@ -1040,10 +1078,8 @@ class LibraryManager:
             # 需要至少 2 倍的估算空间作为安全余量 (解压过程可能产生临时文件)
             required_space = estimated_size * 2
 
-            target_drive = Path(self.library_dir).anchor  # 获取盘符 (如 C:\)
-            if not target_drive: target_drive = self.library_dir
-
-            total, used, free = shutil.disk_usage(target_drive)
+            # disk_usage 可直接作用于目录本身，无需折回盘符
+            total, used, free = shutil.disk_usage(str(self.library_dir))
 
             if free < required_space:
                 free_mb = free / (1024 * 1024)
@@ -1166,6 +1202,8 @@ class LibraryManager:
                             password=None):
         # 解压 ZIP 文件到目标目录，并提供进度回调与路径边界校验。
         target_root = Path(target_dir).resolve()
+        target_root_str = str(target_root)
+        target_root_prefix = target_root_str + os.sep
         with zipfile.ZipFile(zip_path, 'r') as zf:
             file_list = zf.infolist()
             total_files = len(file_list)
@@ -1190,19 +1228,20 @@ class LibraryManager:
                         pass
 
             for idx, member in enumerate(file_list):
-                if idx % 50 == 0:
-                    time.sleep(0.001)
-
-                try:
-                    filename = member.filename.encode('cp437').decode('utf-8')
-                except:
+                # 带 UTF-8 标志位（0x800）的条目 zipfile 已正确解码，
+                # 纯 ASCII 名也无需修复；其余才走 cp437 重解链
+                filename = member.filename
+                if not (member.flag_bits & 0x800) and not filename.isascii():
                     try:
-                        filename = member.filename.encode('cp437').decode('gbk')
+                        filename = filename.encode('cp437').decode('utf-8')
                     except:
                         try:
-                            filename = member.filename.encode('cp437').decode('cp950')
+                            filename = filename.encode('cp437').decode('gbk')
                         except:
-                            filename = member.filename
+                            try:
+                                filename = filename.encode('cp437').decode('cp950')
+                            except:
+                                filename = member.filename
 
                 if "__MACOSX" in filename or "desktop.ini" in filename:
                     continue
@@ -1222,12 +1261,9 @@ class LibraryManager:
                     last_update = now
 
                 # 路径边界校验：目标路径必须位于 target_dir 内部
-                full_target_path = (target_dir / filename).resolve()
-                try:
-                    is_inside = os.path.commonpath([str(full_target_path), str(target_root)]) == str(target_root)
-                except Exception:
-                    is_inside = False
-                if not is_inside:
+                # （前缀比对取代 commonpath 的逐级拆分）
+                fp = str((target_dir / filename).resolve())
+                if fp != target_root_str and not fp.startswith(target_root_prefix):
                     self.log(f"[WARN] 拦截恶意路径穿越文件: {filename}", "WARN")
                     continue
 
@@ -1295,21 +1331,24 @@ class LibraryManager:
         skipped = []
         missing = []
 
+        # 一次 rglob 收集全部文件，避免每个前缀/后缀组合都重新遍历语音包
+        all_files = [p for p in mod_dir.rglob("*") if p.is_file()]
+
         def _find_source(prefix, suffix):
-            matches = []
             prefix_clean = prefix.lstrip("_")
             pattern = re.compile(
                 rf"^_?{re.escape(prefix_clean)}([a-z]{{2,10}})?{re.escape(suffix)}$",
                 re.IGNORECASE,
             )
-            for p in mod_dir.rglob("*"):
-                if p.is_file() and pattern.match(p.name):
-                    matches.append(p)
+            matches = [p for p in all_files if pattern.match(p.name)]
             if not matches:
                 return None
             return sorted(matches, key=lambda x: str(x))[0]
 
-        def _copy_pair(prefix):
+        # 先串行规划出待复制的 (来源, 目标) 列表，再并行执行实际复制
+        copy_jobs = []
+
+        def _plan_pair(prefix):
             src_assets_name = f"{prefix}*.assets.bank"
             src_bank_name = f"{prefix}*.bank"
             src_assets = _find_source(prefix, ".assets.bank")
@@ -1320,7 +1359,7 @@ class LibraryManager:
                 if dst_assets.exists():
                     skipped.append(dst_assets.name)
                 else:
-                    shutil.copy2(src_assets, dst_assets)
+                    copy_jobs.append((src_assets, dst_assets))
                     created.append(dst_assets.name)
             else:
                 missing.append(src_assets_name)
@@ -1330,15 +1369,27 @@ class LibraryManager:
                 if dst_bank.exists():
                     skipped.append(dst_bank.name)
                 else:
-                    shutil.copy2(src_bank, dst_bank)
+                    copy_jobs.append((src_bank, dst_bank))
                     created.append(dst_bank.name)
             else:
                 missing.append(src_bank_name)
 
         if include_ground:
-            _copy_pair("_crew_dialogs_ground_")
+            _plan_pair("_crew_dialogs_ground_")
         if include_radio:
-            _copy_pair("_crew_dialogs_common_")
+            _plan_pair("_crew_dialogs_common_")
+
+        def _copy_one(job):
+            src, dst = job
+            # 1 MiB 缓冲整块搬运，几十 MB 的 bank 文件并行复制更快打满磁盘带宽
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, length=1 << 20)
+            shutil.copystat(src, dst)
+
+        if copy_jobs:
+            # list() 消费 map 以便把工作线程中的异常原样抛给调用方
+            with ThreadPoolExecutor(max_workers=min(4, len(copy_jobs))) as pool:
+                list(pool.map(_copy_one, copy_jobs))
 
         return {
             "created": created,
@@ -8,13 +8,21 @@
 - 提供安装前冲突检查能力
 - 支援安装记录的添加与清理
 
-数据存储于游戏目录的 sound/mod/.manifest.json
+数据存储于游戏目录的 sound/mod/.manifest.json，增量操作先追加到
+同目录的 .manifest.log 日志，定期或重新加载时折叠为全量清单。
 """
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable
 from utils.logger import get_logger
+from utils.utils import atomic_write_bytes
+
+# orjson（Rust 实现）可用时接管清单与日志行的序列化；未安装退回 stdlib json
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 log = get_logger(__name__)
 
@@ -46,6 +54,9 @@ class ManifestManager:
     
     # 清单数据结构模板
     EMPTY_MANIFEST = {"installed_mods": {}, "file_map": {}}
+
+    # 增量日志累计多少条操作后折叠为一次全量落盘
+    CHECKPOINT_EVERY = 20
     
     def __init__(self, game_root: Path | str):
         """
@@ -56,28 +67,55 @@ class ManifestManager:
         """
         self.game_root = Path(game_root)
         self.manifest_file = self.game_root / "sound" / "mod" / ".manifest.json"
+        # 增量日志：每次安装/移除只追加一行，避免整份清单重写
+        self._journal_file = self.manifest_file.with_suffix(".log")
+        self._journal_ops = 0
         self.manifest = self._load_manifest()
+        # 反向索引：语音包 -> 其佔有文件名集合，卸载时免去逐文件重查
+        self._mod_owned: dict[str, set[str]] = {
+            mod: set(info.get("files", []))
+            for mod, info in self.manifest["installed_mods"].items()
+        }
         log.debug(f"清单管理器已初始化: {self.manifest_file}")
     
+    @classmethod
+    def _empty_manifest(cls) -> dict[str, Any]:
+        """逐层新建空清单，避免浅複製把模板的内层字典共享出去。"""
+        return {key: {} for key in cls.EMPTY_MANIFEST}
+
     def _load_manifest(self) -> dict[str, Any]:
         """
-        从 manifest_file 读取清单数据到内存。
+        从 manifest_file 读取清单数据到内存，并回放增量日志。
+
+        Returns:
+            清单数据字典
+        """
+        data = self._read_manifest_file()
+        replayed = self._replay_journal(data)
+        if replayed:
+            log.debug(f"已回放 {replayed} 条清单增量记录")
+        return data
+
+    def _read_manifest_file(self) -> dict[str, Any]:
+        """
+        读取全量清单文件。
         
         Returns:
             清单数据字典
         """
         if not self.manifest_file.exists():
             log.debug("清单文件不存在，使用空清单")
-            return self.EMPTY_MANIFEST.copy()
+            return self._empty_manifest()
         
         try:
-            with open(self.manifest_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.manifest_file, 'rb') as f:
+                raw = f.read()
+            data = _orjson.loads(raw) if _orjson is not None else json.loads(raw)
             
             # 验证数据结构
             if not isinstance(data, dict):
                 log.warning("清单文件格式无效，使用空清单")
-                return self.EMPTY_MANIFEST.copy()
+                return self._empty_manifest()
             
             # 确保必要的键存在
             if "installed_mods" not in data:
@@ -88,16 +126,113 @@ class ManifestManager:
             log.debug(f"已加载清单: {len(data['installed_mods'])} 个 mod, {len(data['file_map'])} 个文件映射")
             return data
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             log.error(f"清单文件 JSON 解析失败: {e}")
-            return self.EMPTY_MANIFEST.copy()
+            return self._empty_manifest()
         except PermissionError as e:
             log.error(f"读取清单文件失败（权限不足）: {e}")
-            return self.EMPTY_MANIFEST.copy()
+            return self._empty_manifest()
         except Exception as e:
             log.error(f"读取清单文件失败: {type(e).__name__}: {e}")
-            return self.EMPTY_MANIFEST.copy()
+            return self._empty_manifest()
     
+    def _replay_journal(self, data: dict[str, Any]) -> int:
+        """
+        将增量日志中的操作按序应用到清单字典上。
+        
+        Args:
+            data: 全量清单字典（就地修改）
+            
+        Returns:
+            成功回放的操作条数
+        """
+        if not self._journal_file.exists():
+            return 0
+
+        count = 0
+        try:
+            with open(self._journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        op = _orjson.loads(line) if _orjson is not None else json.loads(line)
+                    except ValueError:
+                        # 尾部半行（进程中断时残留）直接丢弃
+                        continue
+                    kind = op.get("op")
+                    mod_name = op.get("mod")
+                    if kind == "add" and mod_name:
+                        files = op.get("files") or []
+                        data["installed_mods"][mod_name] = {
+                            "files": files,
+                            "install_time": op.get("t", "")
+                        }
+                        for file_name in files:
+                            data["file_map"][file_name] = mod_name
+                        count += 1
+                    elif kind == "del" and mod_name:
+                        record = data["installed_mods"].pop(mod_name, None)
+                        if record:
+                            for file_name in record.get("files", []):
+                                if data["file_map"].get(file_name) == mod_name:
+                                    del data["file_map"][file_name]
+                        count += 1
+        except OSError as e:
+            log.warning(f"读取清单增量日志失败: {e}")
+
+        if count:
+            self._journal_ops = count
+        return count
+
+    def _append_journal(self, entry: dict[str, Any]) -> bool:
+        """
+        向增量日志追加一条操作记录；累计达到阈值时折叠为全量落盘。
+        
+        Args:
+            entry: 操作记录字典（op/mod/...）
+            
+        Returns:
+            是否持久化成功
+        """
+        try:
+            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            if _orjson is not None:
+                line = _orjson.dumps(entry)
+            else:
+                line = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+            with open(self._journal_file, "ab") as f:
+                f.write(line + b"\n")
+                f.flush()
+        except PermissionError as e:
+            log.warning(f"无法写入清单增量日志（权限不足）: {e}")
+            return False
+        except OSError as e:
+            log.warning(f"无法写入清单增量日志: {e}")
+            return False
+
+        self._journal_ops += 1
+        if self._journal_ops >= self.CHECKPOINT_EVERY:
+            return self.checkpoint()
+        return True
+
+    def checkpoint(self) -> bool:
+        """
+        将内存清单全量落盘并清空增量日志。
+        
+        Returns:
+            是否保存成功
+        """
+        success = self._save_manifest()
+        if success:
+            try:
+                self._journal_file.unlink(missing_ok=True)
+            except OSError as e:
+                log.warning(f"清空清单增量日志失败: {e}")
+            self._journal_ops = 0
+        return success
+
     def _save_manifest(self) -> bool:
         """
         将内存中的 self.manifest 持久化写入 manifest_file。
@@ -109,13 +244,12 @@ class ManifestManager:
             # 确保目录存在
             self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # 先写入临时文件
-            temp_file = self.manifest_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.manifest, f, indent=2, ensure_ascii=False)
-            
-            # 重命名为正式文件（原子操作）
-            temp_file.replace(self.manifest_file)
+            if _orjson is not None:
+                blob = _orjson.dumps(self.manifest, option=_orjson.OPT_INDENT_2)
+            else:
+                blob = json.dumps(self.manifest, indent=2, ensure_ascii=False).encode('utf-8')
+            # 原子写入（Linux 走 O_TMPFILE，其余平台临时文件 + 重命名）
+            atomic_write_bytes(self.manifest_file, blob)
             log.debug("清单已保存")
             return True
             
@@ -129,30 +263,32 @@ class ManifestManager:
             log.warning(f"无法保存清单文件: {type(e).__name__}: {e}")
             return False
     
-    def check_conflicts(self, mod_name: str, files_to_install: list[str]) -> list[dict[str, str]]:
+    def check_conflicts(self, mod_name: str, files_to_install: Iterable[str]) -> list[dict[str, str]]:
         """
         对待安装文件名列表进行所有权查询，返回与当前安装目标不一致的佔用记录。
         
         Args:
             mod_name: 待安装的语音包名称
-            files_to_install: 待安装的文件名列表
+            files_to_install: 待安装的文件名，可为任意可迭代对象（只遍历一次）
             
         Returns:
             冲突记录列表，每项包含 file, existing_mod, new_mod
         """
-        conflicts = []
         file_map = self.manifest.get("file_map", {})
-        
-        for file_name in files_to_install:
-            if file_name in file_map:
-                existing_mod = file_map[file_name]
-                if existing_mod != mod_name:
-                    conflicts.append({
-                        "file": file_name,
-                        "existing_mod": existing_mod,
-                        "new_mod": mod_name
-                    })
-        
+
+        # dict.keys() & set 在 C 层一次性完成哈希求交，交集（冲突项）
+        # 通常远小于安装清单，之后只遍历这一小撮
+        conflicting = file_map.keys() & set(files_to_install)
+        conflicts = [
+            {
+                "file": file_name,
+                "existing_mod": file_map[file_name],
+                "new_mod": mod_name
+            }
+            for file_name in conflicting
+            if file_map[file_name] != mod_name
+        ]
+
         if conflicts:
             log.info(f"检测到 {len(conflicts)} 个文件冲突")
         
@@ -170,16 +306,23 @@ class ManifestManager:
             是否记录成功
         """
         try:
+            install_time = datetime.now().isoformat()
             self.manifest["installed_mods"][mod_name] = {
                 "files": installed_files,
-                "install_time": datetime.now().isoformat()
+                "install_time": install_time
             }
             
-            # 更新文件名所有权映射（file_name -> mod_name）
+            # 更新文件名所有权映射（file_name -> mod_name）与反向索引
             for file_name in installed_files:
                 self.manifest["file_map"][file_name] = mod_name
+            self._mod_owned[mod_name] = set(installed_files)
             
-            success = self._save_manifest()
+            success = self._append_journal({
+                "op": "add",
+                "mod": mod_name,
+                "files": installed_files,
+                "t": install_time,
+            })
             if success:
                 log.info(f"已记录安装: {mod_name} ({len(installed_files)} 个文件)")
             return success
@@ -203,16 +346,19 @@ class ManifestManager:
             return True
         
         try:
-            files = self.manifest["installed_mods"][mod_name].get("files", [])
-            
+            # 反向索引直接给出该语音包佔有的文件集合；
             # 仅在所有权仍指向当前语音包时，移除 file_map 映射
-            for file_name in files:
-                if self.manifest["file_map"].get(file_name) == mod_name:
-                    del self.manifest["file_map"][file_name]
+            owned = self._mod_owned.pop(mod_name, None)
+            if owned is None:
+                owned = set(self.manifest["installed_mods"][mod_name].get("files", []))
+            file_map = self.manifest["file_map"]
+            for file_name in owned:
+                if file_map.get(file_name) == mod_name:
+                    del file_map[file_name]
             
             del self.manifest["installed_mods"][mod_name]
             
-            success = self._save_manifest()
+            success = self._append_journal({"op": "del", "mod": mod_name})
             if success:
                 log.info(f"已移除安装记录: {mod_name}")
             return success
@@ -228,8 +374,15 @@ class ManifestManager:
         Returns:
             是否清空成功
         """
-        self.manifest = self.EMPTY_MANIFEST.copy()
-        
+        self.manifest = self._empty_manifest()
+        self._mod_owned = {}
+        self._journal_ops = 0
+
+        try:
+            self._journal_file.unlink(missing_ok=True)
+        except OSError as e:
+            log.warning(f"删除清单增量日志失败: {e}")
+
         if self.manifest_file.exists():
             try:
                 self.manifest_file.unlink()
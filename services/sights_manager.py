@@ -22,17 +22,24 @@
 - 所有操作记录完整的错误上下文
 """
 import base64
+import binascii
 import os
+import re
 import platform
 import shutil
 import subprocess
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Any
 from utils.logger import get_logger
 
 log = get_logger(__name__)
 
+# 文件夹命名非法字符（Windows 保留字符），模组级预编译
+_ILLEGAL_NAME_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 class SightsManagerError(Exception):
     """炮镜管理器相关错误的基类。"""
@@ -380,7 +387,6 @@ class SightsManager:
             FileExistsError: 目标名称已存在
             OSError: 重命名操作失败
         """
-        import re
         usersights_dir = self._usersights_path
         if not usersights_dir or not usersights_dir.exists():
             raise ValueError("UserSights 路径未设置或不存在")
@@ -394,7 +400,7 @@ class SightsManager:
         if not new_name or len(new_name) > 255:
             raise ValueError("名称长度不合法")
 
-        if re.search(r'[<>:"/\\|?*]', new_name):
+        if _ILLEGAL_NAME_RE.search(new_name):
             raise ValueError('名称包含非法字符 (不能包含 < > : " / \\ | ? *)')
 
         if new_dir.exists():
@@ -435,22 +441,34 @@ class SightsManager:
             raise FileNotFoundError("炮镜文件夹不存在")
 
         data_url = str(data_url or "")
-        if ";base64," not in data_url:
+        marker = data_url.find(";base64,")
+        if marker < 0:
             raise ValueError("图片数据格式错误")
 
-        _prefix, b64 = data_url.split(";base64,", 1)
         try:
-            raw = base64.b64decode(b64)
-        except (ValueError, TypeError) as e:
+            # memoryview 切片直接定位 base64 尾部，省去 split 对多 MB 尾串的複製
+            buf = memoryview(data_url.encode("ascii"))[marker + len(";base64,"):]
+        except UnicodeEncodeError as e:
             raise ValueError(f"图片数据解析失败: {e}")
 
         dst = sight_dir / "preview.png"
+        tmp = dst.with_suffix(".tmp")
         try:
-            with open(dst, "wb") as f:
-                f.write(raw)
+            # buffering=0 直接取得 FileIO：每个解码块一次 write 系统
+            # 调用，不经 BufferedWriter 再複製一轮
+            with open(tmp, "wb", buffering=0) as f:
+                # 64KB（4 的整数倍）切片流式解码直写文件，
+                # 不再同时持有整段 base64 与整段原始字节
+                step = 1 << 16
+                for i in range(0, len(buf), step):
+                    f.write(binascii.a2b_base64(buf[i:i + step]))
+            tmp.replace(dst)
             self._cache = None
             log.info(f"已更新炮镜封面: {sight_name}")
             return True
+        except (binascii.Error, ValueError) as e:
+            tmp.unlink(missing_ok=True)
+            raise ValueError(f"图片数据解析失败: {e}")
         except PermissionError as e:
             raise SightsManagerError(f"封面更新失败（权限不足）: {e}")
         except OSError as e:
@@ -604,11 +622,11 @@ class SightsManager:
 
             try:
                 with zipfile.ZipFile(zip_path, "r") as zf:
-                    members = [m for m in zf.infolist() if not m.is_dir()]
-                    total = max(len(members), 1)
-                    extracted = 0
-
-                    for m in members:
+                    # 预检单线程完成：过滤、类型黑名单与路径校验（任一不合格即整体失败）
+                    jobs = []
+                    for m in zf.infolist():
+                        if m.is_dir():
+                            continue
                         filename = m.filename
                         if not filename or "__MACOSX" in filename or "desktop.ini" in filename.lower():
                             continue
@@ -623,6 +641,16 @@ class SightsManager:
                         if not _is_within(tmp_dir, target_path):
                             raise SightsImportError(f"压缩包路径不安全（路径遍历）: {filename}")
 
+                        jobs.append((m, target_path, filename))
+
+                    # 解压并行化：ZipFile.open 线程安全（共享句柄内部加锁），
+                    # inflate 与写盘可跨工作线程重叠
+                    total = max(len(jobs), 1)
+                    done = {"count": 0}
+                    done_lock = threading.Lock()
+
+                    def _extract_one(job):
+                        m, target_path, filename = job
                         try:
                             target_path.parent.mkdir(parents=True, exist_ok=True)
                             with zf.open(m, "r") as src, open(target_path, "wb") as dst:
@@ -632,10 +660,16 @@ class SightsManager:
                         except OSError as e:
                             raise SightsImportError(f"解压失败: {filename}: {e}")
 
-                        extracted += 1
                         if progress_callback:
-                            pct = 2 + int((extracted / total) * 90)
+                            with done_lock:
+                                done["count"] += 1
+                                count = done["count"]
+                            pct = 2 + int((count / total) * 90)
                             progress_callback(pct, f"解压中: {Path(filename).name}")
+
+                    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                        # list() 消费迭代器以传播工作线程中的异常
+                        list(pool.map(_extract_one, jobs))
                             
             except zipfile.BadZipFile as e:
                 raise SightsImportError(f"无效的 ZIP 文件: {e}")
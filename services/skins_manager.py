@@ -17,18 +17,47 @@
 - 所有操作记录完整的错误上下文
 """
 import base64
+import binascii
 import os
 import re
 import shutil
+import threading
 import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Callable, Any
 
 from utils.logger import get_logger
 
+# 可选解压后端：libarchive-c 的 C 层 inflate 会释放 GIL，
+# 解压大包时不会卡住 webview 主线程；未安装则全部走 zipfile
+try:
+    import libarchive
+except ImportError:
+    libarchive = None
+
+# 可选图片后端：设置封面时用 Pillow 缩图重编码，
+# 避免把数 MB 的原图原样存为封面；未安装则退回原样複製
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# 可选 JPEG 加速：simplejpeg 封装 libturbojpeg，JPEG 解码/编码比 Pillow
+# 快数倍且在 C 调用期间释放 GIL；未安装则 JPEG 与其他格式一样走 Pillow
+try:
+    import numpy
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 log = get_logger(__name__)
 
+# 文件夹命名非法字符（Windows 保留字符），模组级预编译
+_ILLEGAL_NAME_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 class SkinsManagerError(Exception):
     """涂装管理器相关错误的基类。"""
@@ -50,14 +79,22 @@ class SkinsManager:
     UserSkins 目录的资源管理器，封装扫描、导入与文件操作能力。
     
     属性:
-        _cache: 扫描结果缓存
+        _cache: 上次完整扫描结果缓存
+        _entry_cache: 按涂装目录 mtime_ns 键控的单项缓存
     """
-    
+
     def __init__(self):
         """
         初始化 SkinsManager。
         """
         self._cache: dict | None = None
+        # 涂装目录路径 -> (mtime_ns, 条目字典)；目录 mtime 未变的涂装
+        # 可跳过大小统计、预览图查找与 base64 编码
+        self._entry_cache: dict[str, tuple[int, dict]] = {}
+        # 磁盘剩余空间记忆槽：(目标路径, 时间戳, free 字节)
+        self._disk_free_memo: tuple[str, float, int] | None = None
+        # 白名单校验缓存：(ZIP 大小, 成员 CRC 异或摘要) -> 非法文件名列表
+        self._validate_cache: dict[tuple[int, int], list[str]] = {}
 
     def get_userskins_dir(self, game_path: str | Path) -> Path:
         """
@@ -101,14 +138,39 @@ class SkinsManager:
 
         items = []
         try:
-            entries = sorted([e for e in userskins_dir.iterdir() if e.is_dir()], key=lambda p: p.name.lower())
-            
+            # 点开头目录（含崩溃残留的 .__tmp_extract__*）不进列表，
+            # 也不为其付出大小统计与预览图查找的开销。
+            # scandir 的 DirEntry 自带 name/path 与（Windows 上免费的）
+            # stat，整个循环不再为每个涂装分配 Path 对象
+            with os.scandir(userskins_dir) as it:
+                entries = sorted(
+                    (e for e in it if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")),
+                    key=lambda e: e.name.lower(),
+                )
+            self._cleanup_stale_tmp_dirs(userskins_dir)
+
+            new_entry_cache: dict[str, tuple[int, dict]] = {}
             for entry in entries:
-                size_bytes, file_count = self._get_dir_size_and_count_fast(entry)
-                preview_path = self._find_preview_image(entry)
+                key = entry.path
+                try:
+                    entry_mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    entry_mtime_ns = -1
+
+                # 目录 mtime 未变的涂装直接複用上次的条目，
+                # 跳过大小统计、预览图查找与封面编码
+                if not skip_covers and entry_mtime_ns >= 0:
+                    cached = self._entry_cache.get(key)
+                    if cached is not None and cached[0] == entry_mtime_ns:
+                        items.append(cached[1])
+                        new_entry_cache[key] = cached
+                        continue
+
+                size_bytes, file_count = self._get_dir_size_and_count_fast(entry.path)
+                preview_path = self._find_preview_image(entry.path)
                 cover_url = ""
                 cover_is_default = False
-                
+
                 if not skip_covers:
                     if preview_path:
                         cover_url = self._to_data_url(preview_path)
@@ -116,15 +178,22 @@ class SkinsManager:
                         cover_url = self._to_data_url(default_cover_path)
                         cover_is_default = True
 
-                items.append({
+                item = {
                     "name": entry.name,
-                    "path": str(entry),
+                    "path": key,
                     "size_bytes": size_bytes,
                     "file_count": file_count,
                     "preview_path": str(preview_path) if preview_path else "",
                     "cover_url": cover_url,
                     "cover_is_default": cover_is_default,
-                })
+                }
+                items.append(item)
+                if not skip_covers and entry_mtime_ns >= 0:
+                    new_entry_cache[key] = (entry_mtime_ns, item)
+
+            if not skip_covers:
+                # 整体替换可顺带淘汰已删除涂装的残留键
+                self._entry_cache = new_entry_cache
         except Exception as e:
             log.error(f"扫描涂装失败: {e}")
 
@@ -139,19 +208,67 @@ class SkinsManager:
             self._cache = result
         return result
 
-    def _get_dir_size_and_count_fast(self, dir_path: Path) -> tuple[int, int]:
+    def _cleanup_stale_tmp_dirs(self, userskins_dir: Path) -> None:
+        """
+        顺带清理导入崩溃残留的 .__tmp_extract__* 目录（超过 1 小时视为废弃）。
+
+        Args:
+            userskins_dir: UserSkins 目录路径
+        """
+        cutoff = time.time() - 3600
+        try:
+            with os.scandir(userskins_dir) as it:
+                for entry in it:
+                    if not entry.name.startswith(".__tmp_extract__"):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                            shutil.rmtree(entry.path, ignore_errors=True)
+                            log.info(f"已清理残留的临时解压目录: {entry.name}")
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+    def _get_dir_size_and_count_fast(self, dir_path: str | Path) -> tuple[int, int]:
         """优化版统计：限制遍历文件数量，防止异常庞大的项目造成挂起。"""
+        # 单个涂装文件夹超过 200 个文件时停止统计详细信息以保性能
+        return self._scan_dir_stats(dir_path, limit=200)
+
+    def _scan_dir_stats(self, dir_path: str | Path, limit: int | None = None) -> tuple[int, int]:
+        """
+        用 os.scandir 递归统计目录大小与文件数。
+
+        DirEntry 複用 readdir 带回的类型与（Windows 上的）stat 信息，
+        相比 os.walk + Path.stat 每个文件省去一次独立的 stat() 系统调用。
+
+        Args:
+            dir_path: 目录路径
+            limit: 文件计数上限，达到后提前终止；None 表示不限
+
+        Returns:
+            (总大小字节数, 文件数量)
+        """
         total = 0
         count = 0
-        try:
-            for entry in dir_path.rglob("*"):
-                if count > 200: # 单个涂装文件夹如果超过200个文件，停止统计详细信息以保性能
-                    break
-                if entry.is_file():
-                    total += entry.stat().st_size
-                    count += 1
-        except Exception:
-            pass
+        stack = [str(dir_path)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                total += entry.stat(follow_symlinks=False).st_size
+                                count += 1
+                                if limit is not None and count >= limit:
+                                    return total, count
+                        except OSError:
+                            pass
+            except (OSError, PermissionError) as e:
+                log.warning(f"统计目录大小失败 {current}: {e}")
         return total, count
 
     def import_skin_zip(
@@ -188,115 +305,135 @@ class SkinsManager:
         # 仅允许导入涂装相关文件扩展名
         ALLOWED_EXTENSIONS = {'.dds', '.blk', '.tga'}
         invalid_files = []
-        
+
+        # 只打开一次 ZIP：白名单校验与后续解压共享同一 ZipFile
+        # 与中央目录，免去重开与两次重复扫描
         try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                for member in zf.infolist():
+            zf = zipfile.ZipFile(zip_path, 'r')
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"无效的 ZIP 文件: {e}")
+
+        with zf:
+            members = zf.infolist()
+
+            # 以 (ZIP 大小, 成员 CRC 异或摘要) 为键缓存校验结果：
+            # 重复导入同一压缩包（如复盖重试）时跳过逐条后缀检查
+            digest = 0
+            for m in members:
+                digest ^= m.CRC
+            try:
+                cache_key = (zip_path.stat().st_size, digest)
+            except OSError:
+                cache_key = None
+
+            cached_invalid = self._validate_cache.get(cache_key) if cache_key else None
+            if cached_invalid is not None:
+                invalid_files = list(cached_invalid)
+            else:
+                for member in members:
                     if member.is_dir():
                         continue
                     filename = member.filename
                     if '__MACOSX' in filename or 'desktop.ini' in filename.lower():
                         continue
-                    
+
                     ext = Path(filename).suffix.lower()
                     if ext and ext not in ALLOWED_EXTENSIONS:
                         invalid_files.append(filename)
-        except zipfile.BadZipFile as e:
-            raise ValueError(f"无效的 ZIP 文件: {e}")
-        
-        if invalid_files:
-            file_list = '\n'.join(f'  • {f}' for f in invalid_files[:10])
-            if len(invalid_files) > 10:
-                file_list += f'\n  ... 还有 {len(invalid_files) - 10} 个文件'
-            
-            raise ValueError(
-                f"❌ 检测到不允许的文件类型！\n\n"
-                f"涂装包只允许包含以下文件类型：\n"
-                f"  ✓ .dds (纹理文件)\n"
-                f"  ✓ .blk (配置文件)\n"
-                f"  ✓ .tga (纹理文件)\n\n"
-                f"但在压缩包中发现了以下非法文件：\n{file_list}\n\n"
-                f"💡 提示：请检查压缩包内容，确保只包含涂装相关文件。"
-            )
-
-        userskins_dir = self.get_userskins_dir(game_path)
-        try:
-            userskins_dir.mkdir(parents=True, exist_ok=True)
-        except PermissionError as e:
-            raise SkinsImportError(f"无法创建 UserSkins 目录（权限不足）: {e}")
-        except OSError as e:
-            raise SkinsImportError(f"无法创建 UserSkins 目录: {e}")
+                if cache_key is not None:
+                    self._validate_cache[cache_key] = list(invalid_files)
 
-        target_name = zip_path.stem
-        target_dir = userskins_dir / target_name
-        if target_dir.exists():
-            if not overwrite:
-                raise FileExistsError(f"已存在同名涂装文件夹: {target_name}")
+            if invalid_files:
+                file_list = '\n'.join(f'  • {f}' for f in invalid_files[:10])
+                if len(invalid_files) > 10:
+                    file_list += f'\n  ... 还有 {len(invalid_files) - 10} 个文件'
+            
+                raise ValueError(
+                    f"❌ 检测到不允许的文件类型！\n\n"
+                    f"涂装包只允许包含以下文件类型：\n"
+                    f"  ✓ .dds (纹理文件)\n"
+                    f"  ✓ .blk (配置文件)\n"
+                    f"  ✓ .tga (纹理文件)\n\n"
+                    f"但在压缩包中发现了以下非法文件：\n{file_list}\n\n"
+                    f"💡 提示：请检查压缩包内容，确保只包含涂装相关文件。"
+                )
+
+            userskins_dir = self.get_userskins_dir(game_path)
             try:
-                shutil.rmtree(target_dir)
+                userskins_dir.mkdir(parents=True, exist_ok=True)
             except PermissionError as e:
-                raise SkinsImportError(f"无法移除现有文件夹（权限不足）: {e}")
+                raise SkinsImportError(f"无法创建 UserSkins 目录（权限不足）: {e}")
             except OSError as e:
-                raise SkinsImportError(f"无法移除现有文件夹: {e}")
+                raise SkinsImportError(f"无法创建 UserSkins 目录: {e}")
+
+            target_name = zip_path.stem
+            target_dir = userskins_dir / target_name
+            if target_dir.exists():
+                if not overwrite:
+                    raise FileExistsError(f"已存在同名涂装文件夹: {target_name}")
+                try:
+                    shutil.rmtree(target_dir)
+                except PermissionError as e:
+                    raise SkinsImportError(f"无法移除现有文件夹（权限不足）: {e}")
+                except OSError as e:
+                    raise SkinsImportError(f"无法移除现有文件夹: {e}")
 
-        self._check_disk_space(zip_path, userskins_dir)
+            self._check_disk_space(zip_path, userskins_dir)
 
-        tmp_dir = userskins_dir / f".__tmp_extract__{target_name}"
-        if tmp_dir.exists():
+            tmp_dir = userskins_dir / f".__tmp_extract__{target_name}"
+            if tmp_dir.exists():
+                try:
+                    shutil.rmtree(tmp_dir)
+                except OSError as e:
+                    log.error(f"清理临时目录失败: {e}")
+        
             try:
-                shutil.rmtree(tmp_dir)
+                tmp_dir.mkdir(parents=True, exist_ok=True)
             except OSError as e:
-                log.error(f"清理临时目录失败: {e}")
-        
-        try:
-            tmp_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise SkinsImportError(f"无法创建临时目录: {e}")
+                raise SkinsImportError(f"无法创建临时目录: {e}")
 
-        try:
-            if progress_callback:
-                progress_callback(1, f"准备解压到 UserSkins: {zip_path.name}")
-
-            self._extract_zip_safely(
-                zip_path, tmp_dir, 
-                progress_callback=progress_callback, 
-                base_progress=2, share_progress=85
-            )
-
-            top_level = [
-                p for p in tmp_dir.iterdir() 
-                if p.name not in ("__MACOSX",) and p.name != "desktop.ini"
-            ]
-            
-            if len(top_level) == 1 and top_level[0].is_dir():
-                inner_dir = top_level[0]
+            try:
+                if progress_callback:
+                    progress_callback(1, f"准备解压到 UserSkins: {zip_path.name}")
+
+                self._extract_zip_safely(
+                    zip_path, tmp_dir,
+                    progress_callback=progress_callback,
+                    base_progress=2, share_progress=85,
+                    zf=zf, members=members,
+                )
+
+                top_level = [
+                    p for p in tmp_dir.iterdir()
+                    if p.name not in ("__MACOSX",) and p.name != "desktop.ini"
+                ]
+
+                # 暂存目录与目标同卷，整理只需一次目录重命名：
+                # 单顶层目录时直接晋升内层目录，否则晋升暂存目录本身，
+                # 取代逐条 _move_tree 的 N 次 rename
                 try:
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    self._move_tree(inner_dir, target_dir)
+                    if len(top_level) == 1 and top_level[0].is_dir():
+                        os.rename(top_level[0], target_dir)
+                    else:
+                        os.rename(tmp_dir, target_dir)
                 except OSError as e:
                     raise SkinsImportError(f"整理文件失败: {e}")
-            else:
+
+                if progress_callback:
+                    progress_callback(98, "完成整理")
+            finally:
+                # 清理临时目录
                 try:
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    for child in top_level:
-                        self._move_tree(child, target_dir / child.name)
+                    if tmp_dir.exists():
+                        shutil.rmtree(tmp_dir)
                 except OSError as e:
-                    raise SkinsImportError(f"整理文件失败: {e}")
-
-            if progress_callback:
-                progress_callback(98, "完成整理")
-        finally:
-            # 清理临时目录
-            try:
-                if tmp_dir.exists():
-                    shutil.rmtree(tmp_dir)
-            except OSError as e:
-                log.error(f"清理临时目录失败: {e}")
+                    log.error(f"清理临时目录失败: {e}")
 
         if progress_callback:
             progress_callback(100, "导入完成")
 
         self._cache = None
+        self._entry_cache.pop(str(target_dir), None)
         log.info(f"涂装导入成功: {target_dir}")
         return {"ok": True, "target_dir": str(target_dir)}
 
@@ -328,7 +465,7 @@ class SkinsManager:
         if not new_name or len(new_name) > 255:
             raise ValueError("名称长度不合法")
         
-        if re.search(r'[<>:"/\\|?*]', new_name):
+        if _ILLEGAL_NAME_RE.search(new_name):
             raise ValueError('名称包含非法字符 (不能包含 < > : " / \\ | ? *)')
 
         if new_dir.exists():
@@ -337,6 +474,8 @@ class SkinsManager:
         try:
             old_dir.rename(new_dir)
             self._cache = None
+            self._entry_cache.pop(str(old_dir), None)
+            self._entry_cache.pop(str(new_dir), None)
             log.info(f"已重命名涂装: {old_name} -> {new_name}")
             return True
         except PermissionError as e:
@@ -369,12 +508,42 @@ class SkinsManager:
         if not os.path.exists(img_path):
             raise FileNotFoundError("图片文件不存在")
         
-        # 统一封面文件名为 preview.png
-        dst = skin_dir / "preview.png"
-        
         try:
-            shutil.copy2(img_path, dst)
+            raw = None
+            if simplejpeg is not None and Image is not None:
+                raw = Path(img_path).read_bytes()
+            if raw is not None and raw.startswith(b"\xff\xd8\xff"):
+                # JPEG 来源走 libturbojpeg 解码/编码，Pillow 仅负责缩图
+                arr = simplejpeg.decode_jpeg(raw, colorspace="RGB")
+                im = Image.fromarray(arr)
+                im.thumbnail((512, 512), Image.LANCZOS)
+                dst = skin_dir / "preview.jpg"
+                dst.write_bytes(simplejpeg.encode_jpeg(
+                    numpy.ascontiguousarray(im), quality=82, colorspace="RGB"))
+            elif Image is not None:
+                # 解码一次并缩到 512px 长边，存为 WEBP：
+                # 封面磁盘佔用与列表扫描时的读取量都远小于原图
+                dst = skin_dir / "preview.webp"
+                with Image.open(img_path) as im:
+                    if im.mode not in ("RGB", "RGBA"):
+                        im = im.convert("RGBA")
+                    im.thumbnail((512, 512), Image.LANCZOS)
+                    im.save(dst, format="WEBP", quality=82, method=4)
+            else:
+                # 统一封面文件名为 preview.png；copyfile 在 Linux 上走
+                # copy_file_range 零拷贝，且不像 copy2 额外做 chmod/utime
+                dst = skin_dir / "preview.png"
+                shutil.copyfile(img_path, dst)
+            # 清理旧格式封面，避免 _find_preview_image 命中过期文件
+            for stale in skin_dir.glob("preview.*"):
+                if stale != dst:
+                    try:
+                        stale.unlink()
+                    except OSError:
+                        pass
             self._cache = None
+            # 原地复写封面不会改变目录 mtime，需显式失效该涂装的条目缓存
+            self._entry_cache.pop(str(skin_dir), None)
             log.info(f"已更新涂装封面: {skin_name}")
             return True
         except PermissionError as e:
@@ -406,29 +575,51 @@ class SkinsManager:
             raise FileNotFoundError("涂装文件夹不存在")
 
         data_url = str(data_url or "")
-        if ";base64," not in data_url:
+        marker = data_url.find(";base64,")
+        if marker < 0:
             raise ValueError("图片数据格式错误")
 
-        _prefix, b64 = data_url.split(";base64,", 1)
         try:
-            raw = base64.b64decode(b64)
-        except (ValueError, TypeError) as e:
+            # memoryview 切片直接定位 base64 尾部，省去 split 对多 MB 尾串的複製
+            buf = memoryview(data_url.encode("ascii"))[marker + len(";base64,"):]
+        except UnicodeEncodeError as e:
             raise ValueError(f"图片数据解析失败: {e}")
 
         dst = skin_dir / "preview.png"
+        tmp = dst.with_suffix(".tmp")
         try:
-            with open(dst, "wb") as f:
-                f.write(raw)
+            # buffering=0 直接取得 FileIO：每个解码块一次 write 系统
+            # 调用，不经 BufferedWriter 再複製一轮
+            with open(tmp, "wb", buffering=0) as f:
+                # 64KB（4 的整数倍）切片流式解码直写文件，
+                # 不再同时持有整段 base64 与整段原始字节
+                step = 1 << 16
+                for i in range(0, len(buf), step):
+                    f.write(binascii.a2b_base64(buf[i:i + step]))
+            tmp.replace(dst)
+            # 清理旧格式封面（update_skin_cover 可能留下 preview.jpg/webp，
+            # 其扩展名在 _find_preview_image 中优先级更高，会盖过新封面）
+            for stale in skin_dir.glob("preview.*"):
+                if stale != dst:
+                    try:
+                        stale.unlink()
+                    except OSError:
+                        pass
             self._cache = None
+            # 原地复写封面不会改变目录 mtime，需显式失效该涂装的条目缓存
+            self._entry_cache.pop(str(skin_dir), None)
             log.info(f"已更新涂装封面: {skin_name}")
             return True
+        except (binascii.Error, ValueError) as e:
+            tmp.unlink(missing_ok=True)
+            raise ValueError(f"图片数据解析失败: {e}")
         except PermissionError as e:
             raise SkinsManagerError(f"封面更新失败（权限不足）: {e}")
         except OSError as e:
             raise SkinsManagerError(f"封面更新失败: {e}")
 
 
-    def _get_dir_size_and_count(self, dir_path: Path) -> tuple[int, int]:
+    def _get_dir_size_and_count(self, dir_path: str | Path) -> tuple[int, int]:
         """
         统计目录内所有文件的总大小与文件数量。
         
@@ -438,42 +629,82 @@ class SkinsManager:
         Returns:
             (总大小字节数, 文件数量)
         """
-        total = 0
-        count = 0
-        try:
-            for root, _dirs, files in os.walk(dir_path):
-                for f in files:
-                    fp = Path(root) / f
-                    try:
-                        total += fp.stat().st_size
-                    except (OSError, PermissionError):
-                        pass
-                    count += 1
-        except (OSError, PermissionError) as e:
-            log.warning(f"统计目录大小失败 {dir_path}: {e}")
-        return total, count
+        return self._scan_dir_stats(dir_path)
+
+    # 预览图副档名优先级（值越小越优先）
+    _PREVIEW_EXTS = {".jpg": 0, ".jpeg": 1, ".png": 2, ".webp": 3}
 
-    def _find_preview_image(self, dir_path: Path) -> Path | None:
+    def _find_preview_image(self, dir_path: str | Path) -> Path | None:
         """
         在涂装目录中查找可用的预览图文件。
-        
+
+        单次 os.scandir 配合优先级表（preview.* > icon.* > 其余图片）
+        取代原先六个 glob 模式各自的重复目录扫描。
+
         Args:
             dir_path: 涂装目录路径
-            
+
         Returns:
             预览图路径或 None
         """
-        candidates = []
-        for pat in ("preview.*", "icon.*", "*.jpg", "*.jpeg", "*.png", "*.webp"):
-            try:
-                candidates.extend(dir_path.glob(pat))
-            except OSError:
-                continue
+        best = None
+        best_rank = (3, 9)
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                    except OSError:
+                        continue
+                    stem, ext = os.path.splitext(entry.name.lower())
+                    ext_rank = self._PREVIEW_EXTS.get(ext)
+                    if ext_rank is None:
+                        continue
+                    name_rank = 0 if stem == "preview" else 1 if stem == "icon" else 2
+                    rank = (name_rank, ext_rank)
+                    if rank < best_rank:
+                        best = Path(entry.path)
+                        best_rank = rank
+                        if rank == (0, 0):
+                            break
+        except OSError:
+            return None
+        return best
+
+    def get_cover(
+        self,
+        game_path: str | Path,
+        skin_name: str,
+        default_cover_path: Path | None = None,
+    ) -> str:
+        """
+        按需编码单个涂装封面为 data URL（懒加载入口）。
+
+        列表扫描只带 preview_path，前端在卡片滚入视口时才调用本方法，
+        从未展示的涂装不做 base64 编码。
+
+        Args:
+            game_path: 游戏安装路径
+            skin_name: 涂装文件夹名（来自前端，须防路径穿越）
+            default_cover_path: 无预览图时的默认封面
 
-        for p in candidates:
-            if p.is_file() and p.suffix.lower() in (".jpg", ".jpeg", ".png", ".webp"):
-                return p
-        return None
+        Returns:
+            data URL 字符串，失败或名称非法时返回空字符串
+        """
+        if "/" in skin_name or "\\" in skin_name or ".." in skin_name:
+            return ""
+        skin_dir = self.get_userskins_dir(game_path) / skin_name
+        try:
+            if skin_dir.is_dir():
+                preview = self._find_preview_image(skin_dir)
+                if preview:
+                    return self._to_data_url(preview)
+            if default_cover_path and default_cover_path.exists():
+                return self._to_data_url(default_cover_path)
+        except Exception as e:
+            log.error(f"编码涂装封面失败 {skin_name}: {e}")
+        return ""
 
     def _to_data_url(self, file_path: Path) -> str:
         """
@@ -512,11 +743,16 @@ class SkinsManager:
             estimated = zip_size * 3
             required = estimated * 2
 
-            drive = Path(target_dir).anchor
-            if not drive:
-                drive = str(target_dir)
-
-            total, used, free = shutil.disk_usage(drive)
+            # disk_usage 可直接作用于目录（statvfs/GetDiskFreeSpaceExW），
+            # 无需折回盘符；1 秒 TTL 记忆避免批量导入反复 statfs
+            now = time.monotonic()
+            key = str(target_dir)
+            memo = self._disk_free_memo
+            if memo is not None and memo[0] == key and (now - memo[1]) < 1.0:
+                free = memo[2]
+            else:
+                free = shutil.disk_usage(key).free
+                self._disk_free_memo = (key, now, free)
             if free < required:
                 free_mb = free / (1024 * 1024)
                 req_mb = required / (1024 * 1024)
@@ -527,86 +763,72 @@ class SkinsManager:
             log.warning(f"磁盘空间检查失败（已跳过）: {e}")
 
     def _extract_zip_safely(
-        self, 
-        zip_path: Path, 
-        target_dir: Path, 
-        progress_callback: Callable[[int, str], None] | None = None, 
-        base_progress: int = 0, 
-        share_progress: int = 100
+        self,
+        zip_path: Path,
+        target_dir: Path,
+        progress_callback: Callable[[int, str], None] | None = None,
+        base_progress: int = 0,
+        share_progress: int = 100,
+        zf: zipfile.ZipFile | None = None,
+        members: list[zipfile.ZipInfo] | None = None,
     ) -> None:
         """
         将 ZIP 内容解压到临时目录，并执行路径边界校验与进度回调更新。
-        
+
         Args:
             zip_path: ZIP 文件路径
             target_dir: 目标目录
             progress_callback: 进度回调函数
             base_progress: 基础进度百分比
             share_progress: 分配的进度百分比范围
-            
+            zf: 调用方已打开的 ZipFile，複用可免去重开与中央目录重扫
+            members: 预先取得的 infolist，配合 zf 使用
+
         Raises:
             SkinsImportError: 解压过程失败
         """
         target_root = Path(target_dir).resolve()
-        
-        try:
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                file_list = zf.infolist()
-                total_files = len(file_list)
-                last_update = 0.0
-                extracted_bytes = 0
-                total_bytes = 0
-
-                if total_files > 0:
-                    for m in file_list:
-                        if m.is_dir():
-                            continue
-                        name = m.filename
-                        if "__MACOSX" in name or "desktop.ini" in name:
-                            continue
-                        try:
-                            total_bytes += int(getattr(m, "file_size", 0) or 0)
-                        except (ValueError, TypeError):
-                            pass
-
-                for idx, member in enumerate(file_list):
-                    if idx % 50 == 0:
-                        time.sleep(0.001)
+        # 前缀串只算一次，成员循环里做纯字节比对
+        target_root_str = str(target_root)
+        target_root_prefix = target_root_str + os.sep
+
+        if zf is not None and members is None:
+            members = zf.infolist()
+
+        if libarchive is not None and self._extract_with_libarchive(
+            zip_path, target_dir, target_root,
+            progress_callback=progress_callback,
+            base_progress=base_progress, share_progress=share_progress,
+            names=[m.filename for m in members] if members is not None else None,
+        ):
+            return
 
-                    # 处理文件名编码
-                    try:
-                        filename = member.filename.encode("cp437").decode("utf-8")
-                    except (UnicodeDecodeError, UnicodeEncodeError):
+        try:
+            with (zipfile.ZipFile(zip_path, "r") if zf is None else nullcontext(zf)) as zf:
+                if members is None:
+                    members = zf.infolist()
+                # 预检单线程完成：文件名修复、过滤与路径安全校验，产出待解压清单
+                jobs = []
+                for member in members:
+                    # 处理文件名编码：带 UTF-8 标志位（0x800）的条目 zipfile
+                    # 已正确解码，纯 ASCII 名也无需修复；只有无标志的
+                    # 非 ASCII 名才被按 cp437 解出，需要重解为 utf-8/gbk
+                    filename = member.filename
+                    if not (member.flag_bits & 0x800) and not filename.isascii():
                         try:
-                            filename = member.filename.encode("cp437").decode("gbk")
+                            filename = filename.encode("cp437").decode("utf-8")
                         except (UnicodeDecodeError, UnicodeEncodeError):
-                            filename = member.filename
+                            try:
+                                filename = filename.encode("cp437").decode("gbk")
+                            except (UnicodeDecodeError, UnicodeEncodeError):
+                                filename = member.filename
 
                     if "__MACOSX" in filename or "desktop.ini" in filename:
                         continue
 
-                    # 更新进度
-                    now = time.monotonic()
-                    should_push = (idx == 0) or (idx % 10 == 0) or (idx == total_files - 1)
-                    if progress_callback and total_files > 0 and should_push and (now - last_update) >= 0.05:
-                        ratio = idx / total_files
-                        current_percent = base_progress + ratio * share_progress
-                        fname = filename
-                        if len(fname) > 25:
-                            fname = "..." + fname[-25:]
-                        try:
-                            progress_callback(int(current_percent), f"解压中: {fname}")
-                        except Exception:
-                            pass
-                        last_update = now
-
-                    # 路径安全校验
-                    full_target_path = (target_dir / filename).resolve()
-                    try:
-                        is_inside = os.path.commonpath([str(full_target_path), str(target_root)]) == str(target_root)
-                    except ValueError:
-                        is_inside = False
-                    if not is_inside:
+                    # 路径安全校验：前缀比对取代 commonpath 的逐级拆分
+                    fp = str((target_dir / filename).resolve())
+                    if fp != target_root_str and not fp.startswith(target_root_prefix):
                         log.warning(f"拦截恶意路径穿越文件: {filename}")
                         continue
 
@@ -618,73 +840,170 @@ class SkinsManager:
                             log.warning(f"创建目录失败 {filename}: {e}")
                         continue
 
+                    jobs.append((member, target_path, filename))
+
+                # 主线程一次性建好全部目标目录，工作线程不再各自 mkdir
+                for parent in {tp.parent for _m, tp, _f in jobs}:
                     try:
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        with zf.open(member) as source, open(target_path, "wb") as target:
-                            while True:
-                                chunk = source.read(8192)
-                                if not chunk:
-                                    break
-                                target.write(chunk)
-                                if total_bytes > 0:
-                                    extracted_bytes += len(chunk)
-
-                                now = time.monotonic()
-                                if progress_callback and total_files > 0 and (now - last_update) >= 0.2:
-                                    if total_bytes > 0:
-                                        ratio = extracted_bytes / total_bytes
-                                    else:
-                                        ratio = idx / total_files
-                                    current_percent = base_progress + ratio * share_progress
-                                    fname = filename
-                                    if len(fname) > 25:
-                                        fname = "..." + fname[-25:]
-                                    try:
-                                        progress_callback(int(current_percent), f"解压中: {fname}")
-                                    except Exception:
-                                        pass
-                                    last_update = now
+                        parent.mkdir(parents=True, exist_ok=True)
+                    except OSError as e:
+                        log.warning(f"创建目录失败 {parent}: {e}")
+
+                # 解压并行化：每线程持有独立的 ZipFile 句柄（ZipInfo 可跨
+                # 句柄複用），读盘与 inflate 真正并行而非在共享句柄的内部
+                # 锁上串行；1 MiB 大块拷贝减少 Python 层循环次数
+                total_jobs = max(len(jobs), 1)
+                done = {"count": 0}
+                done_lock = threading.Lock()
+                last_update = [0.0]
+                last_percent = [-1]
+                tls = threading.local()
+                side_handles = []
+
+                def _thread_zf():
+                    z = getattr(tls, "zf", None)
+                    if z is None:
+                        z = zipfile.ZipFile(zip_path, "r")
+                        tls.zf = z
+                        with done_lock:
+                            side_handles.append(z)
+                    return z
+
+                def _extract_one(job):
+                    member, target_path, filename = job
+                    try:
+                        source_zf = _thread_zf()
+                        with source_zf.open(member) as source, open(target_path, "wb") as target:
+                            shutil.copyfileobj(source, target, length=1 << 20)
                     except PermissionError as e:
                         raise SkinsImportError(f"解压文件失败（权限不足）: {filename}: {e}")
                     except OSError as e:
                         raise SkinsImportError(f"解压文件失败: {filename}: {e}")
-                        
+
+                    if not progress_callback:
+                        return
+                    # 进度只在文件边界上报，且 100ms 节流 + 整数百分比去重：
+                    # 每次回调都要跨线程进 JS 桥，重复百分比纯属浪费
+                    with done_lock:
+                        done["count"] += 1
+                        now = time.monotonic()
+                        is_final = done["count"] == total_jobs
+                        if not is_final and (now - last_update[0]) < 0.1:
+                            return
+                        current_percent = int(
+                            base_progress + done["count"] / total_jobs * share_progress
+                        )
+                        if not is_final and current_percent == last_percent[0]:
+                            return
+                        last_update[0] = now
+                        last_percent[0] = current_percent
+                    fname = filename
+                    if len(fname) > 25:
+                        fname = "..." + fname[-25:]
+                    try:
+                        progress_callback(current_percent, f"解压中: {fname}")
+                    except Exception:
+                        pass
+
+                try:
+                    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                        # list() 消费迭代器以传播工作线程中的异常
+                        list(pool.map(_extract_one, jobs))
+                finally:
+                    for z in side_handles:
+                        try:
+                            z.close()
+                        except OSError:
+                            pass
+
         except zipfile.BadZipFile as e:
             raise SkinsImportError(f"无效的 ZIP 文件: {e}")
         except zipfile.LargeZipFile as e:
             raise SkinsImportError(f"ZIP 文件过大: {e}")
 
-    def _move_tree(self, src: Path, dst: Path) -> None:
-        """
-        将文件或目录从 src 移动到 dst，并在目标已存在时做合併式移动。
-        
-        Args:
-            src: 源路径
-            dst: 目标路径
+    def _extract_with_libarchive(
+        self,
+        zip_path: Path,
+        target_dir: Path,
+        target_root: Path,
+        progress_callback: Callable[[int, str], None] | None = None,
+        base_progress: int = 0,
+        share_progress: int = 100,
+        names: list[str] | None = None,
+    ) -> bool:
         """
-        if src.is_dir():
-            if dst.exists():
-                for child in src.iterdir():
-                    self._move_tree(child, dst / child.name)
-                try:
-                    src.rmdir()
-                except OSError:
-                    pass
-                return
+        用 libarchive 解压（C 层 inflate 期间释放 GIL）。
 
+        仅当全部条目名为 ASCII 时启用——非 ASCII 条目需要 zipfile 路径上的
+        cp437→utf-8/gbk 修复。返回 False 表示调用方应回退 zipfile 实现。
+        调用方已持有条目名列表时经 names 传入，免去一次 ZIP 重开。
+        """
+        if names is None:
             try:
-                shutil.move(str(src), str(dst))
+                with zipfile.ZipFile(zip_path, "r") as zf:
+                    names = zf.namelist()
+            except Exception:
+                return False
+        if any(not n.isascii() for n in names):
+            return False
+        total = max(len(names), 1)
+        target_root_str = str(target_root)
+        target_root_prefix = target_root_str + os.sep
+
+        # 按唯一父目录一次性建好目标目录树，流式循环内不再逐文件 mkdir；
+        # 只预建通过路径穿越校验的目录
+        pre_dirs = set()
+        for n in names:
+            if "__MACOSX" in n or "desktop.ini" in n:
+                continue
+            p = target_dir / n
+            d = p if n.endswith("/") else p.parent
+            fp = str(d.resolve())
+            if fp == target_root_str or fp.startswith(target_root_prefix):
+                pre_dirs.add(d)
+        for d in pre_dirs:
+            try:
+                d.mkdir(parents=True, exist_ok=True)
             except OSError as e:
-                log.error(f"移动目录失败 {src}: {e}")
-            return
+                log.warning(f"创建目录失败 {d}: {e}")
 
         try:
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            if dst.exists():
-                try:
-                    dst.unlink()
-                except OSError:
-                    pass
-            shutil.move(str(src), str(dst))
-        except OSError as e:
-            log.error(f"移动文件失败 {src}: {e}")
+            idx = 0
+            last_update = 0.0
+            with libarchive.file_reader(str(zip_path)) as archive:
+                for entry in archive:
+                    idx += 1
+                    name = str(entry.pathname)
+                    if "__MACOSX" in name or "desktop.ini" in name:
+                        continue
+
+                    # 路径安全校验（与 zipfile 路径相同的前缀比对）
+                    fp = str((target_dir / name).resolve())
+                    if fp != target_root_str and not fp.startswith(target_root_prefix):
+                        log.warning(f"拦截恶意路径穿越文件: {name}")
+                        continue
+
+                    target_path = target_dir / name
+                    if entry.isdir:
+                        # 目录已在预建阶段创建
+                        continue
+
+                    with open(target_path, "wb") as out:
+                        for block in entry.get_blocks():
+                            out.write(block)
+
+                    now = time.monotonic()
+                    if progress_callback and (now - last_update) >= 0.2:
+                        ratio = idx / total
+                        current_percent = base_progress + ratio * share_progress
+                        fname = name if len(name) <= 25 else "..." + name[-25:]
+                        try:
+                            progress_callback(int(current_percent), f"解压中: {fname}")
+                        except Exception:
+                            pass
+                        last_update = now
+            return True
+        except Exception as e:
+            log.warning(f"libarchive 解压失败，回退 zipfile: {e}")
+            return False
+
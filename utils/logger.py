@@ -12,36 +12,70 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
 import sys
 import threading
-import traceback
 from collections.abc import Callable
-from contextlib import contextmanager
-from functools import wraps
-from logging.handlers import RotatingFileHandler
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Any, TypeVar, ParamSpec
 
 APP_LOGGER_NAME = "WT_Voice_Manager"
 
 _ui_callback: Callable[[str, logging.LogRecord], None] | None = None
-_ui_emit_guard = threading.local()
+# 防递归守卫：ContextVar 的 get 是 C 层查找，且在 asyncio 任务间也能正确隔离
+_ui_emit_guard: ContextVar[bool] = ContextVar("ui_emit_guard", default=False)
+
+# UI 处理器与监听器的模组级引用：set_ui_callback 据此按需挂载/摘除处理器
+_ui_handler: "UiCallbackHandler | None" = None
+_listener: "QueueListener | None" = None
 
 # 类型变数用于装饰器
 P = ParamSpec('P')
 T = TypeVar('T')
 
+# 模组级绑定日誌级别常量，省去热路径上的属性查找
+_DEBUG = logging.DEBUG
+_INFO = logging.INFO
+_WARNING = logging.WARNING
+_ERROR = logging.ERROR
+
 
 def set_ui_callback(callback: Callable[[str, logging.LogRecord], None] | None) -> None:
     """
     设置前端 UI 日誌回调。
 
+    回调注册/注销时同步在监听器上挂载/摘除 UI 处理器，
+    无回调（CLI、测试）时监听线程完全不迭代到它。
+
     Args:
         callback: 接收 (formatted_message: str, record: logging.LogRecord) 的回调函数。
     """
     global _ui_callback
+    previous = _ui_callback
     _ui_callback = callback
+    if _listener is None or _ui_handler is None:
+        return
+    if callback is not None and previous is None:
+        if _ui_handler not in _listener.handlers:
+            _listener.handlers = (*_listener.handlers, _ui_handler)
+    elif callback is None and previous is not None:
+        _listener.handlers = tuple(h for h in _listener.handlers if h is not _ui_handler)
+
+
+class _UiActiveFilter(logging.Filter):
+    """未注册 UI 回调时在 format 之前拒绝记录，省去无谓的格式化开销。"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # 回调内部产生的记录（入列时已打标）不再回流到 UI，避免无限递归
+        if getattr(record, "ui_suppress", False):
+            return False
+        return _ui_callback is not None
 
 
 class UiCallbackHandler(logging.Handler):
@@ -53,67 +87,286 @@ class UiCallbackHandler(logging.Handler):
             return
 
         # 防止递归调用
-        if getattr(_ui_emit_guard, "active", False):
+        if _ui_emit_guard.get():
             return
 
+        token = _ui_emit_guard.set(True)
         try:
-            _ui_emit_guard.active = True
             callback(self.format(record), record)
         except Exception:
             # 日誌链路不应影响业务逻辑
             pass
         finally:
-            _ui_emit_guard.active = False
+            _ui_emit_guard.reset(token)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    缓存同一秒内 asctime 的渲染结果：突发日誌时 N 次 strftime/localtime
+    合併为 1 次。格式化只发生在 QueueListener 线程内，无需加锁。
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._last_sec: int | None = None
+        self._last_str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = super().formatTime(record, datefmt)
+            self._last_sec = sec
+        return self._last_str
+
+
+# 模组级格式化器：格式字串只在导入时编译一次，setup_logger 直接复用
+# 文件使用详细格式，控制台/UI 依次精简
+_FILE_FMT = CachedTimeFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(opctx)s%(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+# 非 DEBUG 模式的文件格式：不含 %(filename)s:%(lineno)d，
+# 配合 logging._srcfile = None 可整个跳过 findCaller 的栈回溯
+_FILE_FMT_FAST = CachedTimeFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(opctx)s%(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_CONSOLE_FMT = CachedTimeFormatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(opctx)s%(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_UI_FMT = CachedTimeFormatter(
+    '[%(asctime)s] [%(levelname)s] %(opctx)s%(message)s',
+    datefmt='%H:%M:%S'
+)
+
+
+class BatchedRotatingFileHandler(logging.Handler):
+    """
+    批量 + 裸 fd 写入的轮转文件处理器：记录先在内存中累积，
+    凑满阈值或后台线程定时唤醒时才合併成一次 os.write()，
+    绕过 TextIOWrapper/BufferedWriter 的编码栈与内部锁；
+    轮转经 fstat 计数 + rename 手动完成。
+    """
+
+    terminator = "\n"
+
+    def __init__(self, filename: Path | str, maxBytes: int = 0, backupCount: int = 0,
+                 encoding: str = 'utf-8', flush_bytes: int = 64 * 1024,
+                 flush_interval: float = 0.1):
+        super().__init__()
+        self.baseFilename = os.fspath(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.encoding = encoding
+        self._fd = os.open(self.baseFilename,
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # 本地维护文件大小计数，轮转判断无需每次 fstat
+        self._size = os.fstat(self._fd).st_size
+        self._buf: list[bytes] = []
+        self._buf_bytes = 0
+        self._flush_bytes = flush_bytes
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, args=(flush_interval,),
+            name="log-batch-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop_event.wait(interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + self.terminator).encode(self.encoding, 'replace')
+            with self.lock:
+                self._buf.append(data)
+                self._buf_bytes += len(data)
+                if self._buf_bytes >= self._flush_bytes:
+                    self._drain_locked()
+        except Exception:
+            self.handleError(record)
+
+    def _rotate_locked(self) -> None:
+        """轮转备份文件（调用方需持有 self.lock）：app.log → app.log.1 → ...。"""
+        os.close(self._fd)
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = f"{self.baseFilename}.{i}"
+                dfn = f"{self.baseFilename}.{i + 1}"
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.rename(sfn, dfn)
+            dfn = f"{self.baseFilename}.1"
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            if os.path.exists(self.baseFilename):
+                os.rename(self.baseFilename, dfn)
+        self._fd = os.open(self.baseFilename,
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size = 0
+
+    def _drain_locked(self) -> None:
+        """将缓冲内容一次性写入 fd（调用方需持有 self.lock）。"""
+        if not self._buf:
+            return
+        data = b"".join(self._buf)
+        self._buf.clear()
+        self._buf_bytes = 0
+        if self.maxBytes > 0 and self._size + len(data) >= self.maxBytes:
+            self._rotate_locked()
+        os.write(self._fd, data)
+        self._size += len(data)
+
+    def flush(self) -> None:
+        with self.lock:
+            self._drain_locked()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        try:
+            self.flush()
+            with self.lock:
+                if self._fd >= 0:
+                    os.close(self._fd)
+                    self._fd = -1
+        finally:
+            super().close()
 
 
-class ContextLogger:
+class _OpCtxDefaultFilter(logging.Filter):
+    """为不带操作上下文的记录补上空的 opctx 字段，保证 Formatter 不会因缺字段报错。"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "opctx"):
+            record.opctx = ""
+        # 守卫生效期间（即 UI 回调内部）产生的记录在入列时打标，
+        # 监听线程稍后处理时据此跳过 UI 投递（队列会越过 ContextVar 的生命周期）
+        if _ui_emit_guard.get():
+            record.ui_suppress = True
+        return True
+
+
+class ContextLogger(logging.LoggerAdapter):
     """
     带上下文的日誌记录器，用于追踪操作流程。
-    
+
+    前缀经 extra={"opctx": ...} 附加在 LogRecord 上，由 Formatter 在
+    监听线程内渲染，热路径上不做任何字串拼接。
+
     使用示例:
         with ContextLogger(log, "安装语音包", mod_name=mod_name) as ctx:
             ctx.info("开始安装...")
             # 操作代码
             ctx.info("安装完成")
     """
-    
-    def __init__(self, logger: logging.Logger, operation: str, **context: Any):
-        self._logger = logger
+
+    def __init__(self, logger: logging.Logger, operation: str,
+                 start_level: int = _DEBUG, end_level: int = _DEBUG, **context: Any):
         self._operation = operation
         self._context = context
+        # with 语句进入/正常退出时使用的日誌级别（失败固定走 error）
+        self._start_level = start_level
+        self._end_level = end_level
         self._context_str = ", ".join(f"{k}={v}" for k, v in context.items()) if context else ""
-    
-    def _format_msg(self, msg: str) -> str:
-        prefix = f"[{self._operation}]"
+        # 前缀只依赖 operation/context，提前拼好，热路径只透传
         if self._context_str:
-            prefix += f" ({self._context_str})"
-        return f"{prefix} {msg}"
-    
+            prefix = f"[{operation}] ({self._context_str}) "
+        else:
+            prefix = f"[{operation}] "
+        super().__init__(logger, {"opctx": prefix})
+        self._specialize(logger)
+
+    def _specialize(self, logger: logging.Logger) -> None:
+        """
+        按实例做部分求值：把 logger、级别与 extra 作为闭包常量捕获，
+        生成的实例属性遮蔽类方法，每次调用只剩级别比较 + 直接转发，
+        不再经过 LoggerAdapter.log/process 两层帧。
+        （闭包与 exec 代码生成效果等同，但没有每实例的编译开销。）
+        """
+        extra = self.extra
+        enabled = logger.isEnabledFor
+
+        def debug(msg: str, *args: Any, **kw: Any) -> None:
+            if enabled(_DEBUG):
+                kw.setdefault("extra", extra)
+                logger.debug(msg, *args, **kw)
+
+        def info(msg: str, *args: Any, **kw: Any) -> None:
+            if enabled(_INFO):
+                kw.setdefault("extra", extra)
+                logger.info(msg, *args, **kw)
+
+        def warning(msg: str, *args: Any, **kw: Any) -> None:
+            if enabled(_WARNING):
+                kw.setdefault("extra", extra)
+                logger.warning(msg, *args, **kw)
+
+        def error(msg: str, *args: Any, **kw: Any) -> None:
+            if enabled(_ERROR):
+                kw.setdefault("extra", extra)
+                logger.error(msg, *args, **kw)
+
+        def exception(msg: str, *args: Any, **kw: Any) -> None:
+            if enabled(_ERROR):
+                kw.setdefault("extra", extra)
+                logger.exception(msg, *args, **kw)
+
+        self.debug, self.info, self.warning = debug, info, warning
+        self.error, self.exception = error, exception
+
+    # 兼容旧调用方：logger 实例可经 ._logger 访问
+    @property
+    def _logger(self) -> logging.Logger:
+        return self.logger
+
+    def process(self, msg: Any, kwargs: dict) -> tuple[Any, dict]:
+        extra = kwargs.get("extra")
+        if extra is None:
+            kwargs["extra"] = self.extra
+        else:
+            extra.setdefault("opctx", self.extra["opctx"])
+        return msg, kwargs
+
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.debug(self._format_msg(msg), *args, **kwargs)
-    
+        # 级别未启用时直接返回，不走 process/LogRecord 构造
+        if not self.logger.isEnabledFor(_DEBUG):
+            return
+        super().debug(msg, *args, **kwargs)
+
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.info(self._format_msg(msg), *args, **kwargs)
-    
+        if not self.logger.isEnabledFor(_INFO):
+            return
+        super().info(msg, *args, **kwargs)
+
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.warning(self._format_msg(msg), *args, **kwargs)
-    
+        if not self.logger.isEnabledFor(_WARNING):
+            return
+        super().warning(msg, *args, **kwargs)
+
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
-        self._logger.error(self._format_msg(msg), *args, **kwargs)
-    
+        if not self.logger.isEnabledFor(_ERROR):
+            return
+        super().error(msg, *args, **kwargs)
+
     def exception(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """记录错误并自动包含异常堆栈。"""
-        self._logger.exception(self._format_msg(msg), *args, **kwargs)
+        if not self.logger.isEnabledFor(_ERROR):
+            return
+        super().exception(msg, *args, **kwargs)
     
     def __enter__(self) -> "ContextLogger":
-        self.debug("操作开始")
+        self.log(self._start_level, "操作开始")
         return self
-    
+
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
         if exc_type is not None:
-            self.error(f"操作失败: {exc_type.__name__}: {exc_val}")
+            self.error("操作失败: %s: %s", exc_type.__name__, exc_val,
+                       exc_info=(exc_type, exc_val, exc_tb))
         else:
-            self.debug("操作完成")
+            self.log(self._end_level, "操作完成")
         return False  # 不抑制异常
 
 
@@ -132,16 +385,17 @@ def log_exceptions(logger: logging.Logger | None = None, reraise: bool = True, d
             ...
     """
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        # 装饰时就解析好 logger，wrapper 每次调用不再走 None 分支
+        resolved = logger if logger is not None else get_logger(func.__module__)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            nonlocal logger
-            if logger is None:
-                logger = get_logger(func.__module__)
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logger.error(
-                    f"函数 {func.__name__} 执行失败: {type(e).__name__}: {e}",
+                resolved.error(
+                    "函数 %s 执行失败: %s: %s",
+                    func.__name__, e.__class__.__name__, e,
                     exc_info=True
                 )
                 if reraise:
@@ -151,28 +405,23 @@ def log_exceptions(logger: logging.Logger | None = None, reraise: bool = True, d
     return decorator
 
 
-@contextmanager
-def log_operation(logger: logging.Logger, operation: str, **context: Any):
+def log_operation(logger: logging.Logger, operation: str, **context: Any) -> ContextLogger:
     """
-    上下文管理器：记录操作的开始、结束或失败。
-    
+    记录操作开始/结束/失败的上下文管理器（INFO 级别）。
+
+    直接返回配置好级别的 ContextLogger，不再经过生成器帧；
+    失败时 __exit__ 会以 error + 堆栈记录。
+
     Args:
         logger: 日誌记录器
         operation: 操作名称
         **context: 额外上下文信息
-    
+
     使用示例:
         with log_operation(log, "导入语音包", filename=zip_name):
             # 操作代码
     """
-    ctx = ContextLogger(logger, operation, **context)
-    try:
-        ctx.info("开始执行")
-        yield ctx
-        ctx.info("执行成功")
-    except Exception as e:
-        ctx.error(f"执行失败: {type(e).__name__}: {e}")
-        raise
+    return ContextLogger(logger, operation, start_level=_INFO, end_level=_INFO, **context)
 
 
 def format_exception(e: Exception, include_traceback: bool = False) -> str:
@@ -186,15 +435,25 @@ def format_exception(e: Exception, include_traceback: bool = False) -> str:
     Returns:
         格式化后的错误讯息
     """
-    msg = f"{type(e).__name__}: {e}"
+    # __class__ 属性取值比 type() 内建调用更便宜
+    msg = "%s: %s" % (e.__class__.__name__, e)
     if include_traceback:
+        # 延后导入：仅在需要堆栈时才载入 traceback
+        import traceback
         tb = traceback.format_exc()
         msg += f"\n{tb}"
     return msg
 
 
+# 日誌目录缓存：解析一次后复用，后续调用不再走 sys.modules 查找与 mkdir 系统调用
+_LOG_DIR: Path | None = None
+
+
 def _get_log_dir() -> Path:
-    """获取日誌存储目录，确保目录存在。"""
+    """获取日誌存储目录，确保目录存在（模组级缓存）。"""
+    global _LOG_DIR
+    if _LOG_DIR is not None:
+        return _LOG_DIR
     from utils.utils import get_docs_data_dir
     base_dir = get_docs_data_dir()
     log_dir = base_dir / "logs"
@@ -209,6 +468,7 @@ def _get_log_dir() -> Path:
         except Exception:
             pass
         sys.stderr.write(f"无法创建日誌目录，使用临时目录: {log_dir} (原因: {e})\n")
+    _LOG_DIR = log_dir
     return log_dir
 
 
@@ -228,73 +488,91 @@ def setup_logger(name: str = APP_LOGGER_NAME) -> logging.Logger:
     if logger.handlers:
         return logger
         
-    logger.setLevel(logging.DEBUG)
+    # WT_LOG_LEVEL=DEBUG 时才记录调试级别；默认 INFO，
+    # 此时还可关掉 findCaller 的 sys._getframe 栈回溯（见下）
+    debug_mode = os.environ.get("WT_LOG_LEVEL", "INFO").upper() == "DEBUG"
+    logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
     logger.propagate = False
-    
+
     # 使用统一的日誌目录逻辑
     log_dir = _get_log_dir()
     
-    # 日誌格式 - 文件使用详细格式
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # 控制台使用简洁格式
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-
-    # UI 使用更简洁的格式
-    ui_formatter = logging.Formatter(
-        '[%(asctime)s] [%(levelname)s] %(message)s',
-        datefmt='%H:%M:%S'
-    )
-    
-    # 1. 文件处理器 (RotatingFileHandler)
+    # 文件/控制台/UI 回调统一放到后台 QueueListener 线程，
+    # 调用方只需入列，不会阻塞在磁盘 I/O、文件轮转或 evaluate_js 上
+    io_handlers: list[logging.Handler] = []
+
+    # 1. 文件处理器（批量写入的轮转处理器）
     # 每个文件最大 10MB，最多保留 5 个备份
     try:
-        file_handler = RotatingFileHandler(
+        file_handler = BatchedRotatingFileHandler(
             log_dir / "app.log",
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5,
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(_FILE_FMT if debug_mode else _FILE_FMT_FAST)
+        io_handlers.append(file_handler)
     except Exception as e:
         sys.stderr.write(f"无法初始化文件日誌: {e}\n")
-    
+
+    # 非 DEBUG 模式下没有格式化器引用 %(filename)s/%(lineno)d，
+    # 置空 _srcfile 让 Logger._log 跳过 findCaller 的逐帧回溯
+    if not debug_mode:
+        logging._srcfile = None
+
     # 2. 控制台处理器 (StreamHandler)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(_CONSOLE_FMT)
+    io_handlers.append(console_handler)
 
-    # 3. UI 处理器（回调为空时不输出）
+    # 3. UI 处理器：只在注册了回调时才挂到监听器上（见 set_ui_callback）
+    global _ui_handler, _listener
     ui_handler = UiCallbackHandler()
     ui_handler.setLevel(logging.INFO)
-    ui_handler.setFormatter(ui_formatter)
-    logger.addHandler(ui_handler)
+    ui_handler.setFormatter(_UI_FMT)
+    # 回调未注册时在 handle 阶段就拒绝，避免 emit 内的 format 调用
+    ui_handler.addFilter(_UiActiveFilter())
+    _ui_handler = ui_handler
+    if _ui_callback is not None:
+        io_handlers.append(ui_handler)
+
+    # SimpleQueue 为 C 实现，put/get 不经过 Queue 的 Condition/deque 机制
+    log_queue: SimpleQueue = SimpleQueue()
+    listener = QueueListener(log_queue, *io_handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    _listener = listener
+    queue_handler = QueueHandler(log_queue)
+    # 入列前补上空的 opctx 默认值，普通（非 ContextLogger）记录也能套用同一套格式
+    queue_handler.addFilter(_OpCtxDefaultFilter())
+    logger.addHandler(queue_handler)
+    # 挂在 logger 上便于调试/手动 stop（atexit 已负责正常退出时的队列排空）
+    logger._listener = listener
     
     logger.info(f"日誌系统初始化完成，日誌路径: {log_dir}")
     
     return logger
 
 
+@lru_cache(maxsize=None)
+def _resolve_logger(module_name: str | None) -> logging.Logger:
+    """按模组名解析 logger（lru_cache 记忆化，重复调用零开销）。"""
+    base = setup_logger(APP_LOGGER_NAME)
+    if not module_name or module_name == APP_LOGGER_NAME:
+        return base
+    return base.getChild(str(module_name))
+
+
 def get_logger(module_name: str | None = None) -> logging.Logger:
     """
     获取模组 logger：`WT_Voice_Manager.<module_name>`
-    
+
     Args:
         module_name: 模组名称，None 则返回根记录器
-    
+
     Returns:
         Logger 实例
     """
-    base = setup_logger(APP_LOGGER_NAME)
-    if not module_name or module_name == APP_LOGGER_NAME:
-        return base
-    return base.getChild(str(module_name))
+    return _resolve_logger(module_name)
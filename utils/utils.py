@@ -4,6 +4,7 @@
 
 此模组不依赖任何其他应用模组（如 logger），以避免循环 import。
 """
+import functools
 import os
 import sys
 import platform
@@ -13,9 +14,51 @@ from logging import getLogger
 log = getLogger(__name__)
 
 
+def _windows_documents_dir() -> Path | None:
+    """
+    通过 SHGetKnownFolderPath 解析 Windows「文档」目录。
+
+    相比旧的 SHGetFolderPathW：Vista+ 推荐 API、不受 MAX_PATH 260 限制，
+    也免去 ctypes.wintypes 模组的导入开销。
+
+    Returns:
+        Path | None: 文档目录路径，解析失败返回 None
+    """
+    try:
+        import ctypes
+
+        class _GUID(ctypes.Structure):
+            _fields_ = [
+                ("Data1", ctypes.c_uint32),
+                ("Data2", ctypes.c_uint16),
+                ("Data3", ctypes.c_uint16),
+                ("Data4", ctypes.c_ubyte * 8),
+            ]
+
+        # FOLDERID_Documents = {FDD39AD0-238F-46AF-ADB4-6C85480369C7}
+        folder_id = _GUID(
+            0xFDD39AD0, 0x238F, 0x46AF,
+            (ctypes.c_ubyte * 8)(0xAD, 0xB4, 0x6C, 0x85, 0x48, 0x03, 0x69, 0xC7),
+        )
+        out = ctypes.c_wchar_p()
+        hr = ctypes.windll.shell32.SHGetKnownFolderPath(
+            ctypes.byref(folder_id), 0, None, ctypes.byref(out)
+        )
+        if hr != 0:
+            return None
+        try:
+            return Path(out.value) if out.value else None
+        finally:
+            ctypes.windll.ole32.CoTaskMemFree(out)
+    except Exception as e:
+        log.error(f"获取 Windows 文档目录时发生错误: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_docs_data_dir() -> Path:
     """
-    获取应用数据存储目录（跨平台支援）。
+    获取应用数据存储目录（跨平台支援，进程内只解析一次）。
     - Windows: ~/Documents/Aimer_WT
     - Linux: ~/.config/Aimer_WT
     - macOS: ~/Library/Application Support/Aimer_WT
@@ -27,16 +70,9 @@ def get_docs_data_dir() -> Path:
 
     if system == "Windows":
         # Windows: 用户文档目录
-        try:
-            import ctypes.wintypes
-            buf = ctypes.create_unicode_buffer(ctypes.wintypes.MAX_PATH)
-            # CSIDL_PERSONAL = 5 (My Documents), SHGFP_TYPE_CURRENT = 0
-            ctypes.windll.shell32.SHGetFolderPathW(None, 5, None, 0, buf)
-            if buf.value:
-                return Path(buf.value) / "Aimer_WT"
-        except Exception as e:
-            log.error(f"获取 Windows 文档目录时发生错误: {e}")
-            pass
+        docs = _windows_documents_dir()
+        if docs:
+            return docs / "Aimer_WT"
         # 回退到 Documents 目录
         return Path.home() / "Documents" / "Aimer_WT"
     elif system == "Darwin":
@@ -51,6 +87,56 @@ def get_docs_data_dir() -> Path:
             return Path.home() / ".config" / "Aimer_WT"
 
 
+def atomic_write_bytes(path: Path, blob: bytes) -> None:
+    """
+    将 blob 原子写入 path，落盘前 fsync，避免断电留下空文件。
+
+    Linux 3.11+ 走 O_TMPFILE：在目标目录先建匿名 inode，写入并 fsync
+    后经 /proc/self/fd 一次 link 挂入目录项，崩溃不会残留 .tmp 文件，
+    也省去一次目录项创建 + unlink。其余平台（及不支援 O_TMPFILE 的
+    文件系统）退回「临时文件 + 重命名」。
+
+    Raises:
+        OSError: 写入失败时
+    """
+    tmpfile_flag = getattr(os, "O_TMPFILE", 0)
+    if tmpfile_flag:
+        try:
+            fd = os.open(str(path.parent), tmpfile_flag | os.O_WRONLY, 0o644)
+        except OSError:
+            # 文件系统不支援 O_TMPFILE（NFS、旧内核等），退回通用路径
+            fd = -1
+        if fd >= 0:
+            try:
+                os.write(fd, blob)
+                os.fsync(fd)
+                fd_path = f"/proc/self/fd/{fd}"
+                try:
+                    try:
+                        # 目标尚不存在时可直接 link，全程不出现中间名
+                        os.link(fd_path, path)
+                    except FileExistsError:
+                        # linkat 不能覆盖既有文件：先挂到临时名再原子替换
+                        tmp = path.with_suffix(".tmp")
+                        tmp.unlink(missing_ok=True)
+                        os.link(fd_path, tmp)
+                        os.replace(tmp, path)
+                    return
+                except OSError:
+                    # 个别文件系统（overlayfs、部分容器环境）拒绝经
+                    # /proc 魔法链接 linkat（EXDEV），退回通用路径重写
+                    pass
+            finally:
+                os.close(fd)
+
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 def get_app_data_dir() -> Path:
     """
     獲取程式目前的路徑
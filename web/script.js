@@ -194,6 +194,11 @@ const app = {
         document.querySelectorAll('.page').forEach(p => p.classList.remove('active'));
         document.getElementById(`page-${tabId}`).classList.add('active');
 
+        // 回报后端当前活动页，拖放处理无需再反查 DOM
+        if (window.pywebview?.api?.notify_active_page) {
+            pywebview.api.notify_active_page(`page-${tabId}`);
+        }
+
         if (tabId === 'camo') {
             setTimeout(() => {
                 const camoPage = document.getElementById('page-camo');
@@ -313,7 +318,7 @@ const app = {
                 const safeName = app._escapeHtml(it.name);
 
                 return `
-                    <div class="small-card animate-in" title="${app._escapeHtml(it.path || '')}" data-skin-name="${safeName}">
+                    <div class="small-card animate-in" title="${app._escapeHtml(it.path || '')}" data-skin-name="${safeName}"${it.cover_url ? '' : ' data-lazy-cover="1"'}>
                         <div class="small-card-img-wrapper" style="position:relative;">
                              <img class="small-card-img${isDefaultCover ? ' is-default-cover' : ''} skin-img-node" 
                                   src="${cover}" loading="lazy" alt="">
@@ -335,6 +340,17 @@ const app = {
             }).join('');
 
             listEl.insertAdjacentHTML('beforeend', html);
+
+            // 无 cover_url 的卡片（封面服务不可用）滚入视口才取封面
+            const lazyCards = listEl.querySelectorAll('.small-card[data-lazy-cover]');
+            if (lazyCards.length) {
+                const obs = app._ensureCoverObserver();
+                lazyCards.forEach(card => {
+                    card.removeAttribute('data-lazy-cover');
+                    obs.observe(card);
+                });
+            }
+
             currentIndex += CHUNK_SIZE;
 
             if (currentIndex < items.length) {
@@ -352,6 +368,26 @@ const app = {
         renderChunk();
     },
 
+    // 懒加载封面：卡片可见时才向后端请求 base64 编码
+    _coverObserver: null,
+    _ensureCoverObserver() {
+        if (this._coverObserver) return this._coverObserver;
+        this._coverObserver = new IntersectionObserver((entries) => {
+            for (const en of entries) {
+                if (!en.isIntersecting) continue;
+                const card = en.target;
+                this._coverObserver.unobserve(card);
+                const name = card.dataset.skinName;
+                pywebview.api.get_skin_cover(name).then(url => {
+                    if (!url) return;
+                    const img = card.querySelector('.skin-img-node');
+                    if (img) img.src = url;
+                }).catch(() => {});
+            }
+        });
+        return this._coverObserver;
+    },
+
     // 接收后端异步推送的封面数据
     onSkinCoverReady(skinName, coverUrl) {
         const card = document.querySelector(`.small-card[data-skin-name="${CSS.escape(skinName)}"]`);
@@ -1494,6 +1530,41 @@ const app = {
         container.scrollTop = container.scrollHeight; // 自动滚动到底部
     },
 
+    // 批量追加：后端凑批推送，减少 JS 桥接往返次数
+    appendLogBatch(msgs) {
+        (msgs || []).forEach(m => this.appendLog(m));
+    },
+
+    notifyToastBatch(items) {
+        (items || []).forEach(([level, message]) => this.notifyToast(level, message));
+    },
+
+    // --- 搜索转圈动画（完全由前端驱动，搜索期间后端零桥接调用） ---
+    _searchSpinnerTimer: null,
+
+    startSearchSpinner() {
+        this.stopSearchSpinner();
+        const frames = ['|', '/', '—', '\\'];
+        let tick = 0;
+        this._searchSpinnerTimer = setInterval(() => {
+            const char = frames[tick % frames.length];
+            tick++;
+            this.updateSearchLog(`[扫描] 正在检索存储设备... [${char}]`);
+        }, 150);
+    },
+
+    stopSearchSpinner(found) {
+        if (this._searchSpinnerTimer) {
+            clearInterval(this._searchSpinnerTimer);
+            this._searchSpinnerTimer = null;
+        }
+        if (found === true) {
+            this.updateSearchLog('[扫描] 正在检索存储设备... [OK] 100%');
+        } else if (found === false) {
+            this.updateSearchLog('[扫描] 扫描结束，未发现游戏客户端。');
+        }
+    },
+
     updateSearchLog(msg) {
         // 更新最后一行而不是追加
         const container = document.getElementById('log-container');
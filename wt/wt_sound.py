@@ -1,82 +1,190 @@
 from enum import Enum
+from types import MappingProxyType
 
 
-class Country(Enum):
-    # AI翻译，不知道准不准
-    EN_AU = ("en_au", "澳大利亚")
-    EN_US = ("en_us", "美国")
-    EN_ZA = ("en_za", "南非")
-    ZHHX = ("zhhx", "")  # 语音包里找到的，不知道是哪个国家
-    LT = ("lt", "立陶宛")
-    CZ = ("cz", "捷克")
-    DE = ("de", "德国")
-    EN = ("en", "英国")
-    FR = ("fr", "法国")
-    HU = ("hu", "匈牙利")
-    IT = ("it", "意大利")
-    JP = ("jp", "日本")
-    KO = ("ko", "韩国")
-    PL = ("pl", "波兰")
-    PT = ("pt", "葡萄牙")
-    RU = ("ru", "俄罗斯")
-    SP = ("sp", "西班牙")
-    SR = ("sr", "塞尔维亚")
-    TH = ("th", "泰国")
-    TR = ("tr", "土耳其")
-    VI = ("vi", "越南")
-    ZH = ("zh", "中国")
-    AR = ("ar", "阿拉伯")
-    FI = ("fi", "芬兰")
-    GL = ("gl", "加利西亚")
-    HE = ("he", "希伯来")
-    HI = ("hi", "印地")
-    NL = ("nl", "荷兰")
-    NW = ("nw", "尼泊尔")
-    SV = ("sv", "瑞典")
-
-    def __init__(self, code, chinese_name):
-        self.code = code
-        self.chinese_name = chinese_name
-
-
-class VoiceType(Enum):
-    # (code, chinese_name, tag)
-    # tag: 前端显示的简化标签
-    MASTERBANK = ("masterbank", "主音库", "降噪包")
-    DIALOGS_CHAT = ("dialogs_chat", "无线电对话", "无线电对话")
-    EVENT = ("event", "事件", None)
-
-    CREW_DIALOGS_COMMON = ("crew_dialogs_common", "乘员通用语音", "无线电")
-    CREW_DIALOGS_GROUND = ("crew_dialogs_ground", "地面单位语音", "陆战语音")
-    CREW_DIALOGS_NAVAL = ("crew_dialogs_naval", "水面单位语音", "海战语音")
-
-    TANK_AMBIENT = ("tank_ambient", "坦克环境音", "陆战环境音")
-    TANK_EFFECTS = ("tank_effects", "坦克效果音", "陆战效果音")
-    TANK_EFFECTS_RADIO = ("tank_effects_radio", "坦克无线电音效", "陆战无线电音效")
-    TANK_ENGINES = ("tank_engines", "坦克引擎音效", "陆战引擎音效")
-    TANK_EXPLOSIONS = ("tank_explosions", "坦克摧毁音效", "陆战摧毁音效")
-    TANK_OBJECT_CRASH = ("tank_object_crash", "坦克撞击音效", "陆战撞击音效")
-    TANK_WEAPONS = ("tank_weapons", "坦克武器音效", "陆战武器音效")
-
-    AIRCRAFT_AMBIENT = ("aircraft_ambient", "空中单位环境音", "空战环境音")
-    AIRCRAFT_COMMON = ("aircraft_common", "空中单位通用音效", "空战通用音")
-    AIRCRAFT_EFFECT = ("aircraft_effect", "空中单位效果音", "空战效果音")
-    AIRCRAFT_ENGINE = ("aircraft_engine", "空中单位引擎音效", "空战引擎音效")
-    AIRCRAFT_GUI = ("aircraft_gui", "空中单位GUI音效", "座舱音效")
-    AIRCRAFT_GUNS = ("aircraft_guns", "空中单位武器音效", "空战武器音效")
-    AIRCRAFT_MUSIC = ("aircraft_music", "空中单位音乐", "空战音乐")
-
-    SHIPS_AMBIENT = ("ships_ambient", "海战环境音", "海战环境音")
-    SHIPS_EFFECTS = ("ships_effects", "海战效果音", "海战效果音")
-    SHIPS_ENGINES = ("ships_engines", "海战引擎音效", "海战引擎音效")
-    SHIPS_EXPLOSIONS = ("ships_explosions", "海战摧毁音效", "海战摧毁音效")
-    SHIPS_WEAPONS = ("ships_weapons", "海战武器音效", "海战武器音效")
-
-    INFANTRY = ("infantry_voices", "步兵", "步兵")
-    INFANTRY_AMBIENT = ("infantry_ambient", "步兵环境音", "步兵环境音")
-    INFANTRY_EFFECT = ("infantry_effect", "步兵效果音", "步兵效果音")
-
-    def __init__(self, code, chinese_name, tag):
-        self.code = code
-        self.chinese_name = chinese_name
-        self.tag = tag
+class Country(str, Enum):
+    """国家/语言代码枚举。
+
+    str 混入让成员值即 code 字符串：Country("jp") 走 Enum 原生的
+    _value2member_map_ 查找，无需逐成员比对 .code 属性。
+    """
+    EN_AU = "en_au"
+    EN_US = "en_us"
+    EN_ZA = "en_za"
+    ZHHX = "zhhx"
+    LT = "lt"
+    CZ = "cz"
+    DE = "de"
+    EN = "en"
+    FR = "fr"
+    HU = "hu"
+    IT = "it"
+    JP = "jp"
+    KO = "ko"
+    PL = "pl"
+    PT = "pt"
+    RU = "ru"
+    SP = "sp"
+    SR = "sr"
+    TH = "th"
+    TR = "tr"
+    VI = "vi"
+    ZH = "zh"
+    AR = "ar"
+    FI = "fi"
+    GL = "gl"
+    HE = "he"
+    HI = "hi"
+    NL = "nl"
+    NW = "nw"
+    SV = "sv"
+
+    @property
+    def code(self):
+        return self.value
+
+    @property
+    def chinese_name(self):
+        return _COUNTRY_NAMES[self]
+
+    @classmethod
+    def from_code(cls, code):
+        """按 code 常数时间取成员，找不到返回 None。"""
+        return cls._value2member_map_.get(code)
+
+
+# AI翻译，不知道准不准
+_COUNTRY_NAMES = MappingProxyType({
+    Country.EN_AU: "澳大利亚",
+    Country.EN_US: "美国",
+    Country.EN_ZA: "南非",
+    Country.ZHHX: "",  # 语音包里找到的，不知道是哪个国家
+    Country.LT: "立陶宛",
+    Country.CZ: "捷克",
+    Country.DE: "德国",
+    Country.EN: "英国",
+    Country.FR: "法国",
+    Country.HU: "匈牙利",
+    Country.IT: "意大利",
+    Country.JP: "日本",
+    Country.KO: "韩国",
+    Country.PL: "波兰",
+    Country.PT: "葡萄牙",
+    Country.RU: "俄罗斯",
+    Country.SP: "西班牙",
+    Country.SR: "塞尔维亚",
+    Country.TH: "泰国",
+    Country.TR: "土耳其",
+    Country.VI: "越南",
+    Country.ZH: "中国",
+    Country.AR: "阿拉伯",
+    Country.FI: "芬兰",
+    Country.GL: "加利西亚",
+    Country.HE: "希伯来",
+    Country.HI: "印地",
+    Country.NL: "荷兰",
+    Country.NW: "尼泊尔",
+    Country.SV: "瑞典",
+})
+
+
+class VoiceType(str, Enum):
+    """语音包类型枚举，成员值即 code 字符串。"""
+    MASTERBANK = "masterbank"
+    DIALOGS_CHAT = "dialogs_chat"
+    EVENT = "event"
+
+    CREW_DIALOGS_COMMON = "crew_dialogs_common"
+    CREW_DIALOGS_GROUND = "crew_dialogs_ground"
+    CREW_DIALOGS_NAVAL = "crew_dialogs_naval"
+
+    TANK_AMBIENT = "tank_ambient"
+    TANK_EFFECTS = "tank_effects"
+    TANK_EFFECTS_RADIO = "tank_effects_radio"
+    TANK_ENGINES = "tank_engines"
+    TANK_EXPLOSIONS = "tank_explosions"
+    TANK_OBJECT_CRASH = "tank_object_crash"
+    TANK_WEAPONS = "tank_weapons"
+
+    AIRCRAFT_AMBIENT = "aircraft_ambient"
+    AIRCRAFT_COMMON = "aircraft_common"
+    AIRCRAFT_EFFECT = "aircraft_effect"
+    AIRCRAFT_ENGINE = "aircraft_engine"
+    AIRCRAFT_GUI = "aircraft_gui"
+    AIRCRAFT_GUNS = "aircraft_guns"
+    AIRCRAFT_MUSIC = "aircraft_music"
+
+    SHIPS_AMBIENT = "ships_ambient"
+    SHIPS_EFFECTS = "ships_effects"
+    SHIPS_ENGINES = "ships_engines"
+    SHIPS_EXPLOSIONS = "ships_explosions"
+    SHIPS_WEAPONS = "ships_weapons"
+
+    INFANTRY = "infantry_voices"
+    INFANTRY_AMBIENT = "infantry_ambient"
+    INFANTRY_EFFECT = "infantry_effect"
+
+    @property
+    def code(self):
+        return self.value
+
+    @property
+    def chinese_name(self):
+        return _VOICE_META[self][0]
+
+    @property
+    def tag(self):
+        """前端显示的简化标签，不参与匹配的类型为 None。"""
+        return _VOICE_META[self][1]
+
+    @classmethod
+    def from_code(cls, code):
+        """按 code 常数时间取成员，找不到返回 None。"""
+        return cls._value2member_map_.get(code)
+
+    @classmethod
+    def from_tag(cls, tag):
+        """按前端标签常数时间取成员（tag 为 None 的成员不收录）。"""
+        return _VOICE_BY_TAG.get(tag)
+
+
+# 成员 -> (chinese_name, tag)
+_VOICE_META = MappingProxyType({
+    VoiceType.MASTERBANK: ("主音库", "降噪包"),
+    VoiceType.DIALOGS_CHAT: ("无线电对话", "无线电对话"),
+    VoiceType.EVENT: ("事件", None),
+
+    VoiceType.CREW_DIALOGS_COMMON: ("乘员通用语音", "无线电"),
+    VoiceType.CREW_DIALOGS_GROUND: ("地面单位语音", "陆战语音"),
+    VoiceType.CREW_DIALOGS_NAVAL: ("水面单位语音", "海战语音"),
+
+    VoiceType.TANK_AMBIENT: ("坦克环境音", "陆战环境音"),
+    VoiceType.TANK_EFFECTS: ("坦克效果音", "陆战效果音"),
+    VoiceType.TANK_EFFECTS_RADIO: ("坦克无线电音效", "陆战无线电音效"),
+    VoiceType.TANK_ENGINES: ("坦克引擎音效", "陆战引擎音效"),
+    VoiceType.TANK_EXPLOSIONS: ("坦克摧毁音效", "陆战摧毁音效"),
+    VoiceType.TANK_OBJECT_CRASH: ("坦克撞击音效", "陆战撞击音效"),
+    VoiceType.TANK_WEAPONS: ("坦克武器音效", "陆战武器音效"),
+
+    VoiceType.AIRCRAFT_AMBIENT: ("空中单位环境音", "空战环境音"),
+    VoiceType.AIRCRAFT_COMMON: ("空中单位通用音效", "空战通用音"),
+    VoiceType.AIRCRAFT_EFFECT: ("空中单位效果音", "空战效果音"),
+    VoiceType.AIRCRAFT_ENGINE: ("空中单位引擎音效", "空战引擎音效"),
+    VoiceType.AIRCRAFT_GUI: ("空中单位GUI音效", "座舱音效"),
+    VoiceType.AIRCRAFT_GUNS: ("空中单位武器音效", "空战武器音效"),
+    VoiceType.AIRCRAFT_MUSIC: ("空中单位音乐", "空战音乐"),
+
+    VoiceType.SHIPS_AMBIENT: ("海战环境音", "海战环境音"),
+    VoiceType.SHIPS_EFFECTS: ("海战效果音", "海战效果音"),
+    VoiceType.SHIPS_ENGINES: ("海战引擎音效", "海战引擎音效"),
+    VoiceType.SHIPS_EXPLOSIONS: ("海战摧毁音效", "海战摧毁音效"),
+    VoiceType.SHIPS_WEAPONS: ("海战武器音效", "海战武器音效"),
+
+    VoiceType.INFANTRY: ("步兵", "步兵"),
+    VoiceType.INFANTRY_AMBIENT: ("步兵环境音", "步兵环境音"),
+    VoiceType.INFANTRY_EFFECT: ("步兵效果音", "步兵效果音"),
+})
+
+_VOICE_BY_TAG = MappingProxyType(
+    {meta[1]: m for m, meta in _VOICE_META.items() if meta[1] is not None}
+)